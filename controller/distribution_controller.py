@@ -32,16 +32,24 @@ class DistributionController:
         except Exception as e:
             return {"success": False, "error": str(e)}
             
-    def monte_carlo_integration(self, expression, a, b, n_points=10000, algorithm="mersenne", seed=None, **kwargs):
-        """Realiza la integración numérica por Monte Carlo."""
+    def monte_carlo_integration(self, expression, a=None, b=None, n_points=10000, algorithm="mersenne", seed=None,
+                                bounds=None, region=None, **kwargs):
+        """Realiza la integración numérica por Monte Carlo.
+
+        Para integrales dobles o triples en x, y, z se indican bounds = [(x0, x1), (y0, y1), ...] en lugar
+        de a y b, y opcionalmente una región dada por desigualdades (p. ej. "x^2 + y^2 <= 1").
+        """
         try:
             if not expression:
                 raise ValueError("La expresión no puede estar vacía.")
                 
             try:
-                a = float(a)
-                b = float(b)
-            except ValueError:
+                if bounds is not None:
+                    bounds = [(float(lower), float(upper)) for lower, upper in bounds]
+                else:
+                    a = float(a)
+                    b = float(b)
+            except (TypeError, ValueError):
                 raise ValueError("Los límites de integración deben ser números.")
                 
             try:
@@ -50,6 +58,13 @@ class DistributionController:
                     raise ValueError("El número de puntos debe ser positivo.")
             except ValueError:
                 raise ValueError("El número de puntos debe ser un entero positivo.")
+
+            if bounds is not None:
+                dimension = len(bounds)
+                parsed_expr = self.parser.parse_multivariable_expression(expression, dimension)
+                parsed_region = self.parser.parse_region(region, dimension) if region else None
+                result = self.manager.calculate_monte_carlo_integration_nd(parsed_expr, bounds, n_points, algorithm, seed, parsed_region, **kwargs)
+                return {"success": True, **result}
                 
             parsed_expr = self.parser.parse_expression(expression)
             result = self.manager.calculate_monte_carlo_integration(parsed_expr, a, b, n_points, algorithm, seed, **kwargs)
@@ -61,8 +76,12 @@ class DistributionController:
 
     def simulate_markov_epidemic(self, population=1000, initial_infected=1, initial_recovered=0, 
                            beta=0.3, gamma=0.1, days=30, dt=0.1, algorithm="mersenne", 
-                           seed=None, **kwargs):
-        """Controla la simulación de una epidemia usando el modelo de Markov."""
+                           seed=None, replicates=1, method="gamma", **kwargs):
+        """Controla la simulación de una epidemia usando el modelo de Markov.
+
+        Con replicates > 1 se simula un conjunto de trayectorias y se devuelven sus bandas de cuantiles.
+        method elige la regla por pasos original ("gamma"), Gillespie exacto ("ssa"), "tau_leaping", "auto" o el motor compartimental ("ode", "binomial_chain").
+        """
         try:
             try:
                 population = int(population)
@@ -95,6 +114,10 @@ class DistributionController:
                 dt = float(dt)
                 if dt <= 0:
                     raise ValueError("El intervalo de tiempo debe ser positivo.")
+
+                replicates = int(replicates)
+                if replicates <= 0:
+                    raise ValueError("El número de réplicas debe ser positivo.")
             except ValueError as e:
                 if "could not convert" in str(e):
                     raise ValueError("Todos los parámetros deben ser numéricos.")
@@ -110,7 +133,9 @@ class DistributionController:
                 'days': days,
                 'dt': dt,
                 'algorithm': algorithm,  # Añadir algoritmo
-                'seed': seed  # Añadir semilla
+                'seed': seed,  # Añadir semilla
+                'replicates': replicates,
+                'method': method
             }
             
             # Llamar al método del manager y obtener resultado con canvas
@@ -123,6 +148,7 @@ class DistributionController:
                 'infected': result['infected'],
                 'recovered': result['recovered'],
                 'parameters': result['parameters'],
+                'ensemble': result.get('ensemble'),
                 'canvas': result['canvas']
             }
             
@@ -154,7 +180,8 @@ class DistributionController:
                 "original": result["original"],
                 "transformed": result["transformed"],
                 "distribution": result["distribution"],
-                "parameters": result["parameters"]
+                "parameters": result["parameters"],
+                "summary": result["summary"]
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
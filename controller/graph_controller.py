@@ -38,6 +38,6 @@ class GraphController:
         """Fachada para generar gráficos comparativos de métodos numéricos"""
         return self.plot_ode.generate_comparison_canvas(equation=equation,solutions=solutions,initial_condition=initial_condition,x_range=x_range,h=h)
     
-    def create_epidemic_plot(self, times, susceptible, infected, recovered, params):
+    def create_epidemic_plot(self, times, susceptible, infected, recovered, params, ensemble=None):
         """Fachada para crear un gráfico de epidemia"""
-        return self.plot_distribution.create_epidemic_plot(times=times,susceptible=susceptible,infected=infected,recovered=recovered,params=params)
\ No newline at end of file
+        return self.plot_distribution.create_epidemic_plot(times=times,susceptible=susceptible,infected=infected,recovered=recovered,params=params,ensemble=ensemble)
\ No newline at end of file
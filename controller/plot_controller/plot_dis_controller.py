@@ -6,8 +6,11 @@ class PlotDistributionController:
         self.figure_manager = figure_manager
         self.style_helper = style_helper
 
-    def create_epidemic_plot(self, times, susceptible, infected, recovered, params):
-        """Crea un gráfico personalizado para la simulación de epidemias."""
+    def create_epidemic_plot(self, times, susceptible, infected, recovered, params, ensemble=None):
+        """Crea un gráfico personalizado para la simulación de epidemias.
+
+        Con un conjunto de réplicas (ensemble) se dibujan además las bandas de cuantiles como regiones sombreadas.
+        """
         try:
             # Crear un nuevo canvas
             canvas = self.figure_manager.create_canvas(figsize=(10, 6))
@@ -16,15 +19,29 @@ class PlotDistributionController:
             # Aplicar estilo oscuro
             self.style_helper.apply_dark_style(canvas, ax)
             
+            colors = {
+                'susceptible': self.style_helper.get_plot_color(0),
+                'infected': self.style_helper.get_plot_color(1),
+                'recovered': '#1E90FF'
+            }
+
+            # Bandas de cuantiles de las réplicas
+            if ensemble:
+                for name, color in colors.items():
+                    bands = ensemble[name]
+                    ax.fill_between(times, bands['lower'], bands['upper'], color=color, alpha=0.2, linewidth=0)
+                low, high = (int(q * 100) for q in ensemble['infected']['quantiles'])
+                ax.fill_between([], [], [], color='gray', alpha=0.3, label=f'Banda {low}–{high}% ({ensemble["replicates"]} réplicas)')
+
             # Graficar las tres curvas
             ax.plot(times, susceptible, 
-                   color=self.style_helper.get_plot_color(0),
+                   color=colors['susceptible'],
                    label='Susceptibles', linewidth=2)
             ax.plot(times, infected, 
-                   color=self.style_helper.get_plot_color(1),
+                   color=colors['infected'],
                    label='Infectados', linewidth=2)
             ax.plot(times, recovered, 
-                   color='#1E90FF',
+                   color=colors['recovered'],
                    label='Recuperados', linewidth=2)
 
             # Encontrar y marcar el pico de infectados
@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QApplication
 from utils.core.shortcuts import ShortcutManager
 from utils.core.style_manager import StyleManager
 from utils.core.font_manager import FontFamily, FontVariant
+import multiprocessing
 import sys
 
 def setup_fonts():
@@ -49,4 +50,5 @@ def main():
     return sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Necesario para los procesos de trabajo en el ejecutable empaquetado
     main()
@@ -0,0 +1,193 @@
+from math import exp, log1p
+import numpy as np
+from sympy import Matrix, symbols, sympify, lambdify
+from model._dis_transform import BINOMIAL_BTPE_THRESHOLD, DistributionTransformer, UniformStream
+
+INTEGRATORS = ("deterministic", "binomial_chain")
+
+class CompartmentalModel:
+    """Modelo compartimental declarado como compartimentos más transiciones con tasa por individuo.
+
+    Cada transición es (origen, destino, tasa), donde tasa es una expresión (texto o SymPy) en los
+    compartimentos, los parámetros y la población total N; por ejemplo ("S", "I", "beta * I / N").
+    Las tasas y las ecuaciones diferenciales se compilan una sola vez con lambdify en funciones escalares.
+    """
+
+    def __init__(self, name, compartments, transitions, default_params=None):
+        self.name = name
+        self.compartments = tuple(compartments)
+        index = {compartment: i for i, compartment in enumerate(self.compartments)}
+        unknown = {c for source, target, _ in transitions for c in (source, target)} - set(index)
+        if unknown:
+            raise ValueError(f"Compartimentos no declarados: {', '.join(sorted(unknown))}")
+        self.default_params = dict(default_params or {})
+        self.sources = [index[source] for source, _, _ in transitions]
+        self.targets = [index[target] for _, target, _ in transitions]
+        self.parameters = tuple(self.default_params)
+
+        state = symbols(self.compartments)
+        params = symbols(self.parameters) if self.parameters else ()
+        population = symbols("N")
+        allowed = {str(s) for s in (*state, *params, population)}
+        rates = [sympify(rate, locals={str(s): s for s in (*state, *params, population)}) for _, _, rate in transitions]
+        for rate in rates:
+            extra = {str(s) for s in rate.free_symbols} - allowed
+            if extra:
+                raise ValueError(f"Símbolos no declarados en las tasas: {', '.join(sorted(extra))}")
+
+        # Matriz estequiométrica (compartimentos x transiciones): -1 en el origen y +1 en el destino
+        self.stoichiometry = np.zeros((len(self.compartments), len(transitions)))
+        self.stoichiometry[self.sources, np.arange(len(transitions))] -= 1
+        self.stoichiometry[self.targets, np.arange(len(transitions))] += 1
+
+        flows = Matrix([rate * state[source] for rate, source in zip(rates, self.sources)])
+        arguments = [state, params, population]
+        self._rates = lambdify(arguments, rates, "math", cse=True)
+        self._derivative = lambdify(arguments, list(Matrix(self.stoichiometry.astype(int)) * flows), "math", cse=True)
+        # Transiciones de cada compartimento de origen, en orden de declaración
+        self._by_source = {}
+        for t, source in enumerate(self.sources):
+            self._by_source.setdefault(source, []).append(t)
+
+    def index(self, compartment):
+        return self.compartments.index(compartment)
+
+    def _parameter_values(self, params):
+        missing = [name for name in self.parameters if name not in params]
+        if missing:
+            raise ValueError(f"Faltan parámetros del modelo: {', '.join(missing)}")
+        return tuple(float(params[name]) for name in self.parameters)
+
+    def derivative(self, y, params, population):
+        """dy/dt: cada transición resta su flujo del origen y lo suma al destino."""
+        return np.array(self._derivative(tuple(y), self._parameter_values({**self.default_params, **params}), population))
+
+    def _initial_state(self, initial):
+        y0 = [0.0] * len(self.compartments)
+        for compartment, value in initial.items():
+            y0[self.index(compartment)] = value
+        return y0
+
+    def simulate(self, initial, params=None, days=30, dt=0.1, integrator="deterministic", uniform_source=None):
+        """Integra el modelo sobre una rejilla de paso dt y devuelve (tiempos, estados con forma (pasos + 1, k)).
+
+        initial es un diccionario {compartimento: individuos}. "deterministic" usa Runge-Kutta de orden 4
+        sobre las ecuaciones diferenciales; "binomial_chain" es la cadena binomial estocástica, que necesita
+        uniform_source(n) para obtener los uniformes.
+        """
+        values = self._parameter_values({**self.default_params, **(params or {})})
+        steps = int(days / dt)
+        times = np.arange(steps + 1) * dt
+        y0 = self._initial_state(initial)
+        population = float(sum(y0))
+        if integrator == "deterministic":
+            states = self._runge_kutta(y0, values, population, steps, dt)
+        elif integrator == "binomial_chain":
+            if uniform_source is None:
+                raise ValueError("La cadena binomial necesita una fuente de números uniformes")
+            states = self._binomial_chain([int(v) for v in y0], values, population, steps, dt, UniformStream(uniform_source))
+        else:
+            raise ValueError(f"Integrador no soportado: {integrator}. Debe ser uno de: {', '.join(INTEGRATORS)}")
+        return times, states
+
+    def _runge_kutta(self, y0, values, population, steps, dt):
+        states = np.empty((steps + 1, len(y0)), dtype=np.float64)
+        states[0] = y0
+        derivative = self._derivative
+        half = 0.5 * dt
+        sixth = dt / 6
+        y = y0
+        for step in range(steps):
+            k1 = derivative(y, values, population)
+            k2 = derivative([a + half * b for a, b in zip(y, k1)], values, population)
+            k3 = derivative([a + half * b for a, b in zip(y, k2)], values, population)
+            k4 = derivative([a + dt * b for a, b in zip(y, k3)], values, population)
+            y = [a + sixth * (b + 2 * c + 2 * d + e) for a, b, c, d, e in zip(y, k1, k2, k3, k4)]
+            states[step + 1] = y
+        return states
+
+    def _binomial_chain(self, y0, values, population, steps, dt, stream):
+        """Cadena binomial: de cada compartimento salen Binomial(n, 1 - exp(-h dt)) individuos, repartidos
+        entre sus transiciones con binomiales condicionales (multinomial)."""
+        states = np.empty((steps + 1, len(y0)), dtype=np.int64)
+        states[0] = y0
+        by_source = list(self._by_source.items())
+        sources, targets = self.sources, self.targets
+        y = list(y0)
+        for step in range(steps):
+            rates = self._rates(y, values, population)
+            moved = [0] * len(rates)
+            for source, transitions in by_source:
+                remaining = y[source]
+                hazard = sum(rates[t] for t in transitions)
+                if remaining == 0 or hazard <= 0:
+                    continue
+                leaving = _binomial_draw(remaining, -np.expm1(-hazard * dt), stream)
+                for t in transitions[:-1]:
+                    if leaving == 0 or hazard <= 0:
+                        break
+                    share = _binomial_draw(leaving, min(1.0, rates[t] / hazard), stream)
+                    moved[t] = share
+                    leaving -= share
+                    hazard -= rates[t]
+                moved[transitions[-1]] += leaving
+            for t, count in enumerate(moved):
+                y[sources[t]] -= count
+                y[targets[t]] += count
+            states[step + 1] = y
+        return states
+
+def _binomial_draw(n, p, stream):
+    """Un valor Binomial(n, p): inversión secuencial si n*min(p, 1-p) es pequeño y BTPE (sample_binomial) si no."""
+    if n == 0 or p <= 0:
+        return 0
+    if p >= 1:
+        return n
+    if p > 0.5:
+        return n - _binomial_draw(n, 1 - p, stream)
+    if n * p >= BINOMIAL_BTPE_THRESHOLD:
+        return int(DistributionTransformer.sample_binomial(n, p, 1, stream.take)[0])
+    u = stream.next()
+    ratio = p / (1 - p)
+    k = 0
+    prob = exp(n * log1p(-p))
+    F = prob
+    while u > F and k < n:
+        k += 1
+        prob *= (n - k + 1) * ratio / k
+        F += prob
+    return k
+
+def sir_model():
+    return CompartmentalModel("SIR", ("S", "I", "R"), [
+        ("S", "I", "beta * I / N"),
+        ("I", "R", "gamma")
+    ], {"beta": 0.3, "gamma": 0.1})
+
+def seir_model():
+    return CompartmentalModel("SEIR", ("S", "E", "I", "R"), [
+        ("S", "E", "beta * I / N"),
+        ("E", "I", "sigma"),
+        ("I", "R", "gamma")
+    ], {"beta": 0.3, "sigma": 0.2, "gamma": 0.1})
+
+def sirs_model():
+    return CompartmentalModel("SIRS", ("S", "I", "R"), [
+        ("S", "I", "beta * I / N"),
+        ("I", "R", "gamma"),
+        ("R", "S", "omega")
+    ], {"beta": 0.3, "gamma": 0.1, "omega": 0.01})
+
+def sis_model():
+    return CompartmentalModel("SIS", ("S", "I"), [
+        ("S", "I", "beta * I / N"),
+        ("I", "S", "gamma")
+    ], {"beta": 0.3, "gamma": 0.1})
+
+PRESETS = {"sir": sir_model, "seir": seir_model, "sirs": sirs_model, "sis": sis_model}
+
+def create_model(name):
+    """Devuelve el modelo predefinido name (sir, seir, sirs o sis)."""
+    if name not in PRESETS:
+        raise ValueError(f"Modelo no soportado: {name}. Debe ser uno de: {', '.join(PRESETS)}")
+    return PRESETS[name]()
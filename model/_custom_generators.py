@@ -1,7 +1,56 @@
 import os
+import copy
 import random
+import numpy as np
+
+DEFAULT_SUBSTREAM_STRIDE = 2**24  # Separación por defecto entre subsecuencias independientes
+QUASI_RANDOM_ALGORITHMS = {"halton", "sobol"}  # Secuencias de baja discrepancia
+
+# Números de dirección de Joe-Kuo (new-joe-kuo-6.21201) para las dimensiones 2 en adelante: (s, a, m_1..m_s)
+SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+)
+
+def _affine_jump(a, c, m, k):
+    """Calcula (A, C) tales que k pasos de x -> (a*x + c) % m equivalen a x -> (A*x + C) % m."""
+    acc_a, acc_c = 1, 0
+    cur_a, cur_c = a % m, c % m
+    while k > 0:
+        if k & 1:
+            acc_a, acc_c = (cur_a * acc_a) % m, (cur_a * acc_c + cur_c) % m
+        cur_a, cur_c = (cur_a * cur_a) % m, (cur_a * cur_c + cur_c) % m
+        k >>= 1
+    return acc_a, acc_c
+
+def _gf2_apply(columns, vector):
+    """Multiplica una matriz sobre GF(2), dada por sus columnas como enteros, por un vector de bits."""
+    result = 0
+    j = 0
+    while vector:
+        if vector & 1:
+            result ^= columns[j]
+        vector >>= 1
+        j += 1
+    return result
+
+def _gf2_compose(outer, inner):
+    """Devuelve las columnas de la matriz outer·inner sobre GF(2)."""
+    return [_gf2_apply(outer, column) for column in inner]
 
 class MersenneTwister:
+    _state_attributes = ("mt", "index")
+
     def __init__(self, seed):
         self.index = 624
         self.mt = [0] * 624
@@ -33,8 +82,53 @@ class MersenneTwister:
 
     def random(self):
         return self.extract_number() / 0xffffffff
+
+    def next(self):
+        return self.random()
+
+    @staticmethod
+    def _twist_array(mt):
+        """Aplica el twist sobre el estado completo (ndarray uint32) por bloques vectorizados."""
+        # Cada bloque solo depende de valores ya actualizados por el bloque anterior
+        for start, stop in ((0, 227), (227, 454), (454, 623), (623, 624)):
+            nxt = mt[start + 1:stop + 1] if stop < 624 else np.concatenate((mt[start + 1:], mt[:1]))
+            y = (mt[start:stop] & 0x80000000) | (nxt & 0x7fffffff)
+            source = mt[(start + 397) % 624:(start + 397) % 624 + stop - start]
+            mt[start:stop] = source ^ (y >> 1) ^ ((y & 1) * np.uint32(0x9908b0df))
+        return mt
+
+    @staticmethod
+    def _temper_array(y):
+        """Aplica el tempering de Mersenne Twister a un ndarray uint32."""
+        y = y ^ (y >> 11)
+        y ^= (y << 7) & np.uint32(0x9d2c5680)
+        y ^= (y << 15) & np.uint32(0xefc60000)
+        y ^= (y >> 18)
+        return y
+
+    def extract_array(self, n):
+        """Genera n enteros de 32 bits como ndarray uint32, idénticos a llamar extract_number() n veces."""
+        out = np.empty(n, dtype=np.uint32)
+        mt = np.array(self.mt, dtype=np.uint32)
+        filled = 0
+        while filled < n:
+            if self.index >= 624:
+                self._twist_array(mt)
+                self.index = 0
+            take = min(624 - self.index, n - filled)
+            out[filled:filled + take] = self._temper_array(mt[self.index:self.index + take])
+            self.index += take
+            filled += take
+        self.mt = mt.tolist()
+        return out
+
+    def generate_array(self, n):
+        """Genera n números en [0, 1] como ndarray float64, idénticos a llamar random() n veces."""
+        return self.extract_array(n) / 0xffffffff
     
 class LinearCongruential:
+    _state_attributes = ("current",)
+
     def __init__(self, seed, a=1664525, c=1013904223, m=2**32):
         self.seed = seed
         self.a = a
@@ -48,8 +142,22 @@ class LinearCongruential:
 
     def generate(self, n):
         return [self.next() for _ in range(n)]
+
+    def jump(self, k):
+        """Avanza el generador k pasos en O(log k) mediante composición afín."""
+        if k < 0:
+            raise ValueError("El salto debe ser un entero no negativo.")
+        a_k, c_k = _affine_jump(self.a, self.c, self.m, k)
+        self.current = (a_k * self.current + c_k) % self.m
+        return self
+
+    def substream(self, i, stride=DEFAULT_SUBSTREAM_STRIDE):
+        """Devuelve una copia independiente situada i*stride pasos por delante del estado actual."""
+        return copy.copy(self).jump(i * stride)
     
 class LinearCongruentialMultiplicative:
+    _state_attributes = ("current",)
+
     def __init__(self, seed, a=1664525, m=2**32):
         self.seed = seed
         self.a = a
@@ -63,12 +171,107 @@ class LinearCongruentialMultiplicative:
     def generate(self, n):
         return [self.next() for _ in range(n)]
 
+    def jump(self, k):
+        """Avanza el generador k pasos en O(log k) usando a^k mod m."""
+        if k < 0:
+            raise ValueError("El salto debe ser un entero no negativo.")
+        self.current = (pow(self.a, k, self.m) * self.current) % self.m
+        return self
+
+    def substream(self, i, stride=DEFAULT_SUBSTREAM_STRIDE):
+        """Devuelve una copia independiente situada i*stride pasos por delante del estado actual."""
+        return copy.copy(self).jump(i * stride)
+
+# Polinomios de periodo máximo (bit k-1 activo para el tap k) para anchos habituales
+LFSR_DEFAULT_POLYNOMIALS = {8: 0xB8, 16: 0xB400, 32: 0x80200003, 64: 0xD800000000000000}
+
+def _gf2_power(columns, k, width):
+    """Eleva una matriz sobre GF(2) a la potencia k por cuadrados sucesivos."""
+    result = [1 << j for j in range(width)]
+    while k:
+        if k & 1:
+            result = _gf2_compose(columns, result)
+        columns = _gf2_compose(columns, columns)
+        k >>= 1
+    return result
+
 class LFSR:
-    def __init__(self, seed, taps):
+    """Registro de desplazamiento con realimentación lineal.
+
+    Sin width se conserva el comportamiento histórico (un bit por paso y ancho variable).
+    Con width se usa un registro de ancho fijo en forma de Galois o Fibonacci que avanza
+    una palabra completa por paso mediante tablas de consulta por byte.
+    """
+    _tables_cache = {}
+    _state_attributes = ("state",)
+
+    def __init__(self, seed, taps=3, width=None, polynomial=None, form="galois"):
         self.state = seed
         self.taps = taps if isinstance(taps, list) else [taps, 2]
+        self.width = width
+        if width is not None:
+            self._configure_fixed_width(width, polynomial, form)
+
+    def _configure_fixed_width(self, width, polynomial, form):
+        if not 2 <= self.width <= 64:
+            raise ValueError("El ancho del LFSR debe estar entre 2 y 64 bits.")
+        if form not in ("galois", "fibonacci"):
+            raise ValueError("La forma del LFSR debe ser 'galois' o 'fibonacci'.")
+        if polynomial is None:
+            if width not in LFSR_DEFAULT_POLYNOMIALS:
+                raise ValueError(f"Debe indicar el polinomio para un LFSR de {width} bits.")
+            polynomial = LFSR_DEFAULT_POLYNOMIALS[width]
+        mask = (1 << width) - 1
+        if not 0 < polynomial <= mask:
+            raise ValueError(f"El polinomio debe ser un entero positivo de como máximo {width} bits.")
+        self.state &= mask
+        if self.state == 0:
+            raise ValueError("La semilla no puede ser cero en un LFSR de ancho fijo.")
+        self.polynomial = polynomial
+        self.form = form
+        self._byte_tables, self._byte_lists = self._word_tables(width, polynomial, form)
+
+    @classmethod
+    def _word_tables(cls, width, polynomial, form):
+        """Construye (una vez por configuración) las tablas por byte del avance de una palabra completa."""
+        key = (width, polynomial, form)
+        if key not in cls._tables_cache:
+            if form == "galois":
+                def step(state):
+                    return (state >> 1) ^ (polynomial if state & 1 else 0)
+            else:
+                # Misma realimentación expresada en forma de Fibonacci (máscara invertida)
+                taps_mask = int(format(polynomial, f"0{width}b")[::-1], 2)
+                def step(state):
+                    feedback = bin(state & taps_mask).count("1") & 1
+                    return (state >> 1) | (feedback << (width - 1))
+
+            word_step = _gf2_power([step(1 << j) for j in range(width)], width, width)
+            mask = (1 << width) - 1
+            byte_lists = [
+                [_gf2_apply(word_step, (byte << (8 * j)) & mask) for byte in range(256)]
+                for j in range((width + 7) // 8)
+            ]
+            cls._tables_cache[key] = (word_step, np.array(byte_lists, dtype=np.uint64), byte_lists)
+        _, byte_tables, byte_lists = cls._tables_cache[key]
+        return byte_tables, byte_lists
+
+    def _to_unit(self, state):
+        if self.width > 53:
+            return (state >> (self.width - 53)) / (1 << 53)  # Conservar solo los bits representables en float64
+        return state / (1 << self.width)
+
+    def _next_word(self, state):
+        word = 0
+        for j, table in enumerate(self._byte_lists):
+            word ^= table[(state >> (8 * j)) & 0xFF]
+        return word
 
     def next(self):
+        if self.width is not None:
+            self.state = self._next_word(self.state)
+            return self._to_unit(self.state)
+
         xor = 0
         for t in self.taps:
             xor ^= (self.state >> t) & 1
@@ -83,75 +286,192 @@ class LFSR:
 
     def generate(self, n):
         return [self.next() for _ in range(n)]
+
+    def generate_words(self, n):
+        """Genera n palabras del registro de ancho fijo como ndarray uint64.
+
+        La secuencia se reparte en carriles independientes cuyos estados iniciales se obtienen
+        con potencias de la matriz de avance; todos los carriles avanzan a la vez con las tablas.
+        """
+        if self.width is None:
+            raise ValueError("generate_words solo está disponible para LFSR de ancho fijo.")
+        lane_length = max(1, int(n ** 0.5))
+        lanes_count = -(-n // lane_length)
+        if lanes_count < 64:
+            words = np.empty(n, dtype=np.uint64)
+            for i in range(n):
+                self.state = self._next_word(self.state)
+                words[i] = self.state
+            return words
+
+        word_step = self._tables_cache[(self.width, self.polynomial, self.form)][0]
+        lane_jump = _gf2_power(word_step, lane_length, self.width)
+        starts = [self.state]
+        for _ in range(lanes_count - 1):
+            starts.append(_gf2_apply(lane_jump, starts[-1]))
+
+        lanes = np.array(starts, dtype=np.uint64)
+        words = np.empty((lane_length, lanes_count), dtype=np.uint64)
+        for step in range(lane_length):
+            advanced = self._byte_tables[0][lanes & np.uint64(0xFF)]
+            for j in range(1, len(self._byte_tables)):
+                advanced ^= self._byte_tables[j][(lanes >> np.uint64(8 * j)) & np.uint64(0xFF)]
+            lanes = advanced
+            words[step] = lanes
+        words = words.T.reshape(-1)[:n]
+        self.state = int(words[-1])
+        return words
+
+    def generate_array(self, n):
+        """Genera n números en [0, 1) como ndarray float64."""
+        if self.width is None:
+            return np.fromiter((self.next() for _ in range(n)), dtype=np.float64, count=n)
+        words = self.generate_words(n)
+        if self.width > 53:
+            return (words >> np.uint64(self.width - 53)) / float(1 << 53)
+        return words / float(1 << self.width)
     
+def _middle_four_digits(value):
+    """Extrae los 4 dígitos centrales de value completado a 8 cifras, evitando valores menores a 1000."""
+    if value < 10**8:
+        digits = (value // 100) % 10000
+    else:
+        text = str(value)
+        middle = len(text) // 2
+        digits = int(text[middle - 2:middle + 2])
+    return digits + 1000 if digits < 1000 else digits  # Evitar degeneración
+
+def _brent_cycle(step, state):
+    """Detecta la longitud de la cola (mu) y del ciclo (lambda) de la secuencia state, step(state), ... (Brent)."""
+    power = cycle_length = 1
+    tortoise, hare = state, step(state)
+    while tortoise != hare:
+        if power == cycle_length:
+            tortoise = hare
+            power *= 2
+            cycle_length = 0
+        hare = step(hare)
+        cycle_length += 1
+
+    tail_length = 0
+    tortoise = hare = state
+    for _ in range(cycle_length):
+        hare = step(hare)
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(hare)
+        tail_length += 1
+    return tail_length, cycle_length
+
+def _unroll_sequence(step, state, n, value_of):
+    """Devuelve los valores de los n estados siguientes a state y el estado final.
+
+    Al repetirse un estado la secuencia es periódica, así que el resto se completa
+    indexando el ciclo ya recorrido en lugar de seguir iterando.
+    """
+    states = [state]
+    seen = {state: 0}
+    while len(states) <= n:
+        state = step(state)
+        if state in seen:
+            tail_length = seen[state]
+            cycle_length = len(states) - tail_length
+            values = np.array([value_of(s) for s in states], dtype=np.float64)
+            positions = np.arange(1, n + 1)
+            cyclic = positions >= len(states)
+            positions[cyclic] = tail_length + (positions[cyclic] - tail_length) % cycle_length
+            final = tail_length + (n - tail_length) % cycle_length if n >= len(states) else n
+            return values[positions], states[final]
+        seen[state] = len(states)
+        states.append(state)
+    values = np.array([value_of(s) for s in states[1:]], dtype=np.float64)
+    return values, states[-1]
+
 class MiddleProduct:
+    _state_attributes = ("previous", "current")
+
     def __init__(self, seed):
         # Asegurar que la semilla tenga 4 dígitos
         self.seed = max(1000, abs(seed))
         self.current = self.seed
         self.previous = self.seed + 1 if self.seed < 9999 else self.seed - 1
 
+    @staticmethod
+    def _step(state):
+        previous, current = state
+        return current, _middle_four_digits(current * previous)
+
     def next(self):
-        product = self.current * self.previous
-        # Asegurar que el producto tenga 8 dígitos
-        product_str = str(product).zfill(8)
-        
-        # Si el producto es muy corto, ajustar
-        if len(product_str) < 8:
-            self.current = self.seed
-            self.previous = self.seed + 1
-            return self.current / 10000
-            
-        # Extraer los dígitos medios (4 dígitos)
-        middle = len(product_str) // 2
-        middle_digits = int(product_str[middle-2:middle+2])
-        
-        # Evitar degeneración
-        if middle_digits < 1000:
-            middle_digits += 1000
-            
-        self.previous = self.current
-        self.current = middle_digits
-        
+        self.previous, self.current = self._step((self.previous, self.current))
         return self.current / 10000
 
+    def generate_array(self, n):
+        """Genera n números como ndarray; al entrar en un ciclo lo replica sin seguir iterando."""
+        values, (self.previous, self.current) = _unroll_sequence(self._step, (self.previous, self.current), n, lambda state: state[1] / 10000)
+        return values
+
     def generate(self, n):
-        return [self.next() for _ in range(n)]
+        return self.generate_array(n).tolist()
+
+    def cycle_info(self):
+        """Longitud de la cola y del ciclo de la secuencia a partir del estado actual."""
+        tail_length, cycle_length = _brent_cycle(self._step, (self.previous, self.current))
+        return {"tail_length": tail_length, "cycle_length": cycle_length}
     
 class QuadraticProduct:
+    _transition_table = None  # Tabla completa de transiciones para los estados de 4 dígitos
+    _transition_list = None
+    _state_attributes = ("current",)
+
     def __init__(self, seed):
         # Asegurar que la semilla tenga 4 dígitos
         self.seed = max(1000, abs(seed))
         self.current = self.seed
 
+    @classmethod
+    def transition_table(cls):
+        """Devuelve (y calcula una sola vez) el siguiente estado para cada valor de 0 a 9999."""
+        if cls._transition_table is None:
+            squares = np.arange(10000, dtype=np.int64) ** 2
+            digits = (squares // 100) % 10000
+            digits[digits < 1000] += 1000
+            cls._transition_table = digits
+            cls._transition_list = digits.tolist()
+        return cls._transition_table
+
+    @classmethod
+    def _step(cls, state):
+        if state < 10000:
+            cls.transition_table()
+            return cls._transition_list[state]
+        return _middle_four_digits(state ** 2)  # Solo una semilla mayor a 9999 sale de la tabla
+
     def next(self):
-        square = self.current ** 2
-        square_str = str(square).zfill(8)
-        
-        # Si el cuadrado es muy corto, reiniciar
-        if len(square_str) < 8:
-            self.current = self.seed
-            return self.current / 10000
-            
-        # Extraer los dígitos medios (4 dígitos)
-        middle = len(square_str) // 2
-        middle_digits = int(square_str[middle-2:middle+2])
-        
-        # Evitar degeneración
-        if middle_digits < 1000:
-            middle_digits += 1000
-            
-        self.current = middle_digits
+        self.current = self._step(self.current)
         return self.current / 10000
 
+    def generate_array(self, n):
+        """Genera n números recorriendo la tabla de transiciones y replicando el ciclo al detectarlo."""
+        values, self.current = _unroll_sequence(self._step, self.current, n, lambda state: state / 10000)
+        return values
+
     def generate(self, n):
-        return [self.next() for _ in range(n)]
+        return self.generate_array(n).tolist()
+
+    def cycle_info(self):
+        """Longitud de la cola y del ciclo de la secuencia a partir del estado actual."""
+        tail_length, cycle_length = _brent_cycle(self._step, self.current)
+        return {"tail_length": tail_length, "cycle_length": cycle_length}
     
 class Xorshift:
+    _state_attributes = ("state",)
+
+    _jump_powers = []  # Columnas de T^(2^i) sobre GF(2), calculadas bajo demanda
+
     def __init__(self, seed=None):
         self.state = seed if seed is not None else random.randint(1, 2**32 - 1)
 
-    def _xorshift32(self, state):
+    @staticmethod
+    def _xorshift32(state):
         state ^= (state << 13) & 0xFFFFFFFF
         state ^= (state >> 17) & 0xFFFFFFFF
         state ^= (state << 5) & 0xFFFFFFFF
@@ -163,11 +483,259 @@ class Xorshift:
 
     def set_seed(self, seed):
         self.state = seed
+
+    @classmethod
+    def _jump_power(cls, i):
+        """Devuelve la matriz de transición elevada a 2^i (un paso de xorshift32 es lineal sobre GF(2))."""
+        if not cls._jump_powers:
+            cls._jump_powers.append([cls._xorshift32(1 << j) for j in range(32)])
+        while len(cls._jump_powers) <= i:
+            last = cls._jump_powers[-1]
+            cls._jump_powers.append(_gf2_compose(last, last))
+        return cls._jump_powers[i]
+
+    def jump(self, k):
+        """Avanza el generador k pasos en O(log k) mediante potencias de la matriz sobre GF(2)."""
+        if k < 0:
+            raise ValueError("El salto debe ser un entero no negativo.")
+        i = 0
+        while k:
+            if k & 1:
+                self.state = _gf2_apply(self._jump_power(i), self.state & 0xFFFFFFFF)
+            k >>= 1
+            i += 1
+        return self
+
+    def substream(self, i, stride=DEFAULT_SUBSTREAM_STRIDE):
+        """Devuelve una copia independiente situada i*stride pasos por delante del estado actual."""
+        return copy.copy(self).jump(i * stride)
         
 class PhysicalNoise:
+    def __init__(self, buffer_size=1 << 20):
+        # Se leen bloques grandes de entropía del sistema operativo en lugar de 4 bytes por número
+        self.buffer_size = max(4, buffer_size - buffer_size % 4)
+        self._buffer = np.empty(0, dtype='>u4')
+        self._position = 0
+
+    def _refill(self):
+        self._buffer = np.frombuffer(os.urandom(self.buffer_size), dtype='>u4')
+        self._position = 0
+
     def next(self):
-        # Genera un número aleatorio usando bytes del sistema operativo
-        return int.from_bytes(os.urandom(4), 'big') / (2**32)
+        if self._position >= len(self._buffer):
+            self._refill()
+        value = int(self._buffer[self._position])
+        self._position += 1
+        return value / (2**32)
+
+    def generate_array(self, n):
+        """Genera n números en [0, 1) como ndarray float64 a partir del búfer de entropía."""
+        out = np.empty(n, dtype=np.float64)
+        filled = 0
+        while filled < n:
+            if self._position >= len(self._buffer):
+                self._refill()
+            take = min(len(self._buffer) - self._position, n - filled)
+            out[filled:filled + take] = self._buffer[self._position:self._position + take] / (2**32)
+            self._position += take
+            filled += take
+        return out
 
     def generate(self, n):
-        return [self.next() for _ in range(n)]
+        return self.generate_array(n).tolist()
+
+def _first_primes(count):
+    """Devuelve los primeros count números primos."""
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+def _random_words(seed, count):
+    """Palabras de 32 bits deterministas a partir de la semilla, usadas para aleatorizar las secuencias."""
+    return MersenneTwister(seed).extract_array(count)
+
+class Halton:
+    """Secuencia de Halton (inversa radical en bases primas) con desplazamiento aleatorio de Cranley-Patterson."""
+
+    _state_attributes = ("index",)
+
+    def __init__(self, seed=12345, dimension=1, scramble=True):
+        if dimension < 1:
+            raise ValueError("La dimensión debe ser un entero positivo.")
+        self.dimension = dimension
+        self.bases = _first_primes(dimension)
+        self.scramble = scramble
+        self.index = 0
+        self.set_seed(seed)
+
+    def set_seed(self, seed):
+        self.seed = seed
+        self.index = 0
+        self.shift = _random_words(seed, self.dimension) / 2.0**32 if self.scramble else np.zeros(self.dimension)
+
+    @staticmethod
+    def _radical_inverse(indices, base):
+        result = np.zeros(len(indices), dtype=np.float64)
+        remaining = indices.copy()
+        factor = 1.0 / base
+        while remaining.any():
+            result += (remaining % base) * factor
+            remaining //= base
+            factor /= base
+        return result
+
+    def generate_points(self, n):
+        """Devuelve los siguientes n puntos como array (n, dimension) en [0, 1)."""
+        indices = np.arange(self.index, self.index + n, dtype=np.int64)
+        self.index += n
+        points = np.empty((n, self.dimension), dtype=np.float64)
+        for j, base in enumerate(self.bases):
+            points[:, j] = (self._radical_inverse(indices, base) + self.shift[j]) % 1.0
+        return points
+
+    def generate_array(self, n):
+        """Primera coordenada de los siguientes n puntos."""
+        return self.generate_points(n)[:, 0]
+
+    def next(self):
+        return float(self.generate_array(1)[0])
+
+    def jump(self, k):
+        """Avanza k puntos; la secuencia se indexa directamente, así que el salto es O(1)."""
+        if k < 0:
+            raise ValueError("El salto debe ser un entero no negativo.")
+        self.index += k
+        return self
+
+    def substream(self, i, stride=DEFAULT_SUBSTREAM_STRIDE):
+        """Devuelve una copia situada i*stride puntos por delante del estado actual."""
+        return copy.copy(self).jump(i * stride)
+
+class Sobol:
+    """Secuencia de Sobol en base 2 (código Gray) con desplazamiento digital aleatorio."""
+
+    BITS = 32
+    MAX_DIMENSION = len(SOBOL_DIRECTIONS) + 1
+    _state_attributes = ("index",)
+
+    def __init__(self, seed=12345, dimension=1, scramble=True):
+        if not 1 <= dimension <= self.MAX_DIMENSION:
+            raise ValueError(f"La dimensión debe estar entre 1 y {self.MAX_DIMENSION}.")
+        self.dimension = dimension
+        self.directions = self._direction_numbers(dimension)
+        self.scramble = scramble
+        self.index = 0
+        self.set_seed(seed)
+
+    def set_seed(self, seed):
+        self.seed = seed
+        self.index = 0
+        self.shift = _random_words(seed, self.dimension) if self.scramble else np.zeros(self.dimension, dtype=np.uint32)
+
+    @classmethod
+    def _direction_numbers(cls, dimension):
+        """Matriz (dimension, BITS) de números de dirección V_k desplazados a la izquierda."""
+        bits = cls.BITS
+        directions = np.empty((dimension, bits), dtype=np.uint32)
+        directions[0] = [1 << (bits - 1 - k) for k in range(bits)]
+        for j, (s, a, m) in enumerate(SOBOL_DIRECTIONS[:dimension - 1], start=1):
+            v = [m[k] << (bits - 1 - k) for k in range(s)]
+            for k in range(s, bits):
+                value = v[k - s] ^ (v[k - s] >> s)
+                for i in range(1, s):
+                    if (a >> (s - 1 - i)) & 1:
+                        value ^= v[k - i]
+                v.append(value)
+            directions[j] = v
+        return directions
+
+    def generate_words(self, n):
+        """Devuelve los siguientes n puntos como enteros de 32 bits con forma (n, dimension)."""
+        if self.index + n > 2**self.BITS:
+            raise ValueError("Se ha agotado la secuencia de Sobol.")
+        indices = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        gray = indices ^ (indices >> np.uint64(1))
+        words = np.tile(self.shift.astype(np.uint32), (n, 1))
+        for k in range(int(self.index).bit_length()):  # Solo hacen falta los bits del mayor índice
+            bit = ((gray >> np.uint64(k)) & np.uint64(1)).astype(np.uint32)
+            words ^= bit[:, None] * self.directions[:, k]
+        return words
+
+    def generate_points(self, n):
+        """Devuelve los siguientes n puntos como array (n, dimension) en [0, 1)."""
+        return self.generate_words(n) / 2.0**self.BITS
+
+    def generate_array(self, n):
+        """Primera coordenada de los siguientes n puntos."""
+        return self.generate_points(n)[:, 0]
+
+    def next(self):
+        return float(self.generate_array(1)[0])
+
+    def jump(self, k):
+        """Avanza k puntos; cada punto se calcula directamente desde su índice, así que el salto es O(1)."""
+        if k < 0:
+            raise ValueError("El salto debe ser un entero no negativo.")
+        self.index += k
+        return self
+
+    def substream(self, i, stride=DEFAULT_SUBSTREAM_STRIDE):
+        """Devuelve una copia situada i*stride puntos por delante del estado actual."""
+        return copy.copy(self).jump(i * stride)
+
+def create_generator(algorithm, seed=12345, **kwargs):
+    """Construye el generador correspondiente al algoritmo indicado."""
+    if algorithm == "mersenne":
+        return MersenneTwister(seed)
+    elif algorithm == "xorshift":
+        return Xorshift(seed)
+    elif algorithm == "congruencial":
+        a = kwargs.get('a', 1664525)
+        c = kwargs.get('c', 1013904223)
+        m = kwargs.get('m', 2**32)
+        return LinearCongruential(seed, a, c, m)
+    elif algorithm == "congruencial_multiplicativo":
+        a = kwargs.get('a', 1664525)
+        m = kwargs.get('m', 2**32)
+        return LinearCongruentialMultiplicative(seed, a, m)
+    elif algorithm == "lfsr":
+        taps = [kwargs.get('taps', 3), 2]  # Por defecto usar taps=[3, 2]
+        if kwargs.get('width') is not None:
+            return LFSR(seed=seed, taps=taps, width=kwargs['width'], polynomial=kwargs.get('polynomial'), form=kwargs.get('form', 'galois'))
+        return LFSR(seed=seed, taps=taps)
+    elif algorithm == "productos_medios":
+        return MiddleProduct(seed=seed)
+    elif algorithm == "productos_cuadraticos":
+        return QuadraticProduct(seed=seed)
+    elif algorithm == "ruido_fisico":
+        return PhysicalNoise()
+    elif algorithm == "halton":
+        return Halton(seed, kwargs.get('dimension', 1), kwargs.get('scramble', True))
+    elif algorithm == "sobol":
+        return Sobol(seed, kwargs.get('dimension', 1), kwargs.get('scramble', True))
+    raise ValueError(f"Algoritmo no soportado: {algorithm}")
+
+def generator_state(generator):
+    """Estado mínimo con el que un generador recién creado con la misma semilla continúa la secuencia."""
+    if not hasattr(generator, "_state_attributes"):
+        raise ValueError("El generador no es determinista: su estado no se puede guardar ni reanudar.")
+    return {name: copy.copy(getattr(generator, name)) for name in generator._state_attributes}
+
+def restore_generator_state(generator, state):
+    """Sitúa el generador en un estado obtenido con generator_state."""
+    if set(state) != set(getattr(generator, "_state_attributes", ())):
+        raise ValueError("El estado guardado no corresponde a este generador.")
+    for name, value in state.items():
+        setattr(generator, name, copy.copy(value))
+    return generator
+
+def generate_block(generator, n):
+    """Genera n números uniformes como ndarray float64 usando la ruta por bloques si el generador la ofrece."""
+    if hasattr(generator, "generate_array"):
+        return generator.generate_array(n)
+    return np.fromiter((generator.next() for _ in range(n)), dtype=np.float64, count=n)
@@ -1,117 +1,532 @@
-from numpy import cos, sin, pi
-from math import log, sqrt, exp
+import numpy as np
+from numpy import pi
+from math import exp, log, sqrt, lgamma
+from functools import lru_cache
+
+SAFE_LOWER = 1e-10
+SAFE_UPPER = 0.9999999
+POISSON_PTRS_THRESHOLD = 10.0  # A partir de aquí el muestreador usa PTRS en lugar de la tabla
+BINOMIAL_BTPE_THRESHOLD = 30.0  # Valor de n*min(p, 1-p) desde el que el muestreador usa BTPE
+
+_lgamma_object = np.frompyfunc(lgamma, 1, 1)
+
+def _log_factorial(k):
+    """log(k!) vectorizado: serie de Stirling para k >= 10 y lgamma exacta para el resto."""
+    k = np.asarray(k, dtype=np.float64)
+    x = k + 1
+    result = np.empty_like(x)
+    large = x >= 10
+    xl = x[large]
+    result[large] = (xl - 0.5) * np.log(xl) - xl + 0.5 * log(2 * pi) + 1 / (12 * xl) - 1 / (360 * xl ** 3) + 1 / (1260 * xl ** 5)
+    if not large.all():
+        result[~large] = _lgamma_object(x[~large]).astype(np.float64)
+    return result
+
+@lru_cache(maxsize=64)
+def _poisson_table(lambda_param):
+    """Acumulada de Poisson para lambda como (desplazamiento, tabla de solo lectura), calculada una vez."""
+    p = exp(-lambda_param)
+    if p > 0:
+        # Misma recurrencia que el recorrido término a término, hasta que la cola ya no cambia F
+        F = p
+        cdf = [F]
+        k = 0
+        while p > 0 and (k < lambda_param or F + p != F):
+            k += 1
+            p = p * lambda_param / k
+            F += p
+            cdf.append(F)
+        offset, table = 0, np.array(cdf)
+    else:
+        # exp(-lambda) se anula: se construye la tabla en escala logarítmica alrededor de la moda
+        spread = 40 * sqrt(lambda_param)
+        offset = max(0, int(lambda_param - spread))
+        k = np.arange(offset, int(lambda_param + spread) + 2)
+        log_pmf = k * log(lambda_param) - lambda_param - _log_factorial(k)
+        table = np.cumsum(np.exp(log_pmf))
+    table.flags.writeable = False
+    return offset, table
+
+@lru_cache(maxsize=64)
+def _binomial_table(n, p):
+    """Acumulada binomial para (n, p) como (desplazamiento, tabla de solo lectura), calculada una vez."""
+    prob = (1 - p) ** n
+    if prob > 0:
+        # Misma recurrencia que el recorrido término a término, hasta que la cola ya no cambia F
+        F = prob
+        cdf = [F]
+        k = 0
+        while k < n and (k < n * p or F + prob != F):
+            k += 1
+            prob *= (n - k + 1) * p / (k * (1 - p))
+            F += prob
+            cdf.append(F)
+        offset, table = 0, np.array(cdf)
+    else:
+        # (1-p)^n se anula: se construye la tabla en escala logarítmica alrededor de la media
+        spread = 40 * sqrt(n * p * (1 - p)) + 10
+        offset = max(0, int(n * p - spread))
+        k = np.arange(offset, min(n, int(n * p + spread)) + 1)
+        log_pmf = _log_factorial(n) - _log_factorial(k) - _log_factorial(n - k) + k * log(p) + (n - k) * log(1 - p)
+        table = np.cumsum(np.exp(log_pmf))
+    table.flags.writeable = False
+    return offset, table
+
+def _rejection_sample(propose, size, uniform_source, uniforms_per_row, dtype, expected_rate=0.5, proposals_per_row=1):
+    """Repite propuestas vectorizadas hasta reunir exactamente size valores aceptados.
+
+    propose recibe uniforms_per_row arrays de uniformes (cada fila plantea proposals_per_row propuestas)
+    y devuelve los valores aceptados en orden; los uniformes se piden al generador por lotes según la tasa
+    de aceptación observada.
+    """
+    out = np.empty(size, dtype=dtype)
+    filled = proposed = accepted = 0
+    while filled < size:
+        rate = accepted / proposed if accepted else expected_rate
+        batch = int((size - filled) / (rate * proposals_per_row) * 1.1) + 16
+        uniforms = np.asarray(uniform_source(batch * uniforms_per_row), dtype=np.float64)
+        values = propose(*uniforms.reshape(batch, uniforms_per_row).T)
+        take = min(len(values), size - filled)
+        out[filled:filled + take] = values[:take]
+        filled += take
+        proposed += batch * proposals_per_row
+        accepted += len(values)
+    return out, {"acceptance_rate": accepted / proposed if proposed else 1.0, "proposals": proposed}
+
+def _accepted_from(propose, uniform_numbers, uniforms_per_row):
+    """Una sola pasada de propuestas sobre los uniformes dados, sin pedir más; devuelve los aceptados."""
+    uniforms = np.asarray(uniform_numbers, dtype=np.float64)
+    rows = len(uniforms) // uniforms_per_row
+    return propose(*uniforms[:rows * uniforms_per_row].reshape(rows, uniforms_per_row).T)
+
+class UniformStream:
+    """Reparte uniformes de uniform_source(n) pedidos por bloques para no llamar al generador por cada número."""
+
+    def __init__(self, uniform_source, block_size=4096):
+        self.uniform_source = uniform_source
+        self.block_size = block_size
+        self._values = []
+        self._position = 0
+
+    def next(self):
+        if self._position >= len(self._values):
+            self._values = self.uniform_source(self.block_size).tolist()
+            self._position = 0
+        value = self._values[self._position]
+        self._position += 1
+        return value
+
+    def take(self, n):
+        """n uniformes como array: primero los que quedan en el bloque actual y después un bloque nuevo.
+
+        Las peticiones menores que un bloque rellenan el búfer en lugar de llamar al generador por unos pocos valores.
+        """
+        buffered = self._values[self._position:self._position + n]
+        self._position += len(buffered)
+        if len(buffered) == n:
+            return np.array(buffered, dtype=np.float64)
+        missing = n - len(buffered)
+        if missing >= self.block_size:
+            return np.concatenate((np.array(buffered, dtype=np.float64), self.uniform_source(missing)))
+        self._values = self.uniform_source(self.block_size).tolist()
+        self._position = missing
+        return np.array(buffered + self._values[:missing], dtype=np.float64)
 
 class DistributionTransformer:
     @staticmethod
     def _safe_uniform(u):
         """Asegura que u esté en el rango (0, 1) excluyendo extremos."""
-        return max(1e-10, min(0.9999999, u))
-    
+        return max(SAFE_LOWER, min(SAFE_UPPER, u))
+
     @staticmethod
-    def box_muller(uniform_numbers):
-        """Transforma números uniformes a distribución normal usando Box-Muller."""
+    def _safe_array(uniform_numbers):
+        """Convierte a ndarray float64 y recorta al rango seguro en un único paso vectorizado."""
+        return np.clip(np.asarray(uniform_numbers, dtype=np.float64), SAFE_LOWER, SAFE_UPPER)
+
+    @staticmethod
+    def _output(out, size, dtype):
+        """Devuelve el array de salida indicado por el usuario o uno nuevo del tamaño requerido."""
+        if out is None:
+            return np.empty(size, dtype=dtype)
+        if out.shape != (size,):
+            raise ValueError(f"El array de salida debe tener forma ({size},).")
+        return out
+
+    @staticmethod
+    def _pairs(uniform_numbers):
+        """Separa los números en pares consecutivos (u1, u2), descartando el último si sobra."""
+        numbers = np.asarray(uniform_numbers, dtype=np.float64)
+        pairs = len(numbers) // 2
+        return numbers[0:2 * pairs:2], numbers[1:2 * pairs:2]
+
+    @staticmethod
+    def box_muller_array(uniform_numbers, out=None):
+        """Box-Muller vectorizado: devuelve z1, z2 intercalados para cada par de uniformes."""
         if len(uniform_numbers) < 2:
             raise ValueError("Se necesitan al menos 2 números para Box-Muller.")
-            
-        transformed = []
-        for i in range(0, len(uniform_numbers) - 1, 2):
-            u1, u2 = uniform_numbers[i:i+2]
-            # Proteger contra valores extremos
-            u1 = DistributionTransformer._safe_uniform(u1)
-            u2 = DistributionTransformer._safe_uniform(u2)
-            
-            z1 = sqrt(-2 * log(u1)) * cos(2 * pi * u2)
-            z2 = sqrt(-2 * log(u1)) * sin(2 * pi * u2)
-            transformed.extend([z1, z2])
-        return transformed
+        u1, u2 = DistributionTransformer._pairs(DistributionTransformer._safe_array(uniform_numbers))
+        out = DistributionTransformer._output(out, 2 * len(u1), np.float64)
+        radius = np.sqrt(-2 * np.log(u1))
+        angle = 2 * pi * u2
+        np.multiply(radius, np.cos(angle), out=out[0::2])
+        np.multiply(radius, np.sin(angle), out=out[1::2])
+        return out
 
     @staticmethod
-    def exponential(uniform_numbers, lambda_param=1.0):
-        """Transforma números uniformes a distribución exponencial."""
+    def exponential_array(uniform_numbers, lambda_param=1.0, out=None):
+        """Transformación inversa exponencial vectorizada."""
         if lambda_param <= 0:
             raise ValueError("lambda debe ser positivo")
-        return [-log(1 - DistributionTransformer._safe_uniform(u)) / lambda_param for u in uniform_numbers]
+        safe = DistributionTransformer._safe_array(uniform_numbers)
+        out = DistributionTransformer._output(out, len(safe), np.float64)
+        np.subtract(1, safe, out=out)
+        np.negative(np.log(out, out=out), out=out)
+        out /= lambda_param
+        return out
 
     @staticmethod
-    def poisson(uniform_numbers, lambda_param=1.0):
-        """Transforma números uniformes a distribución de Poisson."""
-        def inverse_poisson(u, lambda_param):
-            p = exp(-lambda_param)
-            F = p
-            k = 0
-            while u > F:
-                k += 1
-                p = p * lambda_param / k
-                F += p
-            return k
+    def poisson_array(uniform_numbers, lambda_param=1.0, out=None):
+        """Poisson por inversión: una búsqueda binaria en la acumulada (cacheada por lambda) para todo el array."""
+        if lambda_param <= 0:
+            raise ValueError("lambda debe ser positivo")
+        numbers = np.asarray(uniform_numbers, dtype=np.float64)
+        out = DistributionTransformer._output(out, len(numbers), np.int64)
+        offset, cdf = _poisson_table(float(lambda_param))
+        np.minimum(np.searchsorted(cdf, numbers, side="left"), len(cdf) - 1, out=out)
+        out += offset
+        return out
 
-        return [inverse_poisson(u, lambda_param) for u in uniform_numbers]
+    @staticmethod
+    def _ptrs_accept(u, v, lambda_param):
+        """Prueba de PTRS (Hörmann, 1993) para lambda >= 10: devuelve las propuestas k y la máscara de aceptación.
+
+        lambda_param puede ser un escalar o un array con la media de cada propuesta.
+        """
+        lambda_param = np.asarray(lambda_param, dtype=np.float64)
+        b = 0.931 + 2.53 * np.sqrt(lambda_param)
+        a = -0.059 + 0.02483 * b
+        log_invalpha = np.log(1.1239 + 1.1328 / (b - 3.4))
+        vr = 0.9277 - 3.6224 / (b - 2)
+
+        u = np.clip(u, SAFE_LOWER, SAFE_UPPER) - 0.5
+        v = np.clip(v, SAFE_LOWER, SAFE_UPPER)
+        us = 0.5 - np.abs(u)
+        k = np.floor((2 * a / us + b) * u + lambda_param + 0.43)
+        accepted = (us >= 0.07) & (v <= vr)
+        pending = ~accepted & (k >= 0) & ~((us < 0.013) & (v > us))
+        if pending.any():
+            lam, ap, bp, lip = (np.broadcast_to(x, k.shape)[pending] for x in (lambda_param, a, b, log_invalpha))
+            kp, usp = k[pending], us[pending]
+            log_target = -lam + kp * np.log(lam) - _log_factorial(kp)
+            accepted[pending] = np.log(v[pending]) + lip - np.log(ap / (usp * usp) + bp) <= log_target
+        return k, accepted
 
     @staticmethod
-    def binomial(uniform_numbers, n, p):
-        """Transforma números uniformes a distribución binomial."""
-        def inverse_binomial(u, n, p):
-            k = 0
-            prob = (1 - p) ** n
-            F = prob
-            while u > F and k < n:
-                k += 1
-                prob *= (n - k + 1) * p / (k * (1 - p))
-                F += prob
-            return k
+    def _ptrs_proposal(lambda_param):
+        """Propuesta vectorizada de PTRS para una sola lambda >= 10."""
+        def propose(u, v):
+            k, accepted = DistributionTransformer._ptrs_accept(u, v, lambda_param)
+            return k[accepted].astype(np.int64)
 
-        return [inverse_binomial(u, n, p) for u in uniform_numbers]
+        return propose
 
     @staticmethod
-    def gamma(uniform_numbers, alpha, beta=1.0):
-        """Transforma números uniformes a distribución gamma."""
+    def sample_poisson(lambda_param, size, uniform_source, return_stats=False):
+        """Genera exactamente size valores de Poisson pidiendo uniformes a uniform_source(n).
+
+        Para lambda pequeño se invierte la tabla cacheada; desde POISSON_PTRS_THRESHOLD se usa
+        rechazo transformado (PTRS), cuyo coste no crece con lambda.
+        """
+        if lambda_param <= 0:
+            raise ValueError("lambda debe ser positivo")
+        if lambda_param < POISSON_PTRS_THRESHOLD:
+            samples = DistributionTransformer.poisson_array(uniform_source(size), lambda_param)
+            stats = {"acceptance_rate": 1.0, "proposals": size}
+        else:
+            propose = DistributionTransformer._ptrs_proposal(lambda_param)
+            samples, stats = _rejection_sample(propose, size, uniform_source, 2, np.int64, expected_rate=0.85)
+        return (samples, stats) if return_stats else samples
+
+    @staticmethod
+    def sample_poisson_each(means, uniform_source):
+        """Un valor de Poisson por cada media de means (>= 0) en una sola llamada.
+
+        Las medias pequeñas se invierten término a término con un uniforme cada una; las grandes se
+        proponen juntas con PTRS y solo las rechazadas vuelven a proponerse. Pensado para muchas
+        medias distintas, donde no compensa cachear una tabla por lambda.
+        """
+        means = np.asarray(means, dtype=np.float64)
+        if np.any(means < 0):
+            raise ValueError("Las medias deben ser no negativas")
+        out = np.zeros(len(means), dtype=np.int64)
+
+        small = np.flatnonzero((means > 0) & (means < POISSON_PTRS_THRESHOLD))
+        if len(small):
+            lam = means[small]
+            u = np.asarray(uniform_source(len(small)), dtype=np.float64)
+            k = np.zeros(len(small), dtype=np.int64)
+            p = np.exp(-lam)
+            F = p.copy()
+            active = (u > F) & (p > 0)
+            while active.any():
+                k[active] += 1
+                p[active] *= lam[active] / k[active]
+                F[active] += p[active]
+                active &= (u > F) & (p > 0)
+            out[small] = k
+
+        pending = np.flatnonzero(means >= POISSON_PTRS_THRESHOLD)
+        while len(pending):
+            u, v = np.asarray(uniform_source(2 * len(pending)), dtype=np.float64).reshape(len(pending), 2).T
+            k, accepted = DistributionTransformer._ptrs_accept(u, v, means[pending])
+            out[pending[accepted]] = k[accepted]
+            pending = pending[~accepted]
+        return out
+
+    @staticmethod
+    def binomial_array(uniform_numbers, n, p, out=None):
+        """Binomial por inversión: una búsqueda binaria en la acumulada (cacheada por n y p) para todo el array."""
+        if not 0 <= p <= 1:
+            raise ValueError("p debe estar entre 0 y 1")
+        numbers = np.asarray(uniform_numbers, dtype=np.float64)
+        out = DistributionTransformer._output(out, len(numbers), np.int64)
+        if p == 1:
+            out.fill(n)
+            return out
+        offset, cdf = _binomial_table(int(n), float(p))
+        np.minimum(np.searchsorted(cdf, numbers, side="left"), len(cdf) - 1, out=out)
+        out += offset
+        return out
+
+    @staticmethod
+    def _btpe_proposal(n, p):
+        """Propuesta vectorizada de BTPE (Kachitvichyanukul y Schmeiser, 1988) para p <= 0.5."""
+        q = 1 - p
+        nrq = n * p * q
+        fm = n * p + p
+        m = np.floor(fm)
+        p1 = np.floor(2.195 * sqrt(nrq) - 4.6 * q) + 0.5
+        xm = m + 0.5
+        xl = xm - p1
+        xr = xm + p1
+        c = 0.134 + 20.5 / (15.3 + m)
+        a = (fm - xl) / (fm - xl * p)
+        laml = a * (1 + a / 2)
+        a = (xr - fm) / (xr * q)
+        lamr = a * (1 + a / 2)
+        p2 = p1 * (1 + 2 * c)
+        p3 = p2 + c / laml
+        p4 = p3 + c / lamr
+        log_fm = lgamma(m + 1) + lgamma(n - m + 1)
+
+        def propose(u, v):
+            u = np.clip(u, SAFE_LOWER, SAFE_UPPER) * p4
+            v = np.clip(v, SAFE_LOWER, SAFE_UPPER)
+            y = np.floor(xm - p1 * v + u)  # Región triangular central: aceptación inmediata
+            valid = np.ones(len(u), dtype=bool)
+
+            parallelogram = (u > p1) & (u <= p2)
+            x = xl + (u[parallelogram] - p1) / c
+            v[parallelogram] = v[parallelogram] * c + 1 - np.abs(m - x + 0.5) / p1
+            valid[parallelogram] = (v[parallelogram] > 0) & (v[parallelogram] <= 1)
+            y[parallelogram] = np.floor(x)
+
+            left = (u > p2) & (u <= p3)
+            y[left] = np.floor(xl + np.log(v[left]) / laml)
+            valid[left] = y[left] >= 0
+            v[left] = v[left] * (u[left] - p2) * laml
+
+            right = u > p3
+            y[right] = np.floor(xr - np.log(v[right]) / lamr)
+            valid[right] = y[right] <= n
+            v[right] = v[right] * (u[right] - p3) * lamr
+
+            pending = (u > p1) & valid
+            accepted = ~pending & valid
+            yp = np.clip(y[pending], 0, n)
+            log_v = np.log(np.where(valid, v, 1.0)[pending])  # Los v <= 0 ya están rechazados
+            k = np.abs(yp - m)
+            squeeze = (k > 20) & (k < nrq / 2 - 1)
+            rho = (k / nrq) * ((k * (k / 3 + 0.625) + 0.1666666666666) / nrq + 0.5)
+            t = -k * k / (2 * nrq)
+            decided_accept = squeeze & (log_v < t - rho)
+            decided_reject = squeeze & (log_v > t + rho)
+            # Prueba exacta con el cociente f(y)/f(m) de la función de probabilidad
+            exact = ~decided_accept & ~decided_reject
+            log_ratio = log_fm - _log_factorial(yp[exact]) - _log_factorial(n - yp[exact]) + (yp[exact] - m) * log(p / q)
+            decision = decided_accept.copy()
+            decision[exact] = log_v[exact] <= log_ratio
+            accepted[pending] = decision
+            return y[accepted].astype(np.int64)
+
+        return propose
+
+    @staticmethod
+    def sample_binomial(n, p, size, uniform_source, return_stats=False):
+        """Genera exactamente size valores binomiales pidiendo uniformes a uniform_source(n).
+
+        Elige el método según (n, p): para p > 0.5 se muestrea n - X con X ~ B(n, 1-p); con
+        n*p pequeño se invierte la tabla cacheada y desde BINOMIAL_BTPE_THRESHOLD se usa BTPE.
+        """
+        if n < 0 or not 0 <= p <= 1:
+            raise ValueError("n debe ser no negativo y p debe estar entre 0 y 1")
+        if p > 0.5:
+            samples, stats = DistributionTransformer.sample_binomial(n, 1 - p, size, uniform_source, True)
+            samples = n - samples
+        elif p == 0 or n == 0:
+            samples, stats = np.zeros(size, dtype=np.int64), {"acceptance_rate": 1.0, "proposals": 0}
+        elif n * p < BINOMIAL_BTPE_THRESHOLD:
+            samples = DistributionTransformer.binomial_array(uniform_source(size), n, p)
+            stats = {"acceptance_rate": 1.0, "proposals": size}
+        else:
+            propose = DistributionTransformer._btpe_proposal(n, p)
+            samples, stats = _rejection_sample(propose, size, uniform_source, 2, np.int64, expected_rate=0.8)
+        return (samples, stats) if return_stats else samples
+
+    @staticmethod
+    def gamma_array(uniform_numbers, alpha, beta=1.0, out=None):
+        """Gamma vectorizada; para alpha >= 1 devuelve solo los pares aceptados (out no aplica)."""
         if alpha <= 0 or beta <= 0:
             raise ValueError("alpha y beta deben ser positivos")
-            
+
         # Para alpha < 1, usamos el método de Weibull
         if alpha < 1:
-            c = 1/alpha
-            transformed = []
-            for u in uniform_numbers:
-                u_safe = DistributionTransformer._safe_uniform(u)
-                x = (-log(1-u_safe))**(1/c)
-                transformed.append(x * beta)
-            return transformed
-            
-        # Para alpha >= 1, mantener el método actual con protecciones
-        def gamma_transform(u1, u2):
-            u1_safe = DistributionTransformer._safe_uniform(u1)
-            u2_safe = DistributionTransformer._safe_uniform(u2)
-            
-            y = -log(u1_safe)
-            z = -log(u2_safe) / alpha
-            if z <= 0:
-                return None
-            if y >= (alpha - 1) * (z - log(z) - 1):
-                return z * beta
-            return None
-    
-        transformed = []
-        i = 0
-        while i < len(uniform_numbers) - 1:
-            result = gamma_transform(uniform_numbers[i], uniform_numbers[i+1])
-            if result is not None:
-                transformed.append(result)
-            i += 2
-        return transformed
-    
+            c = 1 / alpha
+            safe = DistributionTransformer._safe_array(uniform_numbers)
+            out = DistributionTransformer._output(out, len(safe), np.float64)
+            np.subtract(1, safe, out=out)
+            np.negative(np.log(out, out=out), out=out)
+            np.power(out, 1 / c, out=out)
+            out *= beta
+            return out
+
+        u1, u2 = DistributionTransformer._pairs(DistributionTransformer._safe_array(uniform_numbers))
+        y = -np.log(u1)
+        z = -np.log(u2) / alpha
+        accepted = (z > 0) & (y >= (alpha - 1) * (z - np.log(z) - 1))
+        return z[accepted] * beta
+
     @staticmethod
-    def beta(uniform_numbers, alpha, beta):
-        """Transforma números uniformes a distribución beta."""
+    def beta_array(uniform_numbers, alpha, beta):
+        """Beta por aceptación-rechazo vectorizada; devuelve solo los pares aceptados."""
         if len(uniform_numbers) < 2:
             raise ValueError("Se necesitan al menos 2 números para distribución beta.")
-            
-        transformed = []
-        for i in range(0, len(uniform_numbers) - 1, 2):
-            # Usar método de aceptación-rechazo
-            u1, u2 = uniform_numbers[i:i+2]
-            x = u1 ** (1/alpha)
-            y = u2 ** (1/beta)
-            if x + y <= 1:
-                transformed.append(x / (x + y))
-        return transformed
+        u1, u2 = DistributionTransformer._pairs(uniform_numbers)
+        x = u1 ** (1 / alpha)
+        y = u2 ** (1 / beta)
+        accepted = (x + y <= 1) & (x + y > 0)
+        return x[accepted] / (x[accepted] + y[accepted])
+
+    @staticmethod
+    def _marsaglia_tsang_proposal(alpha):
+        """Propuesta vectorizada de Marsaglia-Tsang; para alpha < 1 se usa Gamma(alpha + 1) * U^(1/alpha).
+
+        Cada fila de uniformes plantea dos propuestas con los dos normales de un par de Box-Muller.
+        Devuelve (propose, uniformes por fila): 4, o 6 para alpha < 1 por los dos factores U.
+        """
+        boost = alpha < 1
+        d = (alpha + 1 if boost else alpha) - 1 / 3
+        c = 1 / sqrt(9 * d)
+
+        def propose(u1, u2, *rest):
+            radius = np.sqrt(-2 * np.log(np.clip(u1, SAFE_LOWER, SAFE_UPPER)))
+            angle = 2 * pi * u2
+            x = np.column_stack((radius * np.cos(angle), radius * np.sin(angle))).ravel()
+            u3 = np.clip(np.column_stack(rest[:2]).ravel(), SAFE_LOWER, SAFE_UPPER)
+            v = (1 + c * x) ** 3
+            positive = v > 0
+            log_v = np.log(np.where(positive, v, 1))
+            x2 = x * x
+            accepted = positive & ((u3 < 1 - 0.0331 * x2 * x2) | (np.log(u3) < 0.5 * x2 + d * (1 - v + log_v)))
+            samples = d * v[accepted]
+            if boost:
+                u4 = np.column_stack(rest[2:]).ravel()
+                samples *= np.clip(u4[accepted], SAFE_LOWER, SAFE_UPPER) ** (1 / alpha)
+            return samples
+
+        return propose, 6 if boost else 4
+
+    @staticmethod
+    def sample_gamma(alpha, beta, size, uniform_source, return_stats=False):
+        """Genera exactamente size valores Gamma(alpha, escala beta) con Marsaglia-Tsang.
+
+        Los uniformes se piden a uniform_source(n) por lotes hasta completar la muestra; las
+        estadísticas incluyen la tasa de aceptación observada.
+        """
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha y beta deben ser positivos")
+        propose, per_row = DistributionTransformer._marsaglia_tsang_proposal(alpha)
+        samples, stats = _rejection_sample(propose, size, uniform_source, per_row, np.float64, 0.95, proposals_per_row=2)
+        samples *= beta
+        return (samples, stats) if return_stats else samples
+
+    @staticmethod
+    def sample_beta(alpha, beta, size, uniform_source, return_stats=False):
+        """Genera exactamente size valores Beta(alpha, beta) como X / (X + Y) con X, Y gamma independientes."""
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha y beta deben ser positivos")
+        x, x_stats = DistributionTransformer.sample_gamma(alpha, 1.0, size, uniform_source, True)
+        y, y_stats = DistributionTransformer.sample_gamma(beta, 1.0, size, uniform_source, True)
+        samples = x / (x + y)
+        proposals = x_stats["proposals"] + y_stats["proposals"]
+        accepted = x_stats["acceptance_rate"] * x_stats["proposals"] + y_stats["acceptance_rate"] * y_stats["proposals"]
+        stats = {"acceptance_rate": accepted / proposals if proposals else 1.0, "proposals": proposals}
+        return (samples, stats) if return_stats else samples
+
+    @staticmethod
+    def gamma_from_uniforms(uniform_numbers, alpha, beta=1.0):
+        """Gamma de Marsaglia-Tsang usando solo los uniformes dados, sin pedir más al generador.
+
+        Devuelve los valores aceptados, menos que uniformes: unos dos por cada 4 uniformes (6 si alpha < 1).
+        """
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha y beta deben ser positivos")
+        propose, per_row = DistributionTransformer._marsaglia_tsang_proposal(alpha)
+        if len(uniform_numbers) < per_row:
+            raise ValueError(f"Se necesitan al menos {per_row} números para distribución gamma con alpha={alpha}.")
+        return _accepted_from(propose, uniform_numbers, per_row) * beta
+
+    @staticmethod
+    def beta_from_uniforms(uniform_numbers, alpha, beta):
+        """Beta como X / (X + Y) usando solo los uniformes dados: X sale de la primera mitad e Y de la segunda.
+
+        Devuelve tantos valores como pares (X, Y) aceptados permiten ambas mitades.
+        """
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha y beta deben ser positivos")
+        numbers = np.asarray(uniform_numbers, dtype=np.float64)
+        half = len(numbers) // 2
+        x = DistributionTransformer.gamma_from_uniforms(numbers[:half], alpha)
+        y = DistributionTransformer.gamma_from_uniforms(numbers[half:2 * half], beta)
+        k = min(len(x), len(y))
+        return x[:k] / (x[:k] + y[:k])
+
+    @staticmethod
+    def box_muller(uniform_numbers):
+        """Transforma números uniformes a distribución normal usando Box-Muller."""
+        return DistributionTransformer.box_muller_array(uniform_numbers).tolist()
+
+    @staticmethod
+    def exponential(uniform_numbers, lambda_param=1.0):
+        """Transforma números uniformes a distribución exponencial."""
+        return DistributionTransformer.exponential_array(uniform_numbers, lambda_param).tolist()
+
+    @staticmethod
+    def poisson(uniform_numbers, lambda_param=1.0):
+        """Transforma números uniformes a distribución de Poisson."""
+        return DistributionTransformer.poisson_array(uniform_numbers, lambda_param).tolist()
+
+    @staticmethod
+    def binomial(uniform_numbers, n, p):
+        """Transforma números uniformes a distribución binomial."""
+        return DistributionTransformer.binomial_array(uniform_numbers, n, p).tolist()
+
+    @staticmethod
+    def gamma(uniform_numbers, alpha, beta=1.0):
+        """Transforma números uniformes a distribución gamma."""
+        return DistributionTransformer.gamma_array(uniform_numbers, alpha, beta).tolist()
+
+    @staticmethod
+    def beta(uniform_numbers, alpha, beta):
+        """Transforma números uniformes a distribución beta."""
+        return DistributionTransformer.beta_array(uniform_numbers, alpha, beta).tolist()
@@ -0,0 +1,214 @@
+from math import log
+import numpy as np
+from model._dis_transform import DistributionTransformer, UniformStream
+from model._compartmental import sir_model
+
+DEFAULT_QUANTILES = (0.05, 0.95)
+
+def simulate_sir(infection_numbers, recovery_numbers, population, initial_infected, initial_recovered, beta, gamma):
+    """Simula R trayectorias SIR a la vez a partir de multiplicadores aleatorios con forma (R, pasos).
+
+    Cada paso actualiza todas las réplicas con operaciones vectorizadas y reproduce la regla de la
+    simulación de una sola trayectoria (transiciones truncadas a enteros y población renormalizada).
+    Devuelve los arrays S, I, R con forma (R, pasos + 1).
+    """
+    infection_numbers = np.atleast_2d(infection_numbers)
+    recovery_numbers = np.atleast_2d(recovery_numbers)
+    replicates, steps = infection_numbers.shape
+    shape = (replicates, steps + 1)
+    S = np.empty(shape, dtype=np.int64)
+    I = np.empty(shape, dtype=np.int64)
+    R = np.empty(shape, dtype=np.int64)
+    S[:, 0] = population - initial_infected - initial_recovered
+    I[:, 0] = initial_infected
+    R[:, 0] = initial_recovered
+
+    for step in range(steps):
+        current_S, current_I, current_R = S[:, step], I[:, step], R[:, step]
+        infections = np.clip(infection_numbers[:, step] * beta * current_S * current_I / population, 0, current_S).astype(np.int64)
+        recoveries = np.clip(recovery_numbers[:, step] * gamma * current_I, 0, current_I).astype(np.int64)
+
+        next_S = np.maximum(0, current_S - infections)
+        next_I = np.maximum(0, current_I + infections - recoveries)
+        next_R = np.maximum(0, current_R + recoveries)
+
+        # Normalizar población en las réplicas con algún individuo
+        total = next_S + next_I + next_R
+        alive = total > 0
+        factor = population / np.where(alive, total, 1)
+        S[:, step + 1] = np.where(alive, (next_S * factor).astype(np.int64), next_S)
+        I[:, step + 1] = np.where(alive, (next_I * factor).astype(np.int64), next_I)
+        R[:, step + 1] = np.where(alive, (next_R * factor).astype(np.int64), next_R)
+
+    return S, I, R
+
+def ensemble_bands(trajectories, quantiles=DEFAULT_QUANTILES):
+    """Media, mediana y bandas de cuantiles por instante de tiempo de un array (R, pasos)."""
+    lower, median, upper = np.quantile(trajectories, [quantiles[0], 0.5, quantiles[1]], axis=0)
+    return {
+        "mean": trajectories.mean(axis=0),
+        "median": median,
+        "lower": lower,
+        "upper": upper,
+        "quantiles": tuple(quantiles)
+    }
+
+EVENT_METHODS = ("gamma", "ssa", "tau_leaping", "auto", "ode", "binomial_chain")
+SSA_POPULATION_LIMIT = 10_000  # En modo "auto", poblaciones mayores usan tau-leaping
+TAU_EPSILON = 0.03  # Cambio relativo máximo de las propensiones en un salto
+SSA_FALLBACK_FACTOR = 10  # Si tau < factor / a0 se hacen pasos exactos en lugar de un salto
+SSA_FALLBACK_STEPS = 100
+
+class _Trajectory:
+    """Arrays preasignados de tiempos y estados (S, I) que duplican su capacidad al llenarse."""
+
+    def __init__(self, capacity=1024):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.states = np.empty((capacity, 2), dtype=np.int64)
+        self.size = 0
+
+    def append(self, time, S, I):
+        if self.size == len(self.times):
+            self.times = np.resize(self.times, 2 * self.size)
+            self.states = np.resize(self.states, (2 * self.size, 2))
+        self.times[self.size] = time
+        self.states[self.size] = S, I
+        self.size += 1
+
+    def arrays(self):
+        return self.times[:self.size], self.states[:self.size, 0], self.states[:self.size, 1]
+
+def _ssa_steps(S, I, t, population, beta, gamma, t_end, stream, trajectory, max_events):
+    """Avanza hasta max_events eventos exactos de Gillespie (o hasta t_end) y devuelve el nuevo estado."""
+    for _ in range(max_events):
+        infection_rate = beta * S * I / population
+        total_rate = infection_rate + gamma * I
+        if total_rate <= 0:
+            return S, I, t_end
+        t -= log(1.0 - stream.next()) / total_rate
+        if t > t_end:
+            return S, I, t_end
+        if stream.next() * total_rate < infection_rate:
+            S -= 1
+            I += 1
+        else:
+            I -= 1
+        trajectory.append(t, S, I)
+    return S, I, t
+
+def gillespie_sir(population, initial_infected, initial_recovered, beta, gamma, days, uniform_source):
+    """Algoritmo exacto de Gillespie (SSA) para el SIR estocástico en tiempo continuo.
+
+    Devuelve los instantes de los eventos y los arrays S, I, R en cada uno.
+    """
+    stream = UniformStream(uniform_source)
+    trajectory = _Trajectory()
+    S, I = population - initial_infected - initial_recovered, initial_infected
+    trajectory.append(0.0, S, I)
+    t = 0.0
+    while t < days:
+        S, I, t = _ssa_steps(S, I, t, population, beta, gamma, days, stream, trajectory, SSA_FALLBACK_STEPS)
+    times, S_path, I_path = trajectory.arrays()
+    return times, S_path, I_path, population - S_path - I_path
+
+def _leap_size(S, I, infection_rate, recovery_rate, epsilon):
+    """Selección de tau de Cao, Gillespie y Petzold: acota el cambio relativo esperado de S e I."""
+    tau = float("inf")
+    # S solo cambia por infecciones (reacción de segundo orden en S e I: g = 2)
+    for x, mean, variance, order in ((S, -infection_rate, infection_rate, 2), (I, infection_rate - recovery_rate, infection_rate + recovery_rate, 2)):
+        bound = max(epsilon * x / order, 1.0)
+        if mean != 0:
+            tau = min(tau, bound / abs(mean))
+        if variance > 0:
+            tau = min(tau, bound * bound / variance)
+    return tau
+
+def tau_leaping_sir(population, initial_infected, initial_recovered, beta, gamma, days, uniform_source, epsilon=TAU_EPSILON):
+    """Tau-leaping adaptativo para el SIR estocástico; recurre a pasos exactos cuando el salto sería muy corto.
+
+    En cada salto los números de infecciones y recuperaciones son Poisson con media propensión * tau; si
+    algún compartimento quedaría negativo el salto se rechaza y se repite con la mitad de tau.
+    """
+    stream = UniformStream(uniform_source)
+    trajectory = _Trajectory()
+    S, I = population - initial_infected - initial_recovered, initial_infected
+    trajectory.append(0.0, S, I)
+    t = 0.0
+    while t < days and I > 0:
+        infection_rate = beta * S * I / population
+        recovery_rate = gamma * I
+        total_rate = infection_rate + recovery_rate
+        tau = _leap_size(S, I, infection_rate, recovery_rate, epsilon)
+        if tau < SSA_FALLBACK_FACTOR / total_rate:
+            S, I, t = _ssa_steps(S, I, t, population, beta, gamma, days, stream, trajectory, SSA_FALLBACK_STEPS)
+            continue
+        tau = min(tau, days - t)
+        while True:
+            infections, recoveries = DistributionTransformer.sample_poisson_each((infection_rate * tau, recovery_rate * tau), stream.take)
+            if infections <= S and recoveries <= I + infections:
+                break
+            tau /= 2
+        S -= infections
+        I += infections - recoveries
+        t += tau
+        trajectory.append(t, S, I)
+    times, S_path, I_path = trajectory.arrays()
+    return times, S_path, I_path, population - S_path - I_path
+
+def resample_to_grid(event_times, values, grid):
+    """Estado de una trayectoria a saltos en cada instante de grid (último evento anterior o igual)."""
+    indices = np.searchsorted(event_times, grid, side="right") - 1
+    return values[np.maximum(indices, 0)]
+
+def gamma_multipliers(count, alpha, uniform_source):
+    """Devuelve exactamente count multiplicadores gamma(alpha, 1) para la regla por pasos."""
+    if alpha < 1:
+        # Transformación directa: un uniforme por valor, sin rechazo
+        return DistributionTransformer.gamma_array(uniform_source(count), alpha, 1.0)
+    return DistributionTransformer.sample_gamma(alpha, 1.0, count, uniform_source)
+
+def simulate_epidemic(population, initial_infected, initial_recovered, beta, gamma, days, dt, uniform_source,
+                      replicates=1, method="gamma"):
+    """Simula replicates trayectorias SIR con el método indicado, sin dibujar nada.
+
+    Devuelve la rejilla de tiempos de paso dt, los arrays S, I, R con forma (replicates, pasos + 1)
+    y el método usado ("auto" se resuelve según la población).
+    """
+    if method not in EVENT_METHODS:
+        raise ValueError(f"Método de simulación no válido. Debe ser uno de: {', '.join(EVENT_METHODS)}")
+    if method == "auto":
+        method = "ssa" if population <= SSA_POPULATION_LIMIT else "tau_leaping"
+
+    steps = int(days / dt)
+    grid = np.arange(steps + 1) * dt
+
+    if method == "gamma":
+        # Números gamma para modelar tiempos entre eventos (uno por paso y réplica)
+        infection_numbers = gamma_multipliers(replicates * steps, beta * dt, uniform_source).reshape(replicates, steps)
+        recovery_numbers = gamma_multipliers(replicates * steps, gamma * dt, uniform_source).reshape(replicates, steps)
+
+        # Simulación de todas las réplicas a la vez
+        S, I, R = simulate_sir(infection_numbers, recovery_numbers, population, initial_infected, initial_recovered, beta, gamma)
+        return grid, S, I, R, method
+
+    if method in ("ode", "binomial_chain"):
+        # Motor compartimental: ecuaciones diferenciales (idénticas en todas las réplicas) o cadena binomial
+        model = sir_model()
+        initial = {"S": population - initial_infected - initial_recovered, "I": initial_infected, "R": initial_recovered}
+        integrator = "deterministic" if method == "ode" else "binomial_chain"
+        runs = 1 if method == "ode" else replicates
+        states = np.array([
+            model.simulate(initial, {"beta": beta, "gamma": gamma}, days, dt, integrator, uniform_source)[1]
+            for _ in range(runs)
+        ])
+        S, I, R = (np.repeat(states[:, :, i], replicates // runs, axis=0) for i in range(3))
+        return grid, S, I, R, method
+
+    # Motor por eventos en tiempo continuo; cada réplica se muestrea en la rejilla de paso dt
+    engine = gillespie_sir if method == "ssa" else tau_leaping_sir
+    paths = []
+    for _ in range(replicates):
+        event_times, *compartments = engine(population, initial_infected, initial_recovered, beta, gamma, days, uniform_source)
+        paths.append([resample_to_grid(event_times, values, grid) for values in compartments])
+    S, I, R = (np.array(compartment) for compartment in zip(*paths))
+    return grid, S, I, R, method
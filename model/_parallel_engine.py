@@ -0,0 +1,166 @@
+import os
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from sympy import Symbol, lambdify, sympify
+from model._custom_generators import create_generator, generate_block
+from model._streaming_stats import RunningMoments
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+NON_DETERMINISTIC_ALGORITHMS = {"ruido_fisico"}
+SEEDED_SUBSTREAM_ALGORITHMS = {"mersenne"}  # Sin salto eficiente: cada bloque usa una semilla derivada e independiente
+
+def can_run_in_parallel(algorithm, seed=12345, **kwargs):
+    """Indica si el algoritmo puede repartirse entre procesos sin alterar la secuencia serial."""
+    if algorithm in NON_DETERMINISTIC_ALGORITHMS:
+        return True
+    return hasattr(create_generator(algorithm, seed, **kwargs), "jump")
+
+def _fill_chunk(shm_name, total, start, length, algorithm, seed, kwargs, substream=None):
+    """Genera un bloque de la secuencia directamente sobre la memoria compartida.
+
+    Con substream (índice del bloque) el generador parte de una semilla derivada en lugar de saltar a start.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        began = perf_counter()
+        if substream is not None:
+            generator = create_generator(algorithm, _substream_seed(seed, substream), **kwargs)
+        else:
+            generator = create_generator(algorithm, seed, **kwargs)
+            if hasattr(generator, "jump"):
+                generator.jump(start)  # Subsecuencia determinista: mismo tramo que en la ejecución serial
+        output = np.ndarray((total,), dtype=np.float64, buffer=shm.buf)
+        output[start:start + length] = generate_block(generator, length)
+        elapsed = perf_counter() - began
+        del output
+    finally:
+        shm.close()
+    return {"worker": os.getpid(), "start": start, "count": length, "seconds": elapsed}
+
+def _throughput_by_worker(chunk_stats):
+    """Agrupa las estadísticas de los bloques por proceso y calcula números por segundo."""
+    totals = {}
+    for stats in chunk_stats:
+        count, seconds = totals.get(stats["worker"], (0, 0.0))
+        totals[stats["worker"]] = (count + stats["count"], seconds + stats["seconds"])
+    return [
+        {"worker": worker, "count": count, "seconds": seconds,
+         "numbers_per_sec": count / seconds if seconds > 0 else float("inf")}
+        for worker, (count, seconds) in totals.items()
+    ]
+
+def generate_parallel(count, algorithm, seed=12345, kwargs=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, substreams=True):
+    """Genera count números repartiendo bloques entre procesos que escriben en un único array compartido.
+
+    Los generadores con salto producen exactamente la secuencia serial. Mersenne Twister no tiene salto
+    eficiente: cada bloque usa una semilla derivada con SeedSequence, lo que da una secuencia reproducible
+    (independiente del número de procesos) pero distinta de la serial. Con substreams=False se genera en un
+    solo proceso y se obtiene la secuencia serial. "mode" indica la estrategia usada: "jump", "substreams" o "serial".
+    """
+    kwargs = kwargs or {}
+    workers = workers or os.cpu_count() or 1
+    began = perf_counter()
+
+    use_substreams = substreams and algorithm in SEEDED_SUBSTREAM_ALGORITHMS
+    if workers == 1 or count <= chunk_size or not (use_substreams or can_run_in_parallel(algorithm, seed, **kwargs)):
+        # Sin subsecuencias deterministas el único modo reproducible es la generación serial
+        generator = create_generator(algorithm, seed, **kwargs)
+        numbers = generate_block(generator, count)
+        elapsed = perf_counter() - began
+        chunk_stats = [{"worker": os.getpid(), "start": 0, "count": count, "seconds": elapsed}]
+        return {"numbers": numbers, "workers": 1, "mode": "serial", "seconds": elapsed,
+                "throughput": _throughput_by_worker(chunk_stats)}
+
+    shm = shared_memory.SharedMemory(create=True, size=count * np.dtype(np.float64).itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_fill_chunk, shm.name, count, start, min(chunk_size, count - start), algorithm, seed, kwargs,
+                                index if use_substreams else None)
+                for index, start in enumerate(range(0, count, chunk_size))
+            ]
+            chunk_stats = [future.result() for future in futures]
+        numbers = np.ndarray((count,), dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    elapsed = perf_counter() - began
+    return {"numbers": numbers, "workers": workers, "mode": "substreams" if use_substreams else "jump", "seconds": elapsed,
+            "throughput": _throughput_by_worker(chunk_stats)}
+
+def _chunk_moments(f, generator, a, b, start, length):
+    """Evalúa f sobre los siguientes length puntos del generador y devuelve los momentos del bloque."""
+    began = perf_counter()
+    x_random = generate_block(generator, length) * (b - a) + a
+    values = np.broadcast_to(np.asarray(f(x_random), dtype=np.float64), x_random.shape)
+    moments = RunningMoments.from_values(values)
+    return {"worker": os.getpid(), "start": start, "count": length, "seconds": perf_counter() - began,
+            "mean": moments.mean, "m2": moments.m2}
+
+def _substream_seed(seed, index):
+    """Semilla de 32 bits para el bloque index, derivada de la semilla base con SeedSequence."""
+    return int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+
+def _chunk_generator(algorithm, seed, kwargs, index, start):
+    """Generador propio de un bloque: el tramo [start, ...) de la secuencia o una subsecuencia con semilla derivada."""
+    if algorithm in SEEDED_SUBSTREAM_ALGORITHMS:
+        return create_generator(algorithm, _substream_seed(seed, index), **kwargs)
+    generator = create_generator(algorithm, seed, **kwargs)
+    if hasattr(generator, "jump"):
+        generator.jump(start)  # Tramo [start, start + length) de la secuencia serial: sin solapamientos
+    return generator
+
+def _integrate_chunk(expression, a, b, index, start, length, algorithm, seed, kwargs):
+    """Evalúa un bloque de la integral sobre su subsecuencia y devuelve sus momentos parciales."""
+    f = lambdify(Symbol('x'), sympify(expression), 'numpy')
+    return _chunk_moments(f, _chunk_generator(algorithm, seed, kwargs, index, start), a, b, start, length)
+
+def integrate_parallel(expression, a, b, n_points, algorithm, seed=12345, kwargs=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Integral Monte Carlo de expression en [a, b] repartiendo bloques entre procesos.
+
+    Los bloques se definen por chunk_size y se combinan en orden, así que el resultado para una semilla
+    no depende del número de procesos.
+    """
+    kwargs = kwargs or {}
+    workers = workers or os.cpu_count() or 1
+    expression = str(expression)
+    began = perf_counter()
+    chunks = [(start, min(chunk_size, n_points - start)) for start in range(0, n_points, chunk_size)]
+
+    splittable = algorithm in SEEDED_SUBSTREAM_ALGORITHMS or can_run_in_parallel(algorithm, seed, **kwargs)
+    if not splittable:
+        # Sin subsecuencias la secuencia se consume en orden en un solo proceso
+        workers = 1
+        f = lambdify(Symbol('x'), sympify(expression), 'numpy')
+        generator = create_generator(algorithm, seed, **kwargs)
+        chunk_stats = [_chunk_moments(f, generator, a, b, start, length) for start, length in chunks]
+    elif workers == 1 or len(chunks) == 1:
+        workers = 1
+        chunk_stats = [_integrate_chunk(expression, a, b, index, start, length, algorithm, seed, kwargs)
+                       for index, (start, length) in enumerate(chunks)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_integrate_chunk, expression, a, b, index, start, length, algorithm, seed, kwargs)
+                for index, (start, length) in enumerate(chunks)
+            ]
+            chunk_stats = [future.result() for future in futures]
+
+    total = RunningMoments()
+    for stats in chunk_stats:
+        total.merge(RunningMoments(stats["count"], stats["mean"], stats["m2"]))
+    width = b - a
+    return {
+        "result": float(width * total.mean),
+        "error": float(width * total.standard_error()),
+        "n_points": total.count,
+        "a": a,
+        "b": b,
+        "expression": expression,
+        "workers": workers,
+        "elapsed": perf_counter() - began,
+        "throughput": _throughput_by_worker(chunk_stats)
+    }
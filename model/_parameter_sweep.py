@@ -0,0 +1,131 @@
+import os
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from model._custom_generators import create_generator, generate_block
+from model._epidemic import simulate_epidemic
+
+SWEEP_PARAMETERS = {"beta": np.float64, "gamma": np.float64, "population": np.int64, "seed": np.int64}
+SWEEP_RESULTS = ("peak_infected", "peak_time", "final_size")
+DEFAULT_BASE_PARAMS = {
+    "initial_infected": 1,
+    "initial_recovered": 0,
+    "beta": 0.3,
+    "gamma": 0.1,
+    "population": 1000,
+    "seed": 12345,
+    "days": 30,
+    "dt": 0.1,
+    "algorithm": "mersenne",
+    "method": "gamma"
+}
+CHECKPOINT_EVERY = 50  # Puntos completados entre dos guardados del checkpoint
+
+def parameter_grid(grid):
+    """Producto cartesiano de los valores de grid como columnas NumPy, en orden determinista."""
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parámetros de barrido no soportados: {', '.join(sorted(unknown))}. Deben ser: {', '.join(SWEEP_PARAMETERS)}")
+    names = [name for name in SWEEP_PARAMETERS if name in grid]
+    points = list(product(*(grid[name] for name in names)))
+    return {
+        name: np.array([point[i] for point in points], dtype=SWEEP_PARAMETERS[name])
+        for i, name in enumerate(names)
+    }
+
+def _simulate_point(index, params):
+    """Simula un punto del barrido sin gráficos y devuelve (índice, pico de infectados, día del pico, tamaño final)."""
+    generator = create_generator(params["algorithm"], params["seed"])
+    grid, _, I, R, _ = simulate_epidemic(
+        params["population"], params["initial_infected"], params["initial_recovered"], params["beta"], params["gamma"],
+        params["days"], params["dt"], lambda n: generate_block(generator, n), 1, params["method"])
+    peak = int(np.argmax(I[0]))
+    # Tamaño final: fracción de la población que se ha infectado a lo largo de la simulación
+    final_size = (R[0, -1] + I[0, -1] - params["initial_recovered"]) / params["population"]
+    return index, float(I[0, peak]), float(grid[peak]), float(final_size)
+
+def _empty_results(size):
+    results = {name: np.full(size, np.nan) for name in SWEEP_RESULTS}
+    results["completed"] = np.zeros(size, dtype=bool)
+    return results
+
+def _load_checkpoint(path, columns):
+    """Recupera los resultados de un checkpoint si corresponde a la misma rejilla de parámetros."""
+    if path is None or not os.path.exists(path):
+        return None
+    with np.load(path) as saved:
+        if set(saved.files) != set(columns) | set(SWEEP_RESULTS) | {"completed"}:
+            return None
+        if any(not np.array_equal(saved[name], values) for name, values in columns.items()):
+            return None
+        return {name: saved[name].copy() for name in (*SWEEP_RESULTS, "completed")}
+
+def _save_checkpoint(path, columns, results):
+    """Guarda columnas y resultados con np.savez mediante un archivo temporal y un reemplazo atómico."""
+    temporary = os.fspath(path) + ".tmp.npz"
+    np.savez(temporary, **columns, **results)
+    os.replace(temporary, path)
+
+def _prepare(grid, checkpoint):
+    """Columnas de parámetros y resultados iniciales (recuperados del checkpoint si existe)."""
+    columns = parameter_grid(grid)
+    size = len(next(iter(columns.values()))) if columns else 1
+    return columns, _load_checkpoint(checkpoint, columns) or _empty_results(size)
+
+def _sweep(columns, results, base_params, workers, checkpoint, checkpoint_every):
+    """Simula los puntos pendientes, rellena results y produce (índice, fila) a medida que terminan."""
+    base = {**DEFAULT_BASE_PARAMS, **(base_params or {})}
+    pending = [int(i) for i in np.flatnonzero(~results["completed"])]
+    completed = len(results["completed"]) - len(pending)  # Contador de puntos terminados, sin recorrer el array
+
+    def point(i):
+        return {**base, **{name: values[i].item() for name, values in columns.items()}}
+
+    def record(outcome):
+        nonlocal completed
+        index, *values = outcome
+        for name, value in zip(SWEEP_RESULTS, values):
+            results[name][index] = value
+        results["completed"][index] = True
+        completed += 1
+        if checkpoint is not None and completed % checkpoint_every == 0:
+            _save_checkpoint(checkpoint, columns, results)
+        return index, {**point(index), **{name: float(results[name][index]) for name in SWEEP_RESULTS}}
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        if workers == 1 or len(pending) <= 1:
+            for i in pending:
+                yield record(_simulate_point(i, point(i)))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = [executor.submit(_simulate_point, i, point(i)) for i in pending]
+                for future in as_completed(futures):
+                    yield record(future.result())
+            finally:
+                # Si el consumidor se detiene antes, los puntos aún no iniciados se cancelan en lugar de esperarlos
+                executor.shutdown(cancel_futures=True)
+    finally:
+        if checkpoint is not None:
+            _save_checkpoint(checkpoint, columns, results)
+
+def iter_sweep(grid, base_params=None, workers=None, checkpoint=None, checkpoint_every=CHECKPOINT_EVERY):
+    """Ejecuta el barrido en un grupo de procesos y produce (índice, fila) a medida que terminan los puntos.
+
+    Con checkpoint (ruta .npz) los resultados se guardan periódicamente y, al repetir la llamada con la
+    misma rejilla, solo se simulan los puntos pendientes.
+    """
+    columns, results = _prepare(grid, checkpoint)
+    yield from _sweep(columns, results, base_params, workers, checkpoint, checkpoint_every)
+
+def run_sweep(grid, base_params=None, workers=None, checkpoint=None, callback=None, checkpoint_every=CHECKPOINT_EVERY):
+    """Ejecuta todo el barrido y devuelve columnas NumPy de parámetros y resultados (una fila por punto).
+
+    callback(índice, fila) recibe cada resultado parcial en cuanto termina.
+    """
+    columns, results = _prepare(grid, checkpoint)
+    for index, row in _sweep(columns, results, base_params, workers, checkpoint, checkpoint_every):
+        if callback is not None:
+            callback(index, row)
+    return {**columns, **results}
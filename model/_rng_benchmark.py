@@ -0,0 +1,193 @@
+import os
+import csv
+import json
+import platform
+import argparse
+from datetime import datetime, timezone
+from time import perf_counter
+import numpy as np
+from model._custom_generators import PhysicalNoise, MersenneTwister, create_generator, generate_block
+from model._dis_transform import DistributionTransformer
+from model._compartmental import PRESETS, INTEGRATORS, create_model
+from model._statistical_tests import STATISTICAL_TESTS
+from ui.pages.distribution_page.method_config import METHOD_CONFIG
+
+DEFAULT_BATCH_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_SAMPLE_SIZE = 100_000
+BINOMIAL_CASES = ((10, 0.5), (1_000, 0.01), (1_000, 0.5), (100, 0.9), (1_000_000, 0.3))
+LEGACY_WORK_LIMIT = 2_000_000  # El método término a término es O(n*p) por muestra; se mide sobre una muestra menor
+MODEL_STEPS = 100_000
+MODEL_POPULATION = 1_000_000
+REPORT_FIELDS = ["kind", "algorithm", "batch_size", "seconds", "numbers_per_sec", "test", "statistic", "p_value"]
+
+def _timed(func, repeats):
+    """Devuelve el mejor tiempo de varias ejecuciones de func."""
+    best = float("inf")
+    for _ in range(repeats):
+        began = perf_counter()
+        func()
+        best = min(best, perf_counter() - began)
+    return best
+
+def benchmark_physical_noise(n=1_000_000, repeats=3):
+    """Compara la lectura de entropía por llamada con la lectura por bloques de PhysicalNoise."""
+    def per_call():
+        return [int.from_bytes(os.urandom(4), 'big') / (2**32) for _ in range(n)]
+
+    def buffered_next():
+        generator = PhysicalNoise()
+        return [generator.next() for _ in range(n)]
+
+    def buffered_array():
+        return PhysicalNoise().generate(n)
+
+    results = {}
+    for name, func in (("per_call", per_call), ("buffered_next", buffered_next), ("buffered_array", buffered_array)):
+        seconds = _timed(func, repeats)
+        results[name] = {"seconds": seconds, "numbers_per_sec": n / seconds}
+    return results
+
+def _legacy_binomial(uniform_numbers, n, p):
+    """Inversión término a término previa al motor binomial, conservada como referencia."""
+    samples = []
+    for u in uniform_numbers:
+        k = 0
+        prob = (1 - p) ** n
+        F = prob
+        while u > F and k < n:
+            k += 1
+            prob *= (n - k + 1) * p / (k * (1 - p))
+            F += prob
+        samples.append(k)
+    return samples
+
+def benchmark_binomial(cases=BINOMIAL_CASES, size=1_000_000, seed=12345, repeats=3):
+    """Compara el motor binomial (tabla cacheada o BTPE) con la inversión término a término."""
+    results = []
+    for n, p in cases:
+        engine_seconds = _timed(lambda: DistributionTransformer.sample_binomial(n, p, size, MersenneTwister(seed).generate_array), repeats)
+        legacy_size = max(10, min(size, int(LEGACY_WORK_LIMIT / (n * p + 1))))
+        uniforms = MersenneTwister(seed).generate_array(legacy_size).tolist()
+        legacy_seconds = _timed(lambda: _legacy_binomial(uniforms, n, p), 1)
+        for method, count, seconds in (("engine", size, engine_seconds), ("legacy", legacy_size, legacy_seconds)):
+            results.append({
+                "kind": "sampler",
+                "algorithm": f"binomial_{method}(n={n}, p={p})",
+                "batch_size": count,
+                "seconds": seconds,
+                "numbers_per_sec": count / seconds if seconds > 0 else float("inf")
+            })
+    return results
+
+def benchmark_compartmental(models=tuple(PRESETS), steps=MODEL_STEPS, population=MODEL_POPULATION, dt=0.1, seed=12345):
+    """Mide los pasos por segundo de cada modelo predefinido con ambos integradores."""
+    results = []
+    for name in models:
+        model = create_model(name)
+        initial = {compartment: 0 for compartment in model.compartments}
+        initial[model.compartments[0]] = population - 10
+        initial["I"] = 10
+        for integrator in INTEGRATORS:
+            began = perf_counter()
+            model.simulate(initial, days=steps * dt, dt=dt, integrator=integrator, uniform_source=MersenneTwister(seed).generate_array)
+            seconds = perf_counter() - began
+            results.append({
+                "kind": "model",
+                "algorithm": f"{name}_{integrator}",
+                "batch_size": steps,
+                "seconds": seconds,
+                "numbers_per_sec": steps / seconds if seconds > 0 else float("inf")
+            })
+    return results
+
+def benchmark_throughput(algorithm, batch_sizes=DEFAULT_BATCH_SIZES, seed=12345, repeats=3, **kwargs):
+    """Mide cuántos números por segundo produce un algoritmo para cada tamaño de lote."""
+    results = []
+    for batch_size in batch_sizes:
+        best = float("inf")
+        for _ in range(repeats):
+            generator = create_generator(algorithm, seed, **kwargs)
+            began = perf_counter()
+            generate_block(generator, batch_size)
+            best = min(best, perf_counter() - began)
+        results.append({
+            "kind": "throughput",
+            "algorithm": algorithm,
+            "batch_size": batch_size,
+            "seconds": best,
+            "numbers_per_sec": batch_size / best if best > 0 else float("inf")
+        })
+    return results
+
+def evaluate_quality(algorithm, sample_size=DEFAULT_SAMPLE_SIZE, seed=12345, **kwargs):
+    """Aplica todas las pruebas estadísticas a una muestra del algoritmo."""
+    numbers = generate_block(create_generator(algorithm, seed, **kwargs), sample_size)
+    return [
+        {"kind": "quality", "algorithm": algorithm, "batch_size": sample_size, "test": name, **test(numbers)}
+        for name, test in STATISTICAL_TESTS.items()
+    ]
+
+def run_benchmark(algorithms=None, batch_sizes=DEFAULT_BATCH_SIZES, sample_size=DEFAULT_SAMPLE_SIZE, seed=12345, repeats=3, samplers=False, models=False):
+    """Ejecuta las mediciones de velocidad y calidad y devuelve un informe serializable."""
+    algorithms = list(algorithms or METHOD_CONFIG.keys())
+    results = []
+    for algorithm in algorithms:
+        results.extend(benchmark_throughput(algorithm, batch_sizes, seed, repeats))
+        results.extend(evaluate_quality(algorithm, sample_size, seed))
+    if samplers:
+        results.extend(benchmark_binomial(size=sample_size, seed=seed, repeats=repeats))
+    if models:
+        results.extend(benchmark_compartmental(seed=seed))
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "sample_size": sample_size,
+            "batch_sizes": list(batch_sizes),
+            "repeats": repeats
+        },
+        "results": results
+    }
+
+def write_report(report, path):
+    """Guarda el informe como JSON o CSV según la extensión del archivo."""
+    path = os.fspath(path)
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            for row in report["results"]:
+                writer.writerow({field: row.get(field, "") for field in REPORT_FIELDS})
+    else:
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Velocidad y calidad estadística de los generadores de números aleatorios.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(METHOD_CONFIG.keys()))
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--sample-size", type=int, default=DEFAULT_SAMPLE_SIZE)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--samplers", action="store_true", help="Incluir los muestreadores de distribuciones")
+    parser.add_argument("--models", action="store_true", help=f"Incluir los modelos compartimentales ({MODEL_STEPS:,} pasos)")
+    parser.add_argument("--output", help="Ruta del informe (.json o .csv)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.algorithms, args.batch_sizes, args.sample_size, args.seed, args.repeats, args.samplers, args.models)
+    for row in report["results"]:
+        if row["kind"] in ("throughput", "sampler"):
+            print(f"{row['algorithm']:>28} | lote {row['batch_size']:>9,} | {row['numbers_per_sec']:>14,.0f} números/s")
+        elif row["kind"] == "model":
+            print(f"{row['algorithm']:>28} | {row['batch_size']:>9,} pasos | {row['numbers_per_sec']:>11,.0f} pasos/s")
+        else:
+            print(f"{row['algorithm']:>28} | {row['test']:>18} | p = {row['p_value']:.4f}")
+    if args.output:
+        print(f"Informe guardado en {write_report(report, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from copy import deepcopy
+import numpy as np
+from model._custom_generators import create_generator, generate_block
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+NON_DETERMINISTIC_ALGORITHMS = {"ruido_fisico"}  # Su secuencia no depende de la semilla
+MAX_CHECKPOINTS = 8  # Copias del generador guardadas por secuencia para reposicionarlo sin regenerar desde 0
+
+def _freeze(value):
+    """Convierte listas y diccionarios de parámetros en valores inmutables para usarlos en la clave."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+class _CachedSequence:
+    """Prefijo generado (array float64 con capacidad que se duplica) y el generador justo tras su último número.
+
+    Además guarda copias del generador en las posiciones donde terminó cada ampliación, para entregar un
+    generador situado en cualquier posición del prefijo sin regenerarlo desde el principio.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.values = np.empty(0, dtype=np.float64)
+        self.size = 0
+        self.checkpoints = {0: deepcopy(generator)}
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def extend_to(self, count):
+        """Genera solo los números que faltan para tener al menos count en el prefijo."""
+        if count <= self.size:
+            return
+        if count > len(self.values):
+            values = np.empty(max(count, 2 * len(self.values)), dtype=np.float64)
+            values[:self.size] = self.values[:self.size]
+            self.values = values
+        self.values[self.size:count] = generate_block(self.generator, count - self.size)
+        self.size = count
+        self.checkpoints[count] = deepcopy(self.generator)
+        if len(self.checkpoints) > MAX_CHECKPOINTS:
+            del self.checkpoints[min(position for position in self.checkpoints if position > 0)]
+
+    def generator_at(self, position):
+        """Copia independiente del generador situada justo después de los primeros position números."""
+        if position == self.size:
+            return deepcopy(self.generator)
+        if hasattr(self.generator, "jump"):
+            generator = deepcopy(self.checkpoints[0])
+            generator.jump(position)
+            return generator
+        start = max(checkpoint for checkpoint in self.checkpoints if checkpoint <= position)
+        generator = deepcopy(self.checkpoints[start])
+        if position > start:
+            generate_block(generator, position - start)
+        return generator
+
+class SequenceCache:
+    """Caché LRU de secuencias de generadores con semilla, indexada por (algoritmo, semilla, parámetros).
+
+    Una petición de más números extiende el prefijo guardado en lugar de regenerarlo, y las entradas menos
+    usadas se descartan cuando la memoria total de los prefijos supera max_bytes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        if max_bytes < 0:
+            raise ValueError("El límite de memoria de la caché no puede ser negativo.")
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cacheable(algorithm):
+        return algorithm not in NON_DETERMINISTIC_ALGORITHMS
+
+    @staticmethod
+    def key(algorithm, seed, kwargs=None):
+        return algorithm, seed, _freeze(kwargs or {})
+
+    @property
+    def nbytes(self):
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def take(self, algorithm, seed, count, kwargs=None, return_generator=False):
+        """Devuelve una copia de los primeros count números de la secuencia (algoritmo, semilla, parámetros).
+
+        Con return_generator devuelve además un generador independiente situado tras esos count números,
+        que continúa la secuencia igual que si se hubiera generado sin caché.
+        """
+        kwargs = kwargs or {}
+        if not self.cacheable(algorithm):
+            generator = create_generator(algorithm, seed, **kwargs)
+            numbers = generate_block(generator, count)
+            return (numbers, generator) if return_generator else numbers
+        key = self.key(algorithm, seed, kwargs)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _CachedSequence(create_generator(algorithm, seed, **kwargs))
+            self.misses += 1
+        elif entry.size >= count:
+            self.hits += 1
+        else:
+            self.misses += 1
+        entry.extend_to(count)
+        numbers = entry.values[:count].copy()
+        generator = entry.generator_at(count) if return_generator else None
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._evict()
+        return (numbers, generator) if return_generator else numbers
+
+    def _evict(self):
+        """Descarta entradas empezando por la usada hace más tiempo hasta quedar dentro del límite."""
+        total = self.nbytes
+        while self._entries and total > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            total -= entry.nbytes
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
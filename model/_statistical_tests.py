@@ -0,0 +1,120 @@
+from math import erfc, exp, lgamma, log, sqrt
+import numpy as np
+
+def _normal_two_sided_p(z):
+    """Valor p bilateral para un estadístico con distribución normal estándar."""
+    return erfc(abs(z) / sqrt(2))
+
+def _chi_square_sf(statistic, dof):
+    """Función de supervivencia de chi-cuadrado: Q(dof/2, statistic/2) regularizada."""
+    a, x = dof / 2.0, statistic / 2.0
+    if x <= 0:
+        return 1.0
+    if x < a + 1:
+        # Serie para P(a, x)
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * exp(-x + a * log(x) - lgamma(a)))
+    # Fracción continua para Q(a, x) (algoritmo de Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return exp(-x + a * log(x) - lgamma(a)) * h
+
+def _kolmogorov_sf(value):
+    """Función de supervivencia asintótica de la distribución de Kolmogorov."""
+    if value < 1e-3:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = 2 * (-1) ** (j - 1) * exp(-2 * j * j * value * value)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+def chi_square_uniformity(numbers, bins=100):
+    """Prueba chi-cuadrado de uniformidad sobre bins intervalos iguales de [0, 1)."""
+    numbers = np.asarray(numbers, dtype=np.float64)
+    indices = np.minimum((numbers * bins).astype(np.int64), bins - 1)
+    observed = np.bincount(indices, minlength=bins)
+    expected = len(numbers) / bins
+    statistic = float(((observed - expected) ** 2).sum() / expected)
+    return {"statistic": statistic, "p_value": _chi_square_sf(statistic, bins - 1)}
+
+def runs_test(numbers):
+    """Prueba de rachas de Wald-Wolfowitz por encima y por debajo de la mediana."""
+    numbers = np.asarray(numbers, dtype=np.float64)
+    median = np.median(numbers)
+    above = numbers[numbers != median] > median
+    n1 = int(above.sum())
+    n2 = len(above) - n1
+    if n1 == 0 or n2 == 0:
+        return {"statistic": float("inf"), "p_value": 0.0}
+    runs = 1 + int(np.count_nonzero(above[1:] != above[:-1]))
+    n = n1 + n2
+    mean = 2 * n1 * n2 / n + 1
+    variance = 2 * n1 * n2 * (2 * n1 * n2 - n) / (n * n * (n - 1))
+    z = (runs - mean) / sqrt(variance)
+    return {"statistic": z, "p_value": _normal_two_sided_p(z)}
+
+def serial_correlation(numbers, lag=1):
+    """Correlación serial entre u[i] y u[i+lag]; bajo independencia r*sqrt(n) es normal estándar."""
+    numbers = np.asarray(numbers, dtype=np.float64)
+    x, y = numbers[:-lag], numbers[lag:]
+    x = x - x.mean()
+    y = y - y.mean()
+    denominator = sqrt(float((x * x).sum() * (y * y).sum()))
+    r = float((x * y).sum() / denominator) if denominator > 0 else 1.0
+    z = r * sqrt(len(x))
+    return {"statistic": r, "p_value": _normal_two_sided_p(z)}
+
+def kolmogorov_smirnov(numbers):
+    """Prueba de Kolmogorov-Smirnov contra la distribución uniforme en [0, 1]."""
+    numbers = np.sort(np.asarray(numbers, dtype=np.float64))
+    n = len(numbers)
+    ranks = np.arange(1, n + 1)
+    statistic = float(max((ranks / n - numbers).max(), (numbers - (ranks - 1) / n).max()))
+    effective = sqrt(n) + 0.12 + 0.11 / sqrt(n)
+    return {"statistic": statistic, "p_value": _kolmogorov_sf(effective * statistic)}
+
+def gap_test(numbers, lower=0.0, upper=0.5, max_gap=10):
+    """Prueba de huecos de Knuth: longitudes entre apariciones consecutivas en [lower, upper)."""
+    numbers = np.asarray(numbers, dtype=np.float64)
+    p = upper - lower
+    hits = np.flatnonzero((numbers >= lower) & (numbers < upper))
+    gaps = np.diff(hits) - 1
+    if len(gaps) == 0:
+        return {"statistic": float("inf"), "p_value": 0.0}
+    observed = np.bincount(np.minimum(gaps, max_gap), minlength=max_gap + 1)
+    probabilities = p * (1 - p) ** np.arange(max_gap + 1)
+    probabilities[-1] = (1 - p) ** max_gap  # Huecos de longitud max_gap o mayor
+    expected = probabilities * len(gaps)
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    return {"statistic": statistic, "p_value": _chi_square_sf(statistic, max_gap)}
+
+STATISTICAL_TESTS = {
+    "chi_square": chi_square_uniformity,
+    "runs": runs_test,
+    "serial_correlation": serial_correlation,
+    "kolmogorov_smirnov": kolmogorov_smirnov,
+    "gap": gap_test
+}
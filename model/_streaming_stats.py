@@ -0,0 +1,267 @@
+from math import sqrt, pi
+import numpy as np
+
+DEFAULT_HISTOGRAM_BINS = 64
+DEFAULT_COMPRESSION = 100  # Parámetro delta del t-digest: más centroides, cuantiles más precisos
+DEFAULT_SUMMARY_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+class RunningMoments:
+    """Media, varianza, asimetría y curtosis acumuladas por bloques que pueden combinarse entre procesos.
+
+    La combinación sigue las fórmulas de Chan et al. extendidas a los momentos centrales de orden 3 y 4 (Pébay).
+    """
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, m3=0.0, m4=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2  # Suma de cuadrados de las desviaciones respecto a la media
+        self.m3 = m3
+        self.m4 = m4
+
+    @classmethod
+    def from_values(cls, values):
+        """Crea los momentos de un bloque completo con una sola pasada vectorizada."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        deviations = values - mean
+        squared = deviations * deviations
+        return cls(len(values), mean, float(squared.sum()), float(np.dot(squared, deviations)), float(np.dot(squared, squared)))
+
+    def update(self, values):
+        """Añade un bloque de valores."""
+        return self.merge(RunningMoments.from_values(values))
+
+    def merge(self, other):
+        """Combina otros momentos con estos, como si todos los valores se hubieran visto juntos."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.m3, self.m4 = other.count, other.mean, other.m2, other.m3, other.m4
+            return self
+        na, nb = self.count, other.count
+        count = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / count
+        cross = delta * delta_n * na * nb  # delta^2 * na * nb / n
+        self.m4 += (other.m4 + cross * delta_n * delta_n * (na * na - na * nb + nb * nb)
+                    + 6 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+                    + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        self.m3 += other.m3 + cross * delta_n * (na - nb) + 3 * delta_n * (na * other.m2 - nb * self.m2)
+        self.m2 += other.m2 + cross
+        self.mean += delta_n * nb
+        self.count = count
+        return self
+
+    def variance(self, ddof=0):
+        """Varianza de los valores vistos (ddof=0 poblacional, ddof=1 muestral)."""
+        if self.count <= ddof:
+            return 0.0
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        return sqrt(self.variance(ddof))
+
+    def standard_error(self):
+        """Error estándar de la media."""
+        return self.std() / sqrt(self.count) if self.count else float("inf")
+
+    def skewness(self):
+        """Coeficiente de asimetría (sesgado, como scipy.stats.skew por defecto)."""
+        if self.count == 0 or self.m2 <= 0:
+            return 0.0
+        return sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self):
+        """Curtosis en exceso (0 para la normal)."""
+        if self.count == 0 or self.m2 <= 0:
+            return 0.0
+        return self.count * self.m4 / (self.m2 * self.m2) - 3.0
+
+class StreamingHistogram:
+    """Histograma de bordes fijos en [low, high] con contadores de valores por debajo y por encima del rango.
+
+    Dos histogramas con los mismos bordes se combinan sumando sus contadores.
+    """
+
+    def __init__(self, low, high, bins=DEFAULT_HISTOGRAM_BINS):
+        if not high > low:
+            raise ValueError("El extremo superior del histograma debe ser mayor que el inferior.")
+        if bins <= 0:
+            raise ValueError("El número de intervalos debe ser un entero positivo.")
+        self.low = float(low)
+        self.high = float(high)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self):
+        return np.linspace(self.low, self.high, len(self.counts) + 1)
+
+    @property
+    def total(self):
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        below = values < self.low
+        above = values > self.high
+        self.underflow += int(np.count_nonzero(below))
+        self.overflow += int(np.count_nonzero(above))
+        inside = values[~(below | above)]
+        bins = len(self.counts)
+        # El extremo superior pertenece al último intervalo, como en np.histogram
+        index = np.minimum(((inside - self.low) * (bins / (self.high - self.low))).astype(np.intp), bins - 1)
+        self.counts += np.bincount(index, minlength=bins)
+        return self
+
+    def merge(self, other):
+        if (other.low, other.high, len(other.counts)) != (self.low, self.high, len(self.counts)):
+            raise ValueError("Solo se pueden combinar histogramas con los mismos intervalos.")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+class TDigest:
+    """Resumen de cuantiles t-digest (versión por fusión) con memoria acotada por compression.
+
+    Cada bloque se ordena junto con los centroides actuales y se agrupa de forma vectorizada: los puntos
+    comparten centroide mientras no cruzan un entero de la función de escala k1 = delta / (2 pi) asin(2q - 1),
+    que concentra los centroides pequeños en las colas.
+    """
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        if compression <= 0:
+            raise ValueError("La compresión del t-digest debe ser positiva.")
+        self.compression = compression
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # Cuantil a la izquierda de cada punto y su cubeta entera de la función de escala
+        left = (np.cumsum(weights) - weights) / total
+        scale = np.floor(self.compression / (2 * pi) * np.arcsin(2 * left - 1))
+        starts = np.flatnonzero(np.r_[True, scale[1:] != scale[:-1]])
+        cluster_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / cluster_weights
+        self.weights = cluster_weights
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate((self.means, values)), np.concatenate((self.weights, np.ones(len(values)))))
+        return self
+
+    def merge(self, other):
+        if len(other.weights) == 0:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate((self.means, other.means)), np.concatenate((self.weights, other.weights)))
+        return self
+
+    def quantile(self, q):
+        """Cuantiles aproximados (q escalar o array en [0, 1]) interpolando entre los centros de los centroides."""
+        if len(self.weights) == 0:
+            raise ValueError("El t-digest está vacío.")
+        q = np.asarray(q, dtype=np.float64)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Los cuantiles deben estar en el intervalo [0,1]")
+        total = self.weights.sum()
+        centers = (np.cumsum(self.weights) - self.weights / 2) / total
+        result = np.interp(q, np.r_[0.0, centers, 1.0], np.r_[self.min, self.means, self.max])
+        return float(result) if result.ndim == 0 else result
+
+class StreamSummary:
+    """Resumen de memoria fija de un flujo de bloques ndarray: momentos, histograma y cuantiles t-digest.
+
+    Sin range, los bordes del histograma se fijan con el mínimo y el máximo del primer bloque; los valores
+    posteriores fuera de ese rango se cuentan como desbordamientos.
+    """
+
+    def __init__(self, bins=DEFAULT_HISTOGRAM_BINS, range=None, compression=DEFAULT_COMPRESSION):
+        self.bins = bins
+        self.moments = RunningMoments()
+        self.histogram = StreamingHistogram(*range, bins) if range is not None else None
+        self.digest = TDigest(compression)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return self
+        if self.histogram is None:
+            finite = values[np.isfinite(values)]
+            low, high = (float(finite.min()), float(finite.max())) if len(finite) else (0.0, 1.0)
+            self.histogram = StreamingHistogram(low, high if high > low else low + 1.0, self.bins)
+        self.moments.update(values)
+        self.histogram.update(values)
+        self.digest.update(values)
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        if other.histogram is not None:
+            if self.histogram is None:
+                self.histogram = StreamingHistogram(other.histogram.low, other.histogram.high, other.bins)
+            self.histogram.merge(other.histogram)
+        self.digest.merge(other.digest)
+        return self
+
+    def summary(self, quantiles=DEFAULT_SUMMARY_QUANTILES):
+        """Diccionario con conteo, momentos, extremos, cuantiles e histograma."""
+        if self.moments.count == 0:
+            raise ValueError("No hay datos para resumir.")
+        return {
+            "count": self.moments.count,
+            "mean": self.moments.mean,
+            "variance": self.moments.variance(),
+            "std": self.moments.std(),
+            "skewness": self.moments.skewness(),
+            "kurtosis": self.moments.kurtosis(),
+            "min": self.digest.min,
+            "max": self.digest.max,
+            "quantiles": dict(zip(quantiles, np.atleast_1d(self.digest.quantile(quantiles)).tolist())),
+            "histogram": {
+                "edges": self.histogram.edges.tolist(),
+                "counts": self.histogram.counts.tolist(),
+                "underflow": self.histogram.underflow,
+                "overflow": self.histogram.overflow
+            }
+        }
+
+def summarize_chunks(chunks, bins=DEFAULT_HISTOGRAM_BINS, range=None, compression=DEFAULT_COMPRESSION):
+    """Consume un iterable de bloques ndarray y devuelve su StreamSummary."""
+    summary = StreamSummary(bins, range, compression)
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary
+
+def summarize_array(values, chunk_size=65536, bins=DEFAULT_HISTOGRAM_BINS, compression=DEFAULT_COMPRESSION):
+    """Resumen (diccionario de StreamSummary.summary) de una secuencia ya en memoria, recorrida en bloques.
+
+    Como los valores ya están disponibles, el histograma cubre su rango completo y no solo el del primer bloque.
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    finite = values[np.isfinite(values)]
+    limits = None
+    if len(finite):
+        low, high = float(finite.min()), float(finite.max())
+        limits = (low, high if high > low else low + 1.0)
+    return summarize_chunks((values[i:i + chunk_size] for i in range(0, len(values), chunk_size)), bins, limits, compression).summary()
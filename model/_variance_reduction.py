@@ -0,0 +1,135 @@
+from math import lgamma, sqrt
+import numpy as np
+from model._dis_transform import DistributionTransformer
+
+VARIANCE_REDUCTION_METHODS = ("antithetic", "stratified", "importance", "control_variate")
+IMPORTANCE_DENSITIES = ("exponential", "beta", "uniform")
+
+def _evaluate(f, x):
+    """Evalúa f sobre el array x; las expresiones constantes se expanden a la forma de x."""
+    return np.broadcast_to(np.asarray(f(x), dtype=np.float64), x.shape)
+
+def _result(estimate, variance, plain_variance, evaluations):
+    """Construye el resultado; el factor compara con Monte Carlo simple con el mismo número de evaluaciones."""
+    return {
+        "result": float(estimate),
+        "error": sqrt(max(variance, 0.0)),
+        "n_points": evaluations,
+        "variance_reduction_factor": float(plain_variance / variance) if variance > 0 else float("inf")
+    }
+
+def antithetic(f, a, b, n_points, uniform_source):
+    """Variables antitéticas: cada uniforme u se empareja con 1 - u."""
+    pairs = max(1, n_points // 2)
+    u = uniform_source(pairs)
+    width = b - a
+    values = _evaluate(f, a + width * u)
+    mirrored = _evaluate(f, a + width * (1 - u))
+    pair_means = width * (values + mirrored) / 2
+    all_values = width * np.concatenate((values, mirrored))
+    return _result(pair_means.mean(), pair_means.var() / pairs, all_values.var() / (2 * pairs), 2 * pairs)
+
+def stratified(f, a, b, n_points, uniform_source, strata=None):
+    """Muestreo estratificado: [a, b] se divide en estratos iguales y los n_points se reparten entre ellos.
+
+    Cada estrato recibe al menos dos puntos para estimar su varianza (salvo con n_points = 1) y los sobrantes
+    de la división van a los primeros estratos, de modo que se evalúan exactamente n_points puntos.
+    """
+    strata = max(1, min(strata or n_points // 2, n_points // 2))
+    counts = np.full(strata, n_points // strata)
+    counts[:n_points % strata] += 1
+    width = b - a
+    index = np.repeat(np.arange(strata), counts)
+    x = a + width * (index + uniform_source(n_points)) / strata
+    values = width * _evaluate(f, x)
+    sums = np.bincount(index, values, strata)
+    means = sums / counts
+    deviations = values - means[index]
+    # Cada estrato pesa 1/strata en la media global
+    if counts.min() > 1:
+        within = np.bincount(index, deviations * deviations, strata) / (counts - 1)
+        variance = float((within / counts).sum()) / (strata * strata)
+    else:
+        variance = float("inf")
+    return _result(means.mean(), variance, values.var() / n_points, n_points)
+
+def _truncated_exponential(u, lambda_param, width):
+    """Inversión de la exponencial truncada a [0, width]; lambda negativa da una densidad creciente."""
+    mass = -np.expm1(-lambda_param * width)
+    t = -np.log1p(-u * mass) / lambda_param
+    density = lambda_param * np.exp(-lambda_param * t) / mass
+    return t, density
+
+def _fitted_rate(f, a, b):
+    """Tasa de una exponencial truncada que sigue el crecimiento de |f| entre a y b (0 si no puede ajustarse)."""
+    ends = np.abs(_evaluate(f, np.array([a, b], dtype=np.float64)))
+    if not np.all(np.isfinite(ends)) or ends.min() <= 0:
+        return 0.0
+    return -float(np.log(ends[1] / ends[0])) / (b - a)
+
+def importance(f, a, b, n_points, uniform_source, density="exponential", params=None):
+    """Muestreo por importancia con una exponencial truncada, una beta (reescalada a [a, b]) o la uniforme.
+
+    Sin lambda, la exponencial se ajusta a los valores de f en los extremos (uniforme si f se anula en alguno).
+    La densidad de propuesta debe ser positiva allí donde f no se anula: una beta con alpha > 1 (o beta > 1)
+    vale 0 en a (o en b) y solo se acepta si f también se anula en ese extremo.
+    """
+    params = params or {}
+    width = b - a
+    if density == "beta":
+        alpha, beta = params.get("alpha", 1.0), params.get("beta", 1.0)
+        ends = _evaluate(f, np.array([a, b], dtype=np.float64))
+        if (alpha > 1 and ends[0] != 0) or (beta > 1 and ends[1] != 0):
+            raise ValueError("La densidad beta se anula en un extremo donde f no es cero: los pesos no están acotados")
+        t = DistributionTransformer.sample_beta(alpha, beta, n_points, uniform_source)
+        t = np.clip(t, 1e-300, 1 - 1e-16)
+        log_norm = lgamma(alpha + beta) - lgamma(alpha) - lgamma(beta)
+        g = np.exp(log_norm + (alpha - 1) * np.log(t) + (beta - 1) * np.log1p(-t)) / width
+        x = a + width * t
+    elif density == "exponential":
+        lambda_param = params["lambda"] if "lambda" in params else _fitted_rate(f, a, b)
+        if lambda_param == 0:
+            t = width * uniform_source(n_points)
+            g = np.full(n_points, 1 / width)
+        else:
+            t, g = _truncated_exponential(uniform_source(n_points), lambda_param, width)
+        x = a + t
+    elif density == "uniform":
+        x = a + width * uniform_source(n_points)
+        g = np.full(n_points, 1 / width)
+    else:
+        raise ValueError(f"Densidad no soportada: {density}. Debe ser una de: {', '.join(IMPORTANCE_DENSITIES)}")
+
+    values = _evaluate(f, x)
+    weights = values / g
+    estimate = weights.mean()
+    # Varianza de (b - a) f(U) con U uniforme, estimada con los mismos pesos: (b - a) E_g[f^2 / g] - I^2
+    plain_variance = width * float((values * weights).mean()) - estimate * estimate
+    return _result(estimate, weights.var() / n_points, plain_variance / n_points, n_points)
+
+def control_variate(f, a, b, n_points, uniform_source, control=None, control_integral=None):
+    """Variable de control h con integral conocida sobre [a, b]; por defecto h(x) = x."""
+    if control is None:
+        control, control_integral = (lambda x: x), (b * b - a * a) / 2
+    width = b - a
+    x = a + width * uniform_source(n_points)
+    values = width * _evaluate(f, x)
+    controls = width * _evaluate(control, x)
+    control_variance = controls.var()
+    coefficient = float(((values - values.mean()) * (controls - controls.mean())).mean() / control_variance) if control_variance > 0 else 0.0
+    adjusted = values - coefficient * (controls - control_integral)
+    result = _result(adjusted.mean(), adjusted.var() / n_points, values.var() / n_points, n_points)
+    result["control_coefficient"] = coefficient
+    return result
+
+def reduce_variance(method, f, a, b, n_points, uniform_source, **options):
+    """Despacha la integral de f en [a, b] al método de reducción de varianza indicado."""
+    if method == "antithetic":
+        return antithetic(f, a, b, n_points, uniform_source)
+    elif method == "stratified":
+        return stratified(f, a, b, n_points, uniform_source, options.get("strata"))
+    elif method == "importance":
+        return importance(f, a, b, n_points, uniform_source, options.get("density", "exponential"), options.get("params"))
+    elif method == "control_variate":
+        return control_variate(f, a, b, n_points, uniform_source, options.get("control"), options.get("control_integral"))
+    raise ValueError(f"Método de reducción de varianza no soportado: {method}. Debe ser uno de: {', '.join(VARIANCE_REDUCTION_METHODS)}")
@@ -1,14 +1,30 @@
-from model.distribution_model import Distribution
-from utils.validators.expression_validators import validate_positive_integer
-from ui.pages.distribution_page.method_config import METHOD_CONFIG
+from collections import deque
+from model.distribution_model import Distribution, DEFAULT_QMC_REPLICATES
+from model._custom_generators import QUASI_RANDOM_ALGORITHMS
+from model._parallel_engine import generate_parallel, integrate_parallel, DEFAULT_CHUNK_SIZE
+from model._variance_reduction import VARIANCE_REDUCTION_METHODS
+from model._parameter_sweep import run_sweep, SWEEP_PARAMETERS
+from model._sequence_cache import SequenceCache, DEFAULT_CACHE_BYTES
+from model._streaming_stats import summarize_array
+from utils.parsers.number_parser import parse_numbers
+from utils.validators.expression_validators import validate_positive_integer, validate_unit_interval
+from ui.pages.distribution_page.method_config import METHOD_CONFIG, MONTE_CARLO_METHOD_CONFIG
+
+MAX_DISTRIBUTIONS = 32  # Distribuciones recientes que se conservan; las anteriores se liberan
+SUMMARY_THRESHOLD = 900  # Con más valores que filas tiene la tabla de resultados se añade un resumen estadístico
 
 class DistributionManager:
-    def __init__(self):
-        self.distributions = []
+    def __init__(self, cache_bytes=DEFAULT_CACHE_BYTES, max_distributions=MAX_DISTRIBUTIONS):
+        self.distributions = deque(maxlen=max_distributions)
+        self.sequence_cache = SequenceCache(cache_bytes)
         self.valid_algorithms = list(METHOD_CONFIG.keys()) # Usar las claves de METHOD_CONFIG como algoritmos válidos
+        self.integration_algorithms = list(MONTE_CARLO_METHOD_CONFIG.keys())  # Además, las secuencias cuasi-aleatorias
 
     def create_distribution(self, algorithm, seed=None, **kwargs):
-        self.validate_algorithm_choice(algorithm, self.valid_algorithms)
+        return self._create_distribution(algorithm, seed, self.valid_algorithms, **kwargs)
+
+    def _create_distribution(self, algorithm, seed, valid_choices, **kwargs):
+        self.validate_algorithm_choice(algorithm, valid_choices)
         distribution = Distribution(algorithm, seed, **kwargs)
         self.distributions.append(distribution)
         return distribution
@@ -16,7 +32,46 @@ class DistributionManager:
     def generate_random_numbers(self, count, algorithm="mersenne", seed=None, **kwargs):
         validate_positive_integer(count)
         distribution = self.create_distribution(algorithm, seed, **kwargs)
-        return distribution.generate_numbers(count)
+        if not self.sequence_cache.cacheable(algorithm):
+            return distribution.generate_numbers(count)
+        # Las secuencias con semilla son deterministas: se reutiliza (y se amplía) el prefijo ya generado
+        numbers, distribution.generator = self.sequence_cache.take(algorithm, distribution.seed, count, distribution.kwargs, True)
+        distribution.numbers = numbers.tolist()
+        return distribution.numbers
+
+    def generate_random_numbers_parallel(self, count, algorithm="mersenne", seed=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                                         substreams=True, **kwargs):
+        """Genera números en varios procesos y los devuelve en un ndarray.
+
+        Con los generadores con salto la secuencia coincide con la generación en un solo proceso. Mersenne Twister
+        reparte bloques con semillas derivadas (secuencia reproducible pero distinta de la serial); con
+        substreams=False se genera en serie.
+        """
+        validate_positive_integer(count)
+        validate_positive_integer(chunk_size)
+        distribution = self.create_distribution(algorithm, seed, **kwargs)
+        result = generate_parallel(count, algorithm, distribution.seed, distribution.kwargs, workers, chunk_size, substreams)
+        distribution.numbers = result["numbers"]
+        return {"algorithm": algorithm, "count": count, **result}
+
+    def generate_random_numbers_to_file(self, path, count, algorithm="mersenne", seed=None, chunk_size=None, resume=True, **kwargs):
+        """Genera una secuencia directamente en un archivo .npy y la devuelve mapeada en memoria."""
+        validate_positive_integer(count)
+        distribution = self.create_distribution(algorithm, seed, **kwargs)
+        if chunk_size is None:
+            path = distribution.generate_to_file(path, count, resume=resume)
+        else:
+            validate_positive_integer(chunk_size)
+            path = distribution.generate_to_file(path, count, chunk_size, resume)
+        return Distribution.load_sequence(path)
+
+    def summarize_random_numbers(self, count, algorithm="mersenne", seed=None, distribution_type=None, params=None,
+                                 chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+        """Estadísticas de una secuencia (uniforme o muestreada de distribution_type) sin guardarla en memoria."""
+        validate_positive_integer(count)
+        validate_positive_integer(chunk_size)
+        distribution = self.create_distribution(algorithm, seed, **kwargs)
+        return distribution.summarize_stream(count, distribution_type, params, chunk_size)
 
     def get_last_distribution(self):
         if not self.distributions:
@@ -25,15 +80,56 @@ class DistributionManager:
 
     def clear(self):
         self.distributions.clear()
+        self.sequence_cache.clear()
+
+    def calculate_monte_carlo_integration(self, expr, a, b, n_points=10000, algorithm="mersenne", seed=None,
+                                          chunk_size=None, target_error=None, time_budget=None,
+                                          replicates=DEFAULT_QMC_REPLICATES, variance_reduction=None, vr_options=None,
+                                          workers=None, **kwargs):
+        """Calcula la integral definida utilizando el método Monte Carlo.
 
-    def calculate_monte_carlo_integration(self, expr, a, b, n_points=10000, algorithm="mersenne", seed=None, **kwargs):
-        """Calcula la integral definida utilizando el método Monte Carlo."""
+        Con workers los bloques de chunk_size puntos se evalúan en varios procesos, cada uno sobre su propio
+        tramo de la secuencia, y los momentos parciales se combinan en un único resultado y error estándar.
+        """
         validate_positive_integer(n_points)
         if a >= b:
             raise ValueError("El límite inferior debe ser menor que el límite superior.")
+        if chunk_size is not None:
+            validate_positive_integer(chunk_size)
+        if target_error is not None and target_error <= 0:
+            raise ValueError("El error objetivo debe ser positivo.")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("El tiempo máximo debe ser positivo.")
+        validate_positive_integer(replicates)
+        if variance_reduction is not None and variance_reduction not in VARIANCE_REDUCTION_METHODS:
+            raise ValueError(f"Método de reducción de varianza no válido. Debe ser uno de: {', '.join(VARIANCE_REDUCTION_METHODS)}.")
             
-        distribution = self.create_distribution(algorithm, seed, **kwargs)
-        return distribution.monte_carlo_integration(expr, a, b, n_points)
+        distribution = self._create_distribution(algorithm, seed, self.integration_algorithms, **kwargs)
+        if workers is not None:
+            validate_positive_integer(workers)
+            if algorithm in QUASI_RANDOM_ALGORITHMS or variance_reduction is not None or target_error is not None or time_budget is not None:
+                raise ValueError("La integración en paralelo solo admite generadores pseudoaleatorios sin reducción de varianza ni parada anticipada.")
+            try:
+                return integrate_parallel(expr, a, b, n_points, algorithm, distribution.seed, distribution.kwargs, workers,
+                                          chunk_size or DEFAULT_CHUNK_SIZE)
+            except Exception as e:
+                raise ValueError(f"Error en la integración Monte Carlo: {str(e)}")
+        return distribution.monte_carlo_integration(expr, a, b, n_points, chunk_size, target_error, time_budget, replicates,
+                                                    variance_reduction, vr_options)
+
+    def calculate_monte_carlo_integration_nd(self, expr, bounds, n_points=10000, algorithm="mersenne", seed=None,
+                                             region=None, replicates=DEFAULT_QMC_REPLICATES, **kwargs):
+        """Calcula una integral doble o triple sobre una caja, opcionalmente restringida a una región."""
+        validate_positive_integer(n_points)
+        validate_positive_integer(replicates)
+        if not 1 <= len(bounds) <= 3:
+            raise ValueError("La integral debe tener entre 1 y 3 variables.")
+        for lower, upper in bounds:
+            if lower >= upper:
+                raise ValueError("El límite inferior debe ser menor que el límite superior.")
+
+        distribution = self._create_distribution(algorithm, seed, self.integration_algorithms, **kwargs)
+        return distribution.monte_carlo_integration_nd(expr, bounds, n_points, region, replicates=replicates)
 
     def simulate_markov_epidemic(self, params):
         """Simula la propagación de una epidemia usando el modelo de Markov."""
@@ -48,7 +144,9 @@ class DistributionManager:
             'days': 30,
             'dt': 0.1,
             'algorithm': 'mersenne',  # Valor por defecto para algoritmo
-            'seed': None  # Valor por defecto para semilla
+            'seed': None,  # Valor por defecto para semilla
+            'replicates': 1,  # Una sola trayectoria salvo que se pida un conjunto
+            'method': 'gamma'  # Regla por pasos original; "ssa", "tau_leaping" o "auto" para el motor por eventos, "ode" o "binomial_chain" para el motor compartimental
         }
         
         # Verificar parámetros requeridos
@@ -65,7 +163,7 @@ class DistributionManager:
         # Validar valores numéricos y convertir tipos
         try:
             # Parámetros enteros
-            for param in ['population', 'initial_infected', 'initial_recovered', 'days']:
+            for param in ['population', 'initial_infected', 'initial_recovered', 'days', 'replicates']:
                 if param in params:
                     params[param] = int(params[param])
                     
@@ -83,6 +181,9 @@ class DistributionManager:
                 
             if not (0 <= params['beta'] <= 1 and 0 <= params['gamma'] <= 1):
                 raise ValueError("Las tasas beta y gamma deben estar entre 0 y 1")
+
+            if params['replicates'] < 1:
+                raise ValueError("El número de réplicas debe ser un entero positivo")
                 
         except ValueError as e:
             raise ValueError(f"Error en los parámetros: {str(e)}")
@@ -112,29 +213,56 @@ class DistributionManager:
         except Exception as e:
             raise ValueError(f"Error en la simulación: {str(e)}")
     
+    def sweep_markov_epidemic(self, grid, base_params=None, workers=None, checkpoint=None, callback=None):
+        """Simula la epidemia en cada punto de una rejilla de beta, gamma, población y semilla sin generar gráficos.
+
+        Devuelve columnas NumPy con los parámetros y, por punto, el pico de infectados, el día del pico y el
+        tamaño final. callback(índice, fila) recibe los resultados parciales y checkpoint (.npz) permite reanudar.
+        """
+        if not isinstance(grid, dict):
+            raise ValueError("La rejilla debe proporcionarse como un diccionario de listas de valores")
+        for name, values in grid.items():
+            if name not in SWEEP_PARAMETERS:
+                raise ValueError(f"Parámetro de barrido no válido: {name}. Debe ser uno de: {', '.join(SWEEP_PARAMETERS)}")
+            if len(values) == 0:
+                raise ValueError(f"La lista de valores de {name} está vacía")
+            if name in ('beta', 'gamma') and not all(0 <= value <= 1 for value in values):
+                raise ValueError("Las tasas beta y gamma deben estar entre 0 y 1")
+            if name == 'population' and not all(value > 0 for value in values):
+                raise ValueError("La población debe ser mayor que cero")
+
+        base_params = dict(base_params or {})
+        self.validate_algorithm_choice(base_params.get('algorithm', 'mersenne'), self.valid_algorithms)
+        if workers is not None:
+            validate_positive_integer(workers)
+        try:
+            return run_sweep(grid, base_params, workers, checkpoint, callback)
+        except Exception as e:
+            raise ValueError(f"Error en el barrido de parámetros: {str(e)}")
+
     def transform_numbers(self, numbers, distribution_type, uniform_numbers=None, **params):
         """Transforma una lista de números a la distribución especificada."""
         try:
             # Si se proporcionan uniform_numbers, usarlos; si no, usar numbers
             numbers_to_use = uniform_numbers if uniform_numbers is not None else numbers
             
-            # Convertir string de números a lista
-            if isinstance(numbers_to_use, str):
-                numbers_to_use = [float(x.strip()) for x in numbers_to_use.split(',')]
-                
-            # Validar que los números estén en [0,1]
-            if not all(0 <= x <= 1 for x in numbers_to_use):
-                raise ValueError("Todos los números deben estar en el intervalo [0,1]")
+            # Texto, buffer, lista o archivo .npy/.csv (pathlib.Path) a un array float64 validado en una sola pasada
+            numbers_to_use = parse_numbers(numbers_to_use)
+            validate_unit_interval(numbers_to_use)
 
             distribution = self.create_distribution("mersenne")
             # Usar el parámetro uniform_numbers en lugar de asignar a numbers
             transformed = distribution.transform_distribution(distribution_type, params, uniform_numbers=numbers_to_use)
             
+            summary = None
+            if len(numbers_to_use) > SUMMARY_THRESHOLD:
+                summary = {"original": summarize_array(numbers_to_use), "transformed": summarize_array(transformed)}
             return {
-                "original": numbers_to_use,
+                "original": numbers_to_use.tolist(),
                 "transformed": transformed,
                 "distribution": distribution_type,
-                "parameters": params
+                "parameters": params,
+                "summary": summary
             }
             
         except Exception as e:
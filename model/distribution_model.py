@@ -1,10 +1,21 @@
-from numpy import array, mean, std, sqrt
-from sympy import symbols, lambdify, sympify
+from numpy import array, asarray, broadcast_to, mean, std, sqrt, concatenate, float64, ndarray, load, where, errstate, count_nonzero, prod
+from numpy.lib.format import open_memmap
+from sympy import symbols, lambdify, sympify, integrate
 from model._custom_generators import *
 from model.graph_manager import GraphManager
 from controller.graph_controller import GraphController
-from ui.pages.distribution_page.method_config import METHOD_CONFIG
+from ui.pages.distribution_page.method_config import MONTE_CARLO_METHOD_CONFIG
 from model._dis_transform import DistributionTransformer
+from model._streaming_stats import RunningMoments, StreamSummary, DEFAULT_HISTOGRAM_BINS, DEFAULT_COMPRESSION
+from model._variance_reduction import reduce_variance
+from model._epidemic import simulate_epidemic, ensemble_bands
+from utils.parsers.number_parser import parse_numbers
+from time import perf_counter
+import os
+import pickle
+
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_QMC_REPLICATES = 8  # Réplicas aleatorizadas para estimar el error de las secuencias de baja discrepancia
 
 class Distribution:
     def __init__(self, algorithm="mersenne", seed=None, **kwargs):
@@ -17,39 +28,124 @@ class Distribution:
         self.transformer = DistributionTransformer()
 
     def _create_generator(self):
-        if self.algorithm == "mersenne":
-            return MersenneTwister(self.seed)
-        elif self.algorithm == "xorshift":
-            return Xorshift(self.seed)
-        elif self.algorithm == "congruencial":
-            a = self.kwargs.get('a', 1664525)
-            c = self.kwargs.get('c', 1013904223)
-            m = self.kwargs.get('m', 2**32)
-            return LinearCongruential(self.seed, a, c, m)
-        elif self.algorithm == "congruencial_multiplicativo":
-            a = self.kwargs.get('a', 1664525) 
-            m = self.kwargs.get('m', 2**32)
-            return LinearCongruentialMultiplicative(self.seed, a, m)
-        elif self.algorithm == "lfsr":
-            taps = [self.kwargs.get('taps', 3), 2]  # Por defecto usar taps=[3, 2]
-            return LFSR(seed=self.seed, taps=taps)
-        elif self.algorithm == "productos_medios":
-            return MiddleProduct(seed=self.seed)
-        elif self.algorithm == "productos_cuadraticos":
-            return QuadraticProduct(seed=self.seed)
-        elif self.algorithm == "ruido_fisico":
-            return PhysicalNoise()
-        else:
-            valid_options = list(METHOD_CONFIG.keys())
+        if self.algorithm not in MONTE_CARLO_METHOD_CONFIG:
+            valid_options = list(MONTE_CARLO_METHOD_CONFIG.keys())
             raise ValueError(f"Elección de algoritmo no válida. Debe ser uno de: {', '.join(valid_options)}")
+        return create_generator(self.algorithm, self.seed, **self.kwargs)
+
+    def iter_chunks(self, count, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Genera count números como bloques ndarray de tamaño chunk_size (el último puede ser menor)."""
+        if chunk_size <= 0:
+            raise ValueError("El tamaño de bloque debe ser un entero positivo.")
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield generate_block(self.generator, size)
+            remaining -= size
 
     def generate_numbers(self, count):
-        if self.algorithm == "mersenne":
-            self.numbers = [self.generator.random() for _ in range(count)]
-        else:
-            self.numbers = [self.generator.next() for _ in range(count)]
+        chunks = list(self.iter_chunks(count))
+        self.numbers = concatenate(chunks).tolist() if chunks else []
         return self.numbers
 
+    def generate_to_file(self, path, count, chunk_size=DEFAULT_CHUNK_SIZE, resume=True):
+        """Escribe count números en un archivo .npy mapeado en memoria, bloque a bloque.
+
+        Tras cada bloque se guarda el estado del generador en '<path>.state', de modo que
+        una ejecución interrumpida continúa desde el último bloque completado. Las fuentes no
+        deterministas (ruido físico) no guardan estado y no se pueden reanudar.
+        """
+        path = os.fspath(path)
+        state_path = path + ".state"
+        completed = 0
+        resumable = hasattr(self.generator, "_state_attributes")
+
+        if resume and os.path.exists(path) and os.path.exists(state_path):
+            if not resumable:
+                raise ValueError("Una secuencia de ruido físico no se puede reanudar: genérela de nuevo con resume=False.")
+            with open(state_path, "rb") as state_file:
+                checkpoint = pickle.load(state_file)
+            expected = (self.algorithm, self.seed, self.kwargs, count)
+            if (checkpoint["algorithm"], checkpoint["seed"], checkpoint["kwargs"], checkpoint["count"]) != expected:
+                raise ValueError("El archivo de estado no corresponde a la secuencia solicitada.")
+            self.generator = restore_generator_state(self._create_generator(), checkpoint["state"])
+            completed = checkpoint["completed"]
+            output = open_memmap(path, mode="r+")
+        else:
+            output = open_memmap(path, mode="w+", dtype=float64, shape=(count,))
+
+        try:
+            for chunk in self.iter_chunks(count - completed, chunk_size):
+                output[completed:completed + len(chunk)] = chunk
+                completed += len(chunk)
+                output.flush()
+                if resumable:
+                    self._save_checkpoint(state_path, count, completed)
+        finally:
+            del output
+        return path
+
+    def _save_checkpoint(self, state_path, count, completed):
+        """Guarda de forma atómica el estado del generador tras un bloque completado."""
+        checkpoint = {
+            "algorithm": self.algorithm,
+            "seed": self.seed,
+            "kwargs": self.kwargs,
+            "count": count,
+            "completed": completed,
+            "state": generator_state(self.generator)
+        }
+        temp_path = state_path + ".tmp"
+        with open(temp_path, "wb") as state_file:
+            pickle.dump(checkpoint, state_file)
+        os.replace(temp_path, state_path)
+
+    @staticmethod
+    def load_sequence(path):
+        """Abre una secuencia guardada en .npy sin copiarla a memoria (mapeo de solo lectura)."""
+        return load(path, mmap_mode="r")
+
+    def _uniform_source(self, n):
+        """Entrega n uniformes del generador; es la fuente que consumen los muestreadores por rechazo."""
+        return generate_block(self.generator, n)
+
+    def sample(self, distribution_type, size, params=None):
+        """Genera exactamente size valores de la distribución tomando uniformes directamente del generador."""
+        if params is None:
+            params = {}
+
+        if distribution_type == "normal":
+            return self.transformer.box_muller_array(self._uniform_source(size + size % 2))[:size]
+        elif distribution_type == "exponential":
+            return self.transformer.exponential_array(self._uniform_source(size), params.get('lambda', 1.0))
+        elif distribution_type == "poisson":
+            return self.transformer.sample_poisson(params.get('lambda', 1.0), size, self._uniform_source)
+        elif distribution_type == "binomial":
+            return self.transformer.sample_binomial(params.get('n', 10), params.get('p', 0.5), size, self._uniform_source)
+        elif distribution_type == "gamma":
+            return self.transformer.sample_gamma(params.get('alpha', 1.0), params.get('beta', 1.0), size, self._uniform_source)
+        elif distribution_type == "beta":
+            return self.transformer.sample_beta(params.get('alpha', 1.0), params.get('beta', 1.0), size, self._uniform_source)
+        else:
+            raise ValueError(f"Tipo de distribución no soportada para muestreo directo: {distribution_type}")
+
+    def summarize_stream(self, count, distribution_type=None, params=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                         bins=DEFAULT_HISTOGRAM_BINS, compression=DEFAULT_COMPRESSION):
+        """Resume count números generados (o muestreados de distribution_type) bloque a bloque con memoria fija.
+
+        Ningún bloque se conserva: se acumulan momentos, histograma y t-digest, así que count puede superar
+        con mucho la memoria disponible.
+        """
+        if chunk_size <= 0:
+            raise ValueError("El tamaño de bloque debe ser un entero positivo.")
+        summary = StreamSummary(bins, (0.0, 1.0) if distribution_type is None else None, compression)
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            summary.update(self._uniform_source(size) if distribution_type is None else self.sample(distribution_type, size, params))
+            remaining -= size
+        return summary.summary()
+
     def set_seed(self, new_seed):
         self.seed = new_seed
         self.generator = self._create_generator()
@@ -57,8 +153,17 @@ class Distribution:
     def get_numbers(self):
         return self.numbers
 
-    def monte_carlo_integration(self, expr, a, b, n_points=10000):
-        """Calcula la integral definida de una expresión matemática en el intervalo [a, b] utilizando el método de Monte Carlo."""
+    def monte_carlo_integration(self, expr, a, b, n_points=10000, chunk_size=None, target_error=None, time_budget=None,
+                                replicates=DEFAULT_QMC_REPLICATES, variance_reduction=None, vr_options=None):
+        """Calcula la integral definida de una expresión matemática en el intervalo [a, b] utilizando el método de Monte Carlo.
+
+        Si se indica chunk_size, target_error o time_budget, la integral se evalúa por bloques con
+        memoria acotada y se detiene al alcanzar el error estándar objetivo o el tiempo máximo (segundos).
+        Con las secuencias de Halton o Sobol los puntos se reparten entre réplicas aleatorizadas y el error
+        se estima a partir de la dispersión entre ellas.
+        variance_reduction selecciona "antithetic", "stratified", "importance" o "control_variate"; sus opciones
+        (strata, density y params, o una expresión control) van en vr_options.
+        """
         try:
             x = symbols('x')
             if isinstance(expr, str):
@@ -67,9 +172,18 @@ class Distribution:
                 sym_expr = expr
                 
             f = lambdify(x, sym_expr, 'numpy')
+
+            if variance_reduction is not None:
+                return self._variance_reduced_monte_carlo(f, sym_expr, a, b, n_points, variance_reduction, vr_options or {})
+            if self.algorithm in QUASI_RANDOM_ALGORITHMS:
+                if chunk_size is not None or target_error is not None or time_budget is not None:
+                    raise ValueError("Las secuencias cuasi-aleatorias no admiten chunk_size, target_error ni time_budget: el error se estima con réplicas.")
+                return self._quasi_monte_carlo(f, sym_expr, a, b, n_points, replicates)
+            if chunk_size is not None or target_error is not None or time_budget is not None:
+                return self._streaming_monte_carlo(f, sym_expr, a, b, n_points, chunk_size or DEFAULT_CHUNK_SIZE, target_error, time_budget)
             
             # Generar puntos aleatorios en el intervalo [a, b]
-            if not self.numbers or len(self.numbers) < n_points:
+            if len(self.numbers) < n_points:
                 self.generate_numbers(n_points)
                 
             # Convertir los números aleatorios al intervalo [a, b]
@@ -95,6 +209,170 @@ class Distribution:
         except Exception as e:
             raise ValueError(f"Error en la integración Monte Carlo: {str(e)}")
     
+    def _variance_reduced_monte_carlo(self, f, sym_expr, a, b, n_points, method, options):
+        """Integración Monte Carlo con un método de reducción de varianza."""
+        options = dict(options)
+        control = options.get("control")
+        if control is not None and not callable(control):
+            # Expresión de control: su integral exacta en [a, b] se obtiene simbólicamente
+            x = symbols('x')
+            control_expr = sympify(control)
+            options["control"] = lambdify(x, control_expr, 'numpy')
+            options["control_integral"] = float(integrate(control_expr, (x, a, b)))
+        try:
+            result = reduce_variance(method, f, a, b, n_points, self._uniform_source, **options)
+        except ZeroDivisionError as e:
+            raise ValueError(f"Error al evaluar la función: {str(e)}")
+        result.update({"a": a, "b": b, "expression": str(sym_expr), "variance_reduction": method})
+        return result
+
+    def _point_source(self, dimension, seed_offset=0, skip=0):
+        """Devuelve una función n -> array (n, dimension) de puntos uniformes en [0, 1)^dimension."""
+        if self.algorithm in QUASI_RANDOM_ALGORITHMS:
+            generator = create_generator(self.algorithm, self.seed + seed_offset, **{**self.kwargs, "dimension": dimension})
+            if not generator.scramble:
+                generator.jump(skip)
+            return generator.generate_points
+        return lambda n: generate_block(self.generator, n * dimension).reshape(n, dimension)
+
+    def monte_carlo_integration_nd(self, expr, bounds, n_points=10000, region=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                                   replicates=DEFAULT_QMC_REPLICATES):
+        """Calcula la integral de expr(x, y, z) sobre la caja bounds = [(x0, x1), (y0, y1), ...] con Monte Carlo.
+
+        Si se indica region (desigualdades sympy), solo cuentan los puntos que la cumplen (acierto-fallo);
+        con expr = 1 el resultado es el área o volumen de la región. Los puntos se generan como arrays
+        (N, d) por bloques y la función se evalúa con una sola llamada vectorizada por bloque.
+        """
+        try:
+            bounds = asarray(bounds, dtype=float64).reshape(-1, 2)
+            dimension = len(bounds)
+            variables = symbols('x y z')[:dimension]
+            sym_expr = sympify(expr) if isinstance(expr, str) else sympify(1 if expr is None else expr)
+            sym_region = sympify(region) if isinstance(region, str) else region
+
+            f = lambdify(variables, sym_expr, 'numpy')
+            inside = lambdify(variables, sym_region, 'numpy') if sym_region is not None else None
+            lower = bounds[:, 0]
+            width = bounds[:, 1] - lower
+            volume = float(prod(width))
+
+            def integrate(point_source, count):
+                moments = RunningMoments()
+                hits = 0
+                for start in range(0, count, chunk_size):
+                    size = min(chunk_size, count - start)
+                    coordinates = (point_source(size) * width + lower).T
+                    try:
+                        with errstate(invalid='ignore', divide='ignore'):
+                            f_values = broadcast_to(asarray(f(*coordinates), dtype=float64), (size,))
+                            if inside is not None:
+                                # Fuera de la región la función puede no estar definida; esos puntos valen 0
+                                mask = broadcast_to(asarray(inside(*coordinates), dtype=bool), (size,))
+                                hits += int(count_nonzero(mask))
+                                f_values = where(mask, f_values, 0.0)
+                    except Exception as e:
+                        raise ValueError(f"Error al evaluar la función: {str(e)}")
+                    moments.update(f_values)
+                return moments, hits
+
+            if self.algorithm in QUASI_RANDOM_ALGORITHMS:
+                replicates = max(1, min(replicates, n_points))
+                per_replicate = n_points // replicates
+                runs = [integrate(self._point_source(dimension, r, r * per_replicate), per_replicate) for r in range(replicates)]
+                estimates = array([volume * moments.mean for moments, _ in runs])
+                integral_result = float(estimates.mean())
+                std_error = float(std(estimates, ddof=1) / sqrt(replicates)) if replicates > 1 else float("nan")
+                used_points = per_replicate * replicates
+                hits = sum(run_hits for _, run_hits in runs)
+            else:
+                moments, hits = integrate(self._point_source(dimension), n_points)
+                integral_result = volume * moments.mean
+                std_error = volume * moments.standard_error()
+                used_points = n_points
+
+            result = {
+                "result": float(integral_result),
+                "error": float(std_error),
+                "n_points": used_points,
+                "dimension": dimension,
+                "bounds": bounds.tolist(),
+                "variables": [str(variable) for variable in variables],
+                "volume": volume,
+                "expression": str(sym_expr)
+            }
+            if sym_region is not None:
+                result["region"] = str(sym_region)
+                result["hit_rate"] = hits / used_points if used_points else 0.0
+            return result
+
+        except Exception as e:
+            raise ValueError(f"Error en la integración Monte Carlo: {str(e)}")
+
+    def _quasi_monte_carlo(self, f, sym_expr, a, b, n_points, replicates):
+        """Integración cuasi-Monte Carlo con réplicas aleatorizadas independientes."""
+        replicates = max(1, min(replicates, n_points))
+        per_replicate = n_points // replicates
+        width = b - a
+        estimates = []
+        for r in range(replicates):
+            generator = create_generator(self.algorithm, self.seed + r, **self.kwargs)
+            if not getattr(generator, "scramble", True):
+                generator.jump(r * per_replicate)  # Sin aleatorización: tramos consecutivos de la secuencia
+            x_random = generate_block(generator, per_replicate) * width + a
+            try:
+                f_values = broadcast_to(asarray(f(x_random), dtype=float64), x_random.shape)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {str(e)}")
+            estimates.append(width * float(f_values.mean()))
+
+        estimates = array(estimates)
+        std_error = float(std(estimates, ddof=1) / sqrt(replicates)) if replicates > 1 else float("nan")
+        return {
+            "result": float(estimates.mean()),
+            "error": std_error,
+            "n_points": per_replicate * replicates,
+            "replicates": replicates,
+            "a": a,
+            "b": b,
+            "expression": str(sym_expr)
+        }
+
+    def _streaming_monte_carlo(self, f, sym_expr, a, b, n_points, chunk_size, target_error, time_budget):
+        """Integración Monte Carlo por bloques con media y varianza acumuladas."""
+        began = perf_counter()
+        moments = RunningMoments()
+        width = b - a
+        stop_reason = "n_points"
+        for chunk in self.iter_chunks(n_points, chunk_size):
+            x_random = chunk * width + a
+            try:
+                f_values = broadcast_to(asarray(f(x_random), dtype=float64), x_random.shape)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {str(e)}")
+            moments.update(f_values)
+
+            std_error = width * moments.standard_error()
+            if target_error is not None and moments.count > 1 and std_error <= target_error:
+                stop_reason = "target_error"
+                break
+            if time_budget is not None and perf_counter() - began >= time_budget:
+                stop_reason = "time_budget"
+                break
+
+        std_error = width * moments.standard_error()
+        return {
+            "result": float(width * moments.mean),
+            "error": float(std_error),
+            "n_points": moments.count,
+            "requested_points": n_points,
+            "a": a,
+            "b": b,
+            "expression": str(sym_expr),
+            "stop_reason": stop_reason,
+            "converged": target_error is not None and std_error <= target_error,
+            "elapsed": perf_counter() - began
+        }
+
     def markov_epidemic_simulation(self, params):
         try:
             # Configurar el generador
@@ -111,55 +389,29 @@ class Distribution:
             days = int(params.get('days', 30))
             dt = float(params.get('dt', 0.1))
     
-            # Inicializar estados
+            replicates = int(params.get('replicates', 1))
+            if replicates < 1:
+                raise ValueError("El número de réplicas debe ser un entero positivo")
+
             S0 = N - I0 - R0
-            S, I, R = [S0], [I0], [R0]
-            times = [0]
-    
-            # Generar números aleatorios base
-            steps = int(days / dt)
-            base_numbers = self.generate_numbers(steps * 2)  # Necesitamos 2 números por paso
-            
-            # Dividir los números base en dos grupos
-            infection_base = base_numbers[:steps]
-            recovery_base = base_numbers[steps:]
-            
-            # Transformar a distribución gamma para modelar tiempos entre eventos
-            infection_numbers = self.transformer.gamma(infection_base, alpha=beta * dt, beta=1.0)
-            recovery_numbers = self.transformer.gamma(recovery_base, alpha=gamma * dt, beta=1.0)
-
-            # Simulación
-            for step in range(min(steps, len(infection_numbers), len(recovery_numbers))):
-                current_S = S[-1]
-                current_I = I[-1]
-                current_R = R[-1]
-
-                # Calcular transiciones usando los números transformados directamente
-                actual_infections = int(max(0, min(current_S, 
-                    infection_numbers[step] * beta * current_S * current_I / N)))
-                actual_recoveries = int(max(0, min(current_I,
-                    recovery_numbers[step] * gamma * current_I)))
-
-                # Actualizar estados
-                next_S = max(0, current_S - actual_infections)
-                next_I = max(0, current_I + actual_infections - actual_recoveries)
-                next_R = max(0, current_R + actual_recoveries)
-    
-                # Normalizar población
-                total = next_S + next_I + next_R
-                if total > 0:
-                    factor = N / total
-                    next_S = int(next_S * factor)
-                    next_I = int(next_I * factor)
-                    next_R = int(next_R * factor)
-    
-                S.append(next_S)
-                I.append(next_I)
-                R.append(next_R)
-                times.append(times[-1] + dt)
-    
+            grid, S_paths, I_paths, R_paths, method = simulate_epidemic(
+                N, I0, R0, beta, gamma, days, dt, self._uniform_source, replicates, params.get('method', 'gamma'))
+            times = grid.tolist()
+
+            if replicates == 1:
+                S, I, R = S_paths[0].tolist(), I_paths[0].tolist(), R_paths[0].tolist()
+                ensemble = None
+            else:
+                ensemble = {
+                    "replicates": replicates,
+                    "susceptible": ensemble_bands(S_paths),
+                    "infected": ensemble_bands(I_paths),
+                    "recovered": ensemble_bands(R_paths)
+                }
+                S, I, R = (ensemble[name]["mean"].tolist() for name in ("susceptible", "infected", "recovered"))
+
             # Generar el gráfico y retornar resultados
-            canvas = self.graph_controller.create_epidemic_plot(times, S, I, R, params)
+            canvas = self.graph_controller.create_epidemic_plot(times, S, I, R, params, ensemble)
             
             return {
                 "times": times,
@@ -177,8 +429,11 @@ class Distribution:
                     "dt": dt,
                     "R0": beta / gamma,
                     "algorithm": self.algorithm,
-                    "seed": self.seed
+                    "seed": self.seed,
+                    "replicates": replicates,
+                    "method": method
                 },
+                "ensemble": ensemble,
                 "canvas": canvas
             }
     
@@ -186,23 +441,27 @@ class Distribution:
             raise ValueError(f"Error en la simulación de Markov: {str(e)}")
     
     def transform_distribution(self, distribution_type, params=None, uniform_numbers=None):
-        """Transforma los números uniformes a la distribución especificada."""
+        """Transforma los números uniformes a la distribución especificada.
+
+        Solo se usan los uniformes recibidos, nunca el generador interno. Exponencial, Poisson y binomial
+        devuelven un valor por uniforme y Box-Muller uno por uniforme emparejado (con un número impar se
+        descarta el último). Gamma y beta usan Marsaglia-Tsang para cualquier alpha (para alpha < 1,
+        Gamma(alpha + 1) * U^(1/alpha) en lugar de la antigua transformación de Weibull, que no sigue una
+        ley gamma) y devuelven solo los valores aceptados, unos dos por cada 4 uniformes (6 si alpha < 1).
+        """
         
         # Si se proporcionan números uniformes como parámetro, usarlos
         if uniform_numbers is not None:
-            if isinstance(uniform_numbers, str):
-                # Convertir string separado por comas a lista de floats
-                try:
-                    numbers_to_transform = [float(x.strip()) for x in uniform_numbers.split(',')]
-                except ValueError:
-                    raise ValueError("Los números deben ser valores numéricos separados por comas")
-            elif isinstance(uniform_numbers, list):
-                numbers_to_transform = uniform_numbers
+            if isinstance(uniform_numbers, (list, ndarray)):
+                numbers_to_transform = uniform_numbers  # Incluye secuencias abiertas con load_sequence (memmap)
+            elif isinstance(uniform_numbers, (str, bytes, bytearray, memoryview, os.PathLike)):
+                # Texto separado por comas, espacios o saltos de línea, buffer float64 o archivo .npy/.csv (os.PathLike)
+                numbers_to_transform = parse_numbers(uniform_numbers)
             else:
-                raise ValueError("uniform_numbers debe ser una lista o string separado por comas")
+                raise ValueError("uniform_numbers debe ser una lista, un ndarray, un buffer, una ruta o un string separado por comas")
         else:
             # Usar los números generados internamente
-            if not self.numbers:
+            if len(self.numbers) == 0:
                 raise ValueError("No hay números generados para transformar")
             numbers_to_transform = self.numbers
     
@@ -225,11 +484,11 @@ class Distribution:
             elif distribution_type == "gamma":
                 alpha = params.get('alpha', 1.0)
                 beta = params.get('beta', 1.0)
-                return self.transformer.gamma(numbers_to_transform, alpha, beta)
+                return self.transformer.gamma_from_uniforms(numbers_to_transform, alpha, beta).tolist()
             elif distribution_type == "beta":
                 alpha = params.get('alpha', 1.0)
                 beta = params.get('beta', 1.0)
-                return self.transformer.beta(numbers_to_transform, alpha, beta)
+                return self.transformer.beta_from_uniforms(numbers_to_transform, alpha, beta).tolist()
             else:
                 raise ValueError(f"Tipo de distribución no soportada: {distribution_type}")
         except Exception as e:
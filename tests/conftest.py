@@ -0,0 +1,15 @@
+import os
+import sys
+import pytest
+
+# Las pruebas importan los paquetes del proyecto (model, utils...) desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model._custom_generators import MersenneTwister
+
+@pytest.fixture
+def uniform_source():
+    """Fábrica de fuentes de uniformes reproducibles: uniform_source(seed) devuelve n -> ndarray."""
+    def make(seed=12345):
+        return MersenneTwister(seed).generate_array
+    return make
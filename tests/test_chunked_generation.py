@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from model._custom_generators import create_generator, generate_block
+from model.distribution_model import Distribution
+
+@pytest.mark.parametrize("algorithm", ["mersenne", "congruencial", "xorshift", "productos_medios"])
+def test_chunks_concatenate_to_serial_sequence(algorithm):
+    chunks = list(Distribution(algorithm, 42).iter_chunks(10000, chunk_size=3000))
+    assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1000]
+    assert all(isinstance(chunk, np.ndarray) and chunk.dtype == np.float64 for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), generate_block(create_generator(algorithm, 42), 10000))
+
+def test_consecutive_iterations_continue_the_sequence():
+    distribution = Distribution("mersenne", 7)
+    first = np.concatenate(list(distribution.iter_chunks(500, chunk_size=128)))
+    second = np.concatenate(list(distribution.iter_chunks(500, chunk_size=256)))
+    np.testing.assert_array_equal(np.concatenate((first, second)), generate_block(create_generator("mersenne", 7), 1000))
+
+def test_chunks_are_lazy():
+    distribution = Distribution("mersenne", 7)
+    chunks = distribution.iter_chunks(10**12, chunk_size=1000)  # Ningún bloque se genera hasta pedirlo
+    assert len(next(chunks)) == 1000
+
+def test_generate_numbers_keeps_list_interface():
+    numbers = Distribution("mersenne", 7).generate_numbers(1000)
+    assert isinstance(numbers, list) and len(numbers) == 1000
+    assert Distribution("mersenne", 7).generate_numbers(0) == []
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(Distribution("mersenne", 7).iter_chunks(10, chunk_size=0))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from model._compartmental import PRESETS, CompartmentalModel, _binomial_draw, create_model, sir_model
+from model._dis_transform import UniformStream
+
+@pytest.mark.parametrize("name", PRESETS)
+@pytest.mark.parametrize("integrator", ["deterministic", "binomial_chain"])
+def test_population_is_conserved(name, integrator, uniform_source):
+    model = create_model(name)
+    times, states = model.simulate({model.compartments[0]: 990, "I": 10}, days=20, dt=0.1,
+                                   integrator=integrator, uniform_source=uniform_source())
+    assert states.shape == (len(times), len(model.compartments))
+    np.testing.assert_allclose(states.sum(axis=1), 1000)
+    assert np.all(states >= 0)
+
+def test_derivative_matches_sir_equations():
+    beta, gamma = 0.3, 0.1
+    S, I, R = 900.0, 90.0, 10.0
+    derivative = sir_model().derivative([S, I, R], {"beta": beta, "gamma": gamma}, 1000.0)
+    infections = beta * S * I / 1000
+    np.testing.assert_allclose(derivative, [-infections, infections - gamma * I, gamma * I])
+
+def test_runge_kutta_matches_exponential_decay():
+    model = CompartmentalModel("decay", ("A", "B"), [("A", "B", "k")], {"k": 0.5})
+    times, states = model.simulate({"A": 1.0}, days=4, dt=0.01)
+    np.testing.assert_allclose(states[:, 0], np.exp(-0.5 * times), rtol=1e-9)
+
+def test_binomial_chain_mean_follows_ode(uniform_source):
+    model = sir_model()
+    initial = {"S": 9900, "I": 100}
+    _, deterministic = model.simulate(initial, days=10, dt=0.1)
+    runs = [model.simulate(initial, days=10, dt=0.1, integrator="binomial_chain", uniform_source=uniform_source(seed))[1]
+            for seed in range(20)]
+    mean_infected = np.mean([states[-1, 1] for states in runs])
+    assert abs(mean_infected / deterministic[-1, 1] - 1) < 0.05
+
+@pytest.mark.parametrize("n, p", [(40, 0.3), (1000, 0.05), (500, 0.8), (10, 0.2)])
+def test_binomial_draw_moments(n, p, uniform_source):
+    stream = UniformStream(uniform_source())
+    draws = np.array([_binomial_draw(n, p, stream) for _ in range(20000)])
+    variance = n * p * (1 - p)
+    assert draws.min() >= 0 and draws.max() <= n
+    assert abs(draws.mean() - n * p) < 5 * np.sqrt(variance / len(draws))
+    assert abs(draws.var() / variance - 1) < 0.06
+
+def test_invalid_models():
+    with pytest.raises(ValueError):
+        CompartmentalModel("bad", ("S", "I"), [("S", "X", "beta")], {"beta": 0.1})
+    with pytest.raises(ValueError):
+        CompartmentalModel("bad", ("S", "I"), [("S", "I", "beta * delta")], {"beta": 0.1})
+    with pytest.raises(ValueError):
+        create_model("sird")
+    with pytest.raises(ValueError):
+        sir_model().simulate({"S": 10, "I": 1}, integrator="binomial_chain")
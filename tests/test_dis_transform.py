@@ -0,0 +1,110 @@
+from math import cos, exp, log, pi, sin, sqrt
+import numpy as np
+import pytest
+from model._dis_transform import DistributionTransformer
+
+# Bucles escalares originales, usados como referencia de las versiones vectorizadas
+
+def safe(u):
+    return max(1e-10, min(0.9999999, u))
+
+def legacy_box_muller(numbers):
+    out = []
+    for i in range(0, len(numbers) - 1, 2):
+        u1, u2 = safe(numbers[i]), safe(numbers[i + 1])
+        out.extend([sqrt(-2 * log(u1)) * cos(2 * pi * u2), sqrt(-2 * log(u1)) * sin(2 * pi * u2)])
+    return out
+
+def legacy_exponential(numbers, lambda_param):
+    return [-log(1 - safe(u)) / lambda_param for u in numbers]
+
+def legacy_poisson(numbers, lambda_param):
+    out = []
+    for u in numbers:
+        p = exp(-lambda_param)
+        F, k = p, 0
+        while u > F:
+            k += 1
+            p = p * lambda_param / k
+            F += p
+        out.append(k)
+    return out
+
+def legacy_binomial(numbers, n, p):
+    out = []
+    for u in numbers:
+        k = 0
+        prob = (1 - p) ** n
+        F = prob
+        while u > F and k < n:
+            k += 1
+            prob *= (n - k + 1) * p / (k * (1 - p))
+            F += prob
+        out.append(k)
+    return out
+
+def legacy_gamma(numbers, alpha, beta):
+    if alpha < 1:
+        return [(-log(1 - safe(u))) ** alpha * beta for u in numbers]
+    out = []
+    for i in range(0, len(numbers) - 1, 2):
+        y = -log(safe(numbers[i]))
+        z = -log(safe(numbers[i + 1])) / alpha
+        if z > 0 and y >= (alpha - 1) * (z - log(z) - 1):
+            out.append(z * beta)
+    return out
+
+def legacy_beta(numbers, alpha, beta):
+    out = []
+    for i in range(0, len(numbers) - 1, 2):
+        x = numbers[i] ** (1 / alpha)
+        y = numbers[i + 1] ** (1 / beta)
+        if x + y <= 1:
+            out.append(x / (x + y))
+    return out
+
+@pytest.fixture
+def uniforms():
+    values = np.random.default_rng(11).random(4001)  # Longitud impar: el último número queda sin pareja
+    values[:4] = [0.0, 1.0, 1e-12, 0.99999999]  # Extremos que se recortan al rango seguro
+    return values
+
+def test_box_muller(uniforms):
+    np.testing.assert_allclose(DistributionTransformer.box_muller(uniforms), legacy_box_muller(uniforms.tolist()), rtol=1e-12, atol=1e-12)
+
+@pytest.mark.parametrize("lambda_param", [0.5, 1.0, 3.0])
+def test_exponential(uniforms, lambda_param):
+    np.testing.assert_allclose(DistributionTransformer.exponential(uniforms, lambda_param),
+                               legacy_exponential(uniforms.tolist(), lambda_param), rtol=1e-12)
+
+@pytest.mark.parametrize("lambda_param", [0.1, 1.0, 4.5, 9.0])
+def test_poisson(uniforms, lambda_param):
+    assert DistributionTransformer.poisson(uniforms[4:], lambda_param) == legacy_poisson(uniforms[4:].tolist(), lambda_param)
+
+@pytest.mark.parametrize("n, p", [(1, 0.5), (10, 0.3), (20, 0.95), (60, 0.2), (5, 0.0)])
+def test_binomial(uniforms, n, p):
+    assert DistributionTransformer.binomial(uniforms[4:], n, p) == legacy_binomial(uniforms[4:].tolist(), n, p)
+
+def test_binomial_with_certain_success(uniforms):
+    assert DistributionTransformer.binomial(uniforms[4:], 5, 1.0) == [5] * len(uniforms[4:])  # El bucle original dividía por cero
+
+@pytest.mark.parametrize("alpha, beta", [(0.4, 2.0), (1.0, 1.0), (2.5, 0.5)])
+def test_gamma(uniforms, alpha, beta):
+    np.testing.assert_allclose(DistributionTransformer.gamma(uniforms, alpha, beta), legacy_gamma(uniforms.tolist(), alpha, beta), rtol=1e-12)
+
+@pytest.mark.parametrize("alpha, beta", [(0.5, 0.5), (1.0, 1.0), (2.0, 3.0)])
+def test_beta(uniforms, alpha, beta):
+    np.testing.assert_allclose(DistributionTransformer.beta(uniforms[4:], alpha, beta), legacy_beta(uniforms[4:].tolist(), alpha, beta), rtol=1e-12)
+
+def test_array_transforms_write_into_out(uniforms):
+    out = np.empty(len(uniforms))
+    result = DistributionTransformer.exponential_array(uniforms, 2.0, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, DistributionTransformer.exponential_array(uniforms, 2.0))
+    with pytest.raises(ValueError):
+        DistributionTransformer.poisson_array(uniforms, 1.0, out=np.empty(3, dtype=np.int64))
+
+@pytest.mark.parametrize("transform", [DistributionTransformer.box_muller, lambda u: DistributionTransformer.beta(u, 1.0, 1.0)])
+def test_too_few_numbers(transform):
+    with pytest.raises(ValueError):
+        transform([0.5])
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from model._epidemic import ensemble_bands, simulate_sir
+
+def legacy_trajectory(infection_numbers, recovery_numbers, N, I0, R0, beta, gamma):
+    """Bucle original de una sola trayectoria de markov_epidemic_simulation."""
+    S, I, R = [N - I0 - R0], [I0], [R0]
+    for infection, recovery in zip(infection_numbers, recovery_numbers):
+        infections = int(max(0, min(S[-1], infection * beta * S[-1] * I[-1] / N)))
+        recoveries = int(max(0, min(I[-1], recovery * gamma * I[-1])))
+        next_S = max(0, S[-1] - infections)
+        next_I = max(0, I[-1] + infections - recoveries)
+        next_R = max(0, R[-1] + recoveries)
+        total = next_S + next_I + next_R
+        if total > 0:
+            factor = N / total
+            next_S, next_I, next_R = int(next_S * factor), int(next_I * factor), int(next_R * factor)
+        S.append(next_S)
+        I.append(next_I)
+        R.append(next_R)
+    return S, I, R
+
+@pytest.fixture
+def multipliers():
+    rng = np.random.default_rng(3)
+    return rng.gamma(2.0, 1.0, (6, 300)), rng.gamma(2.0, 1.0, (6, 300))
+
+def test_each_replicate_matches_single_trajectory(multipliers):
+    infection, recovery = multipliers
+    S, I, R = simulate_sir(infection, recovery, 1000, 5, 0, 0.3, 0.1)
+    assert S.shape == I.shape == R.shape == (6, 301)
+    for r in range(6):
+        expected = legacy_trajectory(infection[r], recovery[r], 1000, 5, 0, 0.3, 0.1)
+        assert (S[r].tolist(), I[r].tolist(), R[r].tolist()) == expected
+
+def test_one_dimensional_input_is_one_replicate(multipliers):
+    infection, recovery = multipliers
+    S, _, _ = simulate_sir(infection[0], recovery[0], 1000, 5, 0, 0.3, 0.1)
+    assert S.shape == (1, 301)
+
+def test_population_never_exceeds_total(multipliers):
+    S, I, R = simulate_sir(*multipliers, 1000, 5, 0, 0.3, 0.1)
+    assert np.all(S + I + R <= 1000) and np.all(S + I + R >= 997)  # La renormalización trunca a enteros
+    assert np.all((S >= 0) & (I >= 0) & (R >= 0))
+
+def test_ensemble_bands():
+    trajectories = np.arange(100, dtype=np.float64).reshape(100, 1) * np.ones((1, 4))
+    bands = ensemble_bands(trajectories, (0.1, 0.9))
+    np.testing.assert_allclose(bands["mean"], 49.5)
+    np.testing.assert_allclose(bands["median"], 49.5)
+    np.testing.assert_allclose(bands["lower"], 9.9)
+    np.testing.assert_allclose(bands["upper"], 89.1)
+    assert bands["quantiles"] == (0.1, 0.9)
+
+def test_bands_are_ordered(multipliers):
+    _, I, _ = simulate_sir(*multipliers, 1000, 5, 0, 0.3, 0.1)
+    bands = ensemble_bands(I)
+    assert np.all(bands["lower"] <= bands["median"]) and np.all(bands["median"] <= bands["upper"])
@@ -0,0 +1,52 @@
+from math import exp
+import numpy as np
+import pytest
+from model._dis_transform import DistributionTransformer
+from model._epidemic import gillespie_sir, resample_to_grid, tau_leaping_sir
+
+PARAMS = dict(population=1000, initial_infected=20, initial_recovered=5, beta=0.3, gamma=0.1, days=20)
+
+@pytest.mark.parametrize("engine", [gillespie_sir, tau_leaping_sir])
+def test_population_is_conserved(engine, uniform_source):
+    times, S, I, R = engine(**PARAMS, uniform_source=uniform_source(3))
+    assert np.all(S + I + R == PARAMS["population"])
+    assert np.all((S >= 0) & (I >= 0) & (R >= PARAMS["initial_recovered"]))
+    assert np.all(np.diff(times) > 0) and times[-1] <= PARAMS["days"]
+    assert np.all(np.diff(S) <= 0) and np.all(np.diff(R) >= 0)
+
+def test_tau_leaping_matches_ssa_mean(uniform_source):
+    runs = 200
+    final = {}
+    for engine in (gillespie_sir, tau_leaping_sir):
+        values = []
+        for seed in range(runs):
+            times, _, _, R = engine(**PARAMS, uniform_source=uniform_source(seed))
+            values.append(resample_to_grid(times, R, np.array([PARAMS["days"]]))[0])
+        final[engine] = np.array(values, dtype=np.float64)
+    spread = np.sqrt((final[gillespie_sir].var() + final[tau_leaping_sir].var()) / runs)
+    assert abs(final[tau_leaping_sir].mean() - final[gillespie_sir].mean()) < 4 * spread
+
+def test_poisson_each_matches_sequential_inversion():
+    means = np.array([0.0, 0.3, 2.5, 7.9])
+    uniforms = np.array([0.4, 0.7, 0.99])
+    expected = [0]
+    for lam, u in zip(means[1:], uniforms):
+        k, p = 0, exp(-lam)
+        F = p
+        while u > F:
+            k += 1
+            p *= lam / k
+            F += p
+        expected.append(k)
+    assert DistributionTransformer.sample_poisson_each(means, lambda n: uniforms[:n]).tolist() == expected
+
+def test_poisson_each_moments(uniform_source):
+    means = np.tile([0.5, 4.0, 12.0, 300.0, 5e4], 20000)
+    source = uniform_source(9)
+    samples = DistributionTransformer.sample_poisson_each(means, source).reshape(-1, 5)
+    np.testing.assert_allclose(samples.mean(axis=0), means[:5], rtol=0.02)
+    np.testing.assert_allclose(samples.var(axis=0), means[:5], rtol=0.05)
+
+def test_poisson_each_rejects_negative_means(uniform_source):
+    with pytest.raises(ValueError):
+        DistributionTransformer.sample_poisson_each([1.0, -0.5], uniform_source())
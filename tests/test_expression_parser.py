@@ -0,0 +1,28 @@
+import pytest
+from sympy import And, Ge, Gt, Le, Lt, Max, Min, atan2, symbols
+from utils.parsers.expression_parser import ExpressionParser
+
+x, y, z = symbols("x y z")
+
+@pytest.fixture
+def parser():
+    return ExpressionParser()
+
+@pytest.mark.parametrize("text, parts", [
+    ("x < 1, y > 0", ["x < 1", " y > 0"]),
+    ("max(x, y) < 1", ["max(x, y) < 1"]),
+    ("min(x, max(y, z)) < 1, atan2(y, x) > 0", ["min(x, max(y, z)) < 1", " atan2(y, x) > 0"]),
+    ("[x, y], z", ["[x, y]", " z"]),
+])
+def test_split_top_level(text, parts):
+    assert ExpressionParser._split_top_level(text) == parts
+
+def test_region_with_function_arguments(parser):
+    region = parser.parse_region("max(x, y) <= 1, atan2(y, x) > 0", 2)
+    assert region == And(Le(Max(x, y), 1), Gt(atan2(y, x), 0))
+
+def test_region_with_chained_comparison(parser):
+    assert parser.parse_region("0 < x < y, z >= min(x, y)", 3) == And(Lt(0, x), Lt(x, y), Ge(z, Min(x, y)))
+
+def test_multivariable_expression_functions(parser):
+    assert parser.parse_multivariable_expression("max(x, y) + min(y, z)", 3) == Max(x, y) + Min(y, z)
@@ -0,0 +1,68 @@
+import os
+import pickle
+import numpy as np
+import pytest
+from model._custom_generators import create_generator, generate_block
+from model.distribution_model import Distribution
+
+ALGORITHMS = [
+    ("mersenne", {}),
+    ("congruencial", {}),
+    ("xorshift", {}),
+    ("lfsr", {"width": 32}),
+    ("productos_medios", {}),
+    ("productos_cuadraticos", {}),
+    ("halton", {}),
+]
+
+def interrupt_after(distribution, chunks):
+    """Hace que generate_to_file se interrumpa tras escribir chunks bloques."""
+    iter_chunks = distribution.iter_chunks
+
+    def interrupted(count, chunk_size):
+        for index, chunk in enumerate(iter_chunks(count, chunk_size)):
+            if index == chunks:
+                raise KeyboardInterrupt
+            yield chunk
+    distribution.iter_chunks = interrupted
+
+@pytest.mark.parametrize("algorithm,kwargs", ALGORITHMS)
+def test_interrupted_run_resumes_serial_sequence(tmp_path, algorithm, kwargs):
+    path = tmp_path / "sequence.npy"
+    first = Distribution(algorithm, 42, **kwargs)
+    interrupt_after(first, 3)
+    with pytest.raises(KeyboardInterrupt):
+        first.generate_to_file(path, 10000, chunk_size=1000)
+
+    with open(str(path) + ".state", "rb") as state_file:
+        checkpoint = pickle.load(state_file)
+    assert checkpoint["completed"] == 3000
+    assert "generator" not in checkpoint
+
+    Distribution(algorithm, 42, **kwargs).generate_to_file(path, 10000, chunk_size=1000)
+    expected = generate_block(create_generator(algorithm, 42, **kwargs), 10000)
+    np.testing.assert_array_equal(Distribution.load_sequence(path), expected)
+
+def test_resume_rejects_other_sequence(tmp_path):
+    path = tmp_path / "sequence.npy"
+    first = Distribution("mersenne", 42)
+    interrupt_after(first, 1)
+    with pytest.raises(KeyboardInterrupt):
+        first.generate_to_file(path, 5000, chunk_size=1000)
+    with pytest.raises(ValueError):
+        Distribution("mersenne", 43).generate_to_file(path, 5000, chunk_size=1000)
+
+def test_physical_noise_is_not_checkpointed(tmp_path):
+    path = tmp_path / "noise.npy"
+    Distribution("ruido_fisico").generate_to_file(path, 5000, chunk_size=1000)
+    assert not os.path.exists(str(path) + ".state")
+    values = Distribution.load_sequence(path)
+    assert len(values) == 5000 and np.all((values >= 0) & (values < 1))
+
+def test_physical_noise_refuses_to_resume(tmp_path):
+    path = tmp_path / "noise.npy"
+    Distribution("ruido_fisico").generate_to_file(path, 5000, chunk_size=1000)
+    (tmp_path / "noise.npy.state").write_bytes(b"")
+    with pytest.raises(ValueError):
+        Distribution("ruido_fisico").generate_to_file(path, 5000, chunk_size=1000)
+    Distribution("ruido_fisico").generate_to_file(path, 5000, chunk_size=1000, resume=False)
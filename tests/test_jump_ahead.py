@@ -0,0 +1,40 @@
+import copy
+import pytest
+from model._custom_generators import LinearCongruential, LinearCongruentialMultiplicative, Xorshift
+
+GENERATORS = [
+    lambda: LinearCongruential(12345),
+    lambda: LinearCongruential(7, a=1103515245, c=12345, m=2**31),
+    lambda: LinearCongruentialMultiplicative(12345),
+    lambda: Xorshift(12345),
+]
+
+@pytest.mark.parametrize("make", GENERATORS)
+@pytest.mark.parametrize("k", [0, 1, 2, 31, 1000, 4097])
+def test_jump_matches_repeated_next(make, k):
+    stepped = make()
+    for _ in range(k):
+        stepped.next()
+    jumped = make().jump(k)
+    assert [jumped.next() for _ in range(5)] == [stepped.next() for _ in range(5)]
+
+@pytest.mark.parametrize("make", GENERATORS)
+def test_jumps_compose(make):
+    generator = make().jump(300).jump(700)
+    assert generator.next() == make().jump(1000).next()
+
+@pytest.mark.parametrize("make", GENERATORS)
+@pytest.mark.parametrize("i", [0, 1, 3])
+def test_substream_is_offset_copy(make, i):
+    generator = make()
+    generator.next()
+    before = copy.copy(generator)
+    stream = generator.substream(i, stride=500)
+    expected = copy.copy(before).jump(i * 500)
+    assert [stream.next() for _ in range(5)] == [expected.next() for _ in range(5)]
+    assert generator.next() == before.next()  # El generador original no se mueve
+
+@pytest.mark.parametrize("make", GENERATORS)
+def test_negative_jump_rejected(make):
+    with pytest.raises(ValueError):
+        make().jump(-1)
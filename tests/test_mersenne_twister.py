@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from model._custom_generators import MersenneTwister
+
+@pytest.mark.parametrize("seed", [5489, 12345, 0])
+@pytest.mark.parametrize("n", [1, 623, 624, 625, 2000])
+def test_extract_array_matches_extract_number(seed, n):
+    scalar = MersenneTwister(seed)
+    block = MersenneTwister(seed)
+    expected = [scalar.extract_number() for _ in range(n)]
+    np.testing.assert_array_equal(block.extract_array(n), np.array(expected, dtype=np.uint32))
+    assert block.index == scalar.index
+    assert block.mt == scalar.mt
+
+def test_generate_array_matches_next_across_twists():
+    scalar = MersenneTwister(12345)
+    block = MersenneTwister(12345)
+    for n in (10, 700, 1, 1300):  # Bloques que empiezan y terminan en mitad de un twist
+        expected = np.array([scalar.next() for _ in range(n)])
+        np.testing.assert_array_equal(block.generate_array(n), expected)
+    assert block.next() == scalar.next()
+
+def test_reference_output():
+    # Valores de referencia de MT19937 con la semilla por defecto 5489 (salidas 1 y 10000)
+    generator = MersenneTwister(5489)
+    assert generator.extract_number() == 3499211612
+    assert MersenneTwister(5489).extract_array(10000)[-1] == 4123659995
@@ -0,0 +1,32 @@
+from pathlib import Path
+import numpy as np
+import pytest
+from utils.parsers.number_parser import parse_numbers
+
+def test_text_with_mixed_separators():
+    np.testing.assert_array_equal(parse_numbers("0.1, 0.2 0.3\n0.4"), [0.1, 0.2, 0.3, 0.4])
+
+def test_invalid_token_reports_position():
+    with pytest.raises(ValueError, match="'abc' en la posición 1"):
+        parse_numbers("0.1, abc, 0.3")
+
+def test_buffers_lists_and_arrays():
+    values = np.array([0.25, 0.5, 0.75])
+    np.testing.assert_array_equal(parse_numbers(values.tobytes()), values)
+    np.testing.assert_array_equal(parse_numbers([[0.25, 0.5], [0.75, 1.0]]), [0.25, 0.5, 0.75, 1.0])
+    with pytest.raises(ValueError):
+        parse_numbers(b"\x00" * 7)
+    with pytest.raises(ValueError):
+        parse_numbers(["a", "b"])
+
+def test_files_are_read_only_from_path_objects(tmp_path):
+    npy = tmp_path / "numbers.npy"
+    np.save(npy, np.array([0.1, 0.2], dtype=np.float32))
+    csv = tmp_path / "numbers.csv"
+    csv.write_text("valor\n0.5\n0.6\n", encoding="utf-8")
+    np.testing.assert_allclose(parse_numbers(npy), [0.1, 0.2], rtol=1e-7)
+    np.testing.assert_array_equal(parse_numbers(csv), [0.5, 0.6])
+    with pytest.raises(ValueError):
+        parse_numbers(str(csv))  # Una cadena es texto aunque coincida con una ruta existente
+    with pytest.raises(ValueError):
+        parse_numbers(Path(tmp_path / "missing.csv"))
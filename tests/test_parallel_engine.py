@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from model._custom_generators import create_generator, generate_block
+from model._parallel_engine import generate_parallel
+from model.distribution_manager import DistributionManager
+
+@pytest.mark.parametrize("algorithm", ["congruencial", "congruencial_multiplicativo", "xorshift"])
+def test_jump_mode_reproduces_serial_sequence(algorithm):
+    result = generate_parallel(10000, algorithm, seed=99, workers=2, chunk_size=3000)
+    assert result["mode"] == "jump"
+    np.testing.assert_array_equal(result["numbers"], generate_block(create_generator(algorithm, 99), 10000))
+
+def test_mersenne_serial_without_substreams():
+    result = generate_parallel(10000, "mersenne", seed=99, workers=2, chunk_size=3000, substreams=False)
+    assert result["mode"] == "serial"
+    np.testing.assert_array_equal(result["numbers"], generate_block(create_generator("mersenne", 99), 10000))
+
+def test_mersenne_substreams_are_reproducible():
+    first = generate_parallel(10000, "mersenne", seed=99, workers=2, chunk_size=3000)
+    second = generate_parallel(10000, "mersenne", seed=99, workers=3, chunk_size=3000)
+    assert first["mode"] == "substreams"
+    np.testing.assert_array_equal(first["numbers"], second["numbers"])
+    assert len(np.unique(first["numbers"])) == 10000
+
+def test_manager_keeps_parallel_numbers_as_array():
+    manager = DistributionManager()
+    result = manager.generate_random_numbers_parallel(10000, "mersenne", seed=99, workers=2, chunk_size=3000)
+    distribution = manager.get_last_distribution()
+    assert result["mode"] == "substreams"
+    assert isinstance(result["numbers"], np.ndarray)
+    assert distribution.numbers is result["numbers"]
+    assert len(distribution.transform_distribution("exponential")) == 10000
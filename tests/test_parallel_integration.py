@@ -0,0 +1,31 @@
+from math import e
+import numpy as np
+import pytest
+from model._custom_generators import create_generator, generate_block
+from model._parallel_engine import integrate_parallel
+
+@pytest.mark.parametrize("algorithm", ["congruencial", "xorshift", "mersenne"])
+def test_result_does_not_depend_on_worker_count(algorithm):
+    serial = integrate_parallel("exp(x)", 0, 1, 20000, algorithm, seed=5, workers=1, chunk_size=6000)
+    parallel = integrate_parallel("exp(x)", 0, 1, 20000, algorithm, seed=5, workers=2, chunk_size=6000)
+    assert parallel["workers"] == 2
+    assert parallel["result"] == pytest.approx(serial["result"], rel=1e-14)
+    assert parallel["error"] == pytest.approx(serial["error"], rel=1e-12)
+    assert parallel["n_points"] == 20000
+    assert abs(parallel["result"] - (e - 1)) < 5 * parallel["error"]
+
+def test_jump_chunks_merge_to_single_pass_estimate():
+    result = integrate_parallel("x**2", 1, 3, 10000, "xorshift", seed=9, workers=2, chunk_size=3000)
+    values = 2 * (generate_block(create_generator("xorshift", 9), 10000) * 2 + 1) ** 2
+    assert result["result"] == pytest.approx(values.mean(), rel=1e-12)
+    assert result["error"] == pytest.approx(values.std() / np.sqrt(len(values)), rel=1e-9)
+
+def test_generators_without_substreams_run_serially():
+    result = integrate_parallel("x", 0, 1, 5000, "productos_medios", seed=1234, workers=2, chunk_size=1000)
+    assert result["workers"] == 1
+    expected = generate_block(create_generator("productos_medios", 1234), 5000).mean()
+    assert result["result"] == pytest.approx(expected, rel=1e-12)
+
+def test_throughput_reports_every_point():
+    result = integrate_parallel("x", 0, 1, 9000, "congruencial", workers=2, chunk_size=2000)
+    assert sum(stats["count"] for stats in result["throughput"]) == 9000
@@ -0,0 +1,64 @@
+from pathlib import Path
+from time import perf_counter
+import numpy as np
+import pytest
+from model._parameter_sweep import SWEEP_RESULTS, iter_sweep, parameter_grid, run_sweep
+
+GRID = {"beta": [0.2, 0.3, 0.4], "gamma": [0.1, 0.2], "seed": [1, 2]}
+BASE = {"population": 200, "days": 10, "dt": 0.5}
+
+def assert_same_results(first, second):
+    for name in (*GRID, *SWEEP_RESULTS, "completed"):
+        np.testing.assert_array_equal(first[name], second[name])
+
+def test_parameter_grid_order():
+    columns = parameter_grid({"gamma": [0.1, 0.2], "beta": [0.3, 0.4]})
+    np.testing.assert_array_equal(columns["beta"], [0.3, 0.3, 0.4, 0.4])
+    np.testing.assert_array_equal(columns["gamma"], [0.1, 0.2, 0.1, 0.2])
+    with pytest.raises(ValueError):
+        parameter_grid({"delta": [1]})
+
+def test_checkpoint_resume_matches_full_run(tmp_path):
+    checkpoint = str(tmp_path / "sweep.npz")
+    full = run_sweep(GRID, BASE, workers=1)
+    assert full["completed"].all()
+
+    sweep = iter_sweep(GRID, BASE, workers=1, checkpoint=checkpoint, checkpoint_every=2)
+    done = [next(sweep)[0] for _ in range(5)]
+    sweep.close()  # Interrupción: el checkpoint guarda los 5 puntos terminados
+    with np.load(checkpoint) as saved:
+        assert sorted(np.flatnonzero(saved["completed"])) == sorted(done)
+
+    resumed_indices = []
+    resumed = run_sweep(GRID, BASE, workers=1, checkpoint=checkpoint, callback=lambda i, row: resumed_indices.append(i))
+    assert sorted(resumed_indices) == sorted(set(range(len(full["beta"]))) - set(done))
+    assert_same_results(resumed, full)
+
+def test_checkpoint_of_other_grid_is_ignored(tmp_path):
+    checkpoint = str(tmp_path / "sweep.npz")
+    run_sweep({"beta": [0.2, 0.3]}, BASE, workers=1, checkpoint=checkpoint)
+    calls = []
+    run_sweep({"beta": [0.2, 0.5]}, BASE, workers=1, checkpoint=checkpoint, callback=lambda i, row: calls.append(i))
+    assert sorted(calls) == [0, 1]
+
+def test_process_pool_matches_serial():
+    assert_same_results(run_sweep(GRID, BASE, workers=2), run_sweep(GRID, BASE, workers=1))
+
+def test_path_checkpoint(tmp_path):
+    checkpoint = Path(tmp_path / "sweep.npz")
+    first = run_sweep(GRID, BASE, workers=1, checkpoint=checkpoint, checkpoint_every=3)
+    assert checkpoint.exists()
+    calls = []
+    resumed = run_sweep(GRID, BASE, workers=1, checkpoint=checkpoint, callback=lambda i, row: calls.append(i))
+    assert calls == []
+    assert_same_results(resumed, first)
+
+def test_closing_early_cancels_pending_points():
+    grid = {"beta": [0.2 + 0.01 * i for i in range(20)], "seed": [1, 2]}
+    began = perf_counter()
+    sweep = iter_sweep(grid, {"population": 200, "days": 100, "dt": 0.01}, workers=2)
+    next(sweep)
+    first_result = perf_counter() - began
+    sweep.close()
+    # Sin cancelar, close() esperaría a los 40 puntos; con cancelación solo a los que ya están en curso
+    assert perf_counter() - began < 5 * first_result
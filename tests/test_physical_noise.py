@@ -0,0 +1,14 @@
+import numpy as np
+from model._custom_generators import PhysicalNoise
+
+def test_generate_returns_list_like_other_generators():
+    values = PhysicalNoise().generate(10)
+    assert isinstance(values, list) and len(values) == 10
+    assert values + [0.5] == values + [0.5]
+
+def test_generate_array_spans_buffer_refills():
+    generator = PhysicalNoise(buffer_size=64)  # 16 números por lectura de entropía
+    values = generator.generate_array(100)
+    assert values.dtype == np.float64 and len(values) == 100
+    assert np.all((values >= 0) & (values < 1))
+    assert 0 <= generator.next() < 1
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from model._custom_generators import MiddleProduct, QuadraticProduct
+
+def legacy_middle_product(seed, n):
+    """Bucle next() original de MiddleProduct (extracción de los dígitos centrales con cadenas)."""
+    seed = max(1000, abs(seed))
+    current, previous = seed, seed + 1 if seed < 9999 else seed - 1
+    values = []
+    for _ in range(n):
+        text = str(current * previous).zfill(8)
+        middle = len(text) // 2
+        digits = int(text[middle - 2:middle + 2])
+        if digits < 1000:
+            digits += 1000
+        previous, current = current, digits
+        values.append(current / 10000)
+    return values
+
+def legacy_quadratic_product(seed, n):
+    """Bucle next() original de QuadraticProduct."""
+    current = max(1000, abs(seed))
+    values = []
+    for _ in range(n):
+        text = str(current ** 2).zfill(8)
+        middle = len(text) // 2
+        digits = int(text[middle - 2:middle + 2])
+        if digits < 1000:
+            digits += 1000
+        current = digits
+        values.append(current / 10000)
+    return values
+
+SEEDS = [1000, 1234, 5678, 9999, 12345, 31415926]
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_middle_product_matches_legacy_loop(seed):
+    expected = legacy_middle_product(seed, 3000)
+    assert MiddleProduct(seed).generate(3000) == expected
+    generator = MiddleProduct(seed)
+    assert [generator.next() for _ in range(3000)] == expected
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_quadratic_product_matches_legacy_loop(seed):
+    expected = legacy_quadratic_product(seed, 3000)
+    assert QuadraticProduct(seed).generate(3000) == expected
+    generator = QuadraticProduct(seed)
+    assert [generator.next() for _ in range(3000)] == expected
+
+@pytest.mark.parametrize("make", [MiddleProduct, QuadraticProduct])
+@pytest.mark.parametrize("sizes", [[1, 1, 1], [5, 700, 40], [2000, 3]])
+def test_blocks_continue_the_sequence(make, sizes):
+    blocks = make(1234)
+    stepped = make(1234)
+    for n in sizes:
+        np.testing.assert_array_equal(blocks.generate_array(n), [stepped.next() for _ in range(n)])
+    assert blocks.next() == stepped.next()
+
+def test_known_cycles():
+    # Desde (1001, 1000) el producto medio cae tras 3656 pasos en el punto fijo (1000, 1000)
+    assert MiddleProduct(1000).cycle_info() == {"tail_length": 3656, "cycle_length": 1}
+    values = legacy_middle_product(1000, 4000)
+    assert values[3653] != 0.1 and set(values[3654:]) == {0.1}
+    assert QuadraticProduct(1000).cycle_info() == {"tail_length": 0, "cycle_length": 1}  # 1000^2 = 01000000
+    assert QuadraticProduct(1234).cycle_info() == {"tail_length": 108, "cycle_length": 4}
+
+@pytest.mark.parametrize("make", [MiddleProduct, QuadraticProduct])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_cycle_info_matches_brute_force(make, seed):
+    generator = make(seed)
+    info = generator.cycle_info()
+    state = (generator.previous, generator.current) if make is MiddleProduct else generator.current
+    step = make._step
+    seen = {}
+    position = 0
+    while state not in seen:
+        seen[state] = position
+        state = step(state)
+        position += 1
+    assert info == {"tail_length": seen[state], "cycle_length": position - seen[state]}
@@ -0,0 +1,50 @@
+import copy
+import numpy as np
+import pytest
+from model._custom_generators import Halton, Sobol
+
+SOBOL_REFERENCE = [  # Primeros puntos de Sobol en 2 dimensiones sin desplazamiento (orden de código Gray)
+    [0.0, 0.0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75],
+    [0.375, 0.375], [0.875, 0.875], [0.625, 0.125], [0.125, 0.625],
+]
+HALTON_REFERENCE = [  # Inversa radical en bases 2 y 3
+    [0.0, 0.0], [0.5, 1 / 3], [0.25, 2 / 3], [0.75, 1 / 9], [0.125, 4 / 9], [0.625, 7 / 9],
+]
+
+def test_sobol_reference_points():
+    np.testing.assert_array_equal(Sobol(1, 2, scramble=False).generate_points(8), SOBOL_REFERENCE)
+
+def test_halton_reference_points():
+    np.testing.assert_allclose(Halton(1, 2, scramble=False).generate_points(6), HALTON_REFERENCE, rtol=0, atol=1e-15)
+
+def test_sobol_points_are_stratified():
+    points = Sobol(1, 3, scramble=False).generate_points(1024)
+    for j in range(3):  # Cada coordenada de los 2^k primeros puntos recorre la rejilla de paso 2^-k
+        np.testing.assert_array_equal(np.sort(points[:, j]), np.arange(1024) / 1024)
+
+@pytest.mark.parametrize("make", [lambda: Sobol(7, 3), lambda: Halton(7, 3), lambda: Sobol(7, 2, False)])
+def test_scrambled_points_stay_in_unit_cube(make):
+    points = make().generate_points(4096)
+    assert points.shape == (4096, make().dimension)
+    assert np.all((points >= 0) & (points < 1))
+
+@pytest.mark.parametrize("sequence", [Sobol, Halton])
+def test_scramble_depends_on_seed(sequence):
+    assert not np.array_equal(sequence(7, 3).generate_points(16), sequence(8, 3).generate_points(16))
+    np.testing.assert_array_equal(sequence(7, 3).generate_points(16), sequence(7, 3).generate_points(16))
+
+@pytest.mark.parametrize("make", [lambda: Sobol(7, 3), lambda: Halton(7, 3)])
+@pytest.mark.parametrize("k", [0, 1, 5, 1000])
+def test_jump_matches_sequential_points(make, k):
+    stepped = make()
+    stepped.generate_points(k)
+    np.testing.assert_array_equal(make().jump(k).generate_points(10), stepped.generate_points(10))
+
+@pytest.mark.parametrize("make", [lambda: Sobol(7, 3), lambda: Halton(7, 3)])
+def test_substream_leaves_original_untouched(make):
+    generator = make()
+    generator.generate_points(3)
+    before = copy.deepcopy(generator)
+    stream = generator.substream(2, stride=64)
+    np.testing.assert_array_equal(stream.generate_points(4), before.substream(0).jump(128).generate_points(4))
+    np.testing.assert_array_equal(generator.generate_points(4), before.generate_points(4))
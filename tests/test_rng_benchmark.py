@@ -0,0 +1,58 @@
+import csv
+import json
+import numpy as np
+import pytest
+from model._rng_benchmark import benchmark_throughput, evaluate_quality, main, run_benchmark, write_report
+from model._statistical_tests import STATISTICAL_TESTS, chi_square_uniformity, gap_test, kolmogorov_smirnov, runs_test, serial_correlation
+
+@pytest.fixture
+def uniforms():
+    return np.random.default_rng(7).random(50000)
+
+@pytest.mark.parametrize("name", STATISTICAL_TESTS)
+def test_good_uniforms_pass(name, uniforms):
+    result = STATISTICAL_TESTS[name](uniforms)
+    assert 0.001 < result["p_value"] <= 1
+
+def test_defective_sequences_fail(uniforms):
+    assert chi_square_uniformity(uniforms ** 2)["p_value"] < 1e-6
+    assert kolmogorov_smirnov(uniforms * 0.9)["p_value"] < 1e-6
+    assert runs_test(np.sort(uniforms))["p_value"] < 1e-6
+    assert serial_correlation((uniforms[1:] + uniforms[:-1]) / 2)["p_value"] < 1e-6  # Media móvil: r = 0.5
+    assert gap_test(np.tile([0.1, 0.7], 5000))["p_value"] < 1e-6
+
+def test_p_values_match_reference_distributions():
+    # Chi-cuadrado con 1 grado de libertad: estadístico 3.8416 corresponde a p = 0.05
+    result = chi_square_uniformity(np.r_[np.full(5098, 0.25), np.full(4902, 0.75)], bins=2)
+    assert result["statistic"] == pytest.approx(3.8416)
+    assert result["p_value"] == pytest.approx(0.05, abs=1e-4)
+    # KS: D = 0.5 con un solo valor en 0.5
+    assert kolmogorov_smirnov([0.5])["statistic"] == 0.5
+
+def test_throughput_rows():
+    rows = benchmark_throughput("mersenne", batch_sizes=(100, 1000), repeats=1)
+    assert [row["batch_size"] for row in rows] == [100, 1000]
+    assert all(row["kind"] == "throughput" and row["numbers_per_sec"] > 0 for row in rows)
+
+def test_quality_is_reproducible():
+    first = evaluate_quality("xorshift", sample_size=5000, seed=3)
+    assert [row["test"] for row in first] == list(STATISTICAL_TESTS)
+    assert first == evaluate_quality("xorshift", sample_size=5000, seed=3)
+
+@pytest.mark.parametrize("extension", [".json", ".csv"])
+def test_report_round_trip(tmp_path, extension):
+    report = run_benchmark(["mersenne", "congruencial"], batch_sizes=(100,), sample_size=2000, repeats=1)
+    path = write_report(report, tmp_path / f"report{extension}")
+    if extension == ".json":
+        with open(path, encoding="utf-8") as report_file:
+            assert json.load(report_file)["results"] == json.loads(json.dumps(report["results"]))
+    else:
+        with open(path, newline="", encoding="utf-8") as report_file:
+            rows = list(csv.DictReader(report_file))
+        assert len(rows) == len(report["results"]) == 2 * (1 + len(STATISTICAL_TESTS))
+
+def test_command_line(tmp_path, capsys):
+    main(["--algorithms", "mersenne", "--batch-sizes", "100", "--sample-size", "2000", "--repeats", "1",
+          "--output", str(tmp_path / "report.json")])
+    output = capsys.readouterr().out
+    assert "mersenne" in output and "report.json" in output
@@ -0,0 +1,94 @@
+from math import exp, lgamma, log
+import numpy as np
+import pytest
+from model._dis_transform import DistributionTransformer, POISSON_PTRS_THRESHOLD
+
+SIZE = 100000
+
+def assert_pmf_close(samples, log_pmf, support, tolerance=0.005):
+    """Compara la frecuencia observada de cada valor de support con la probabilidad exacta."""
+    values, counts = np.unique(samples, return_counts=True)
+    observed = dict(zip(values.tolist(), (counts / len(samples)).tolist()))
+    observed = np.array([observed.get(k, 0.0) for k in support])
+    expected = np.array([exp(log_pmf(k)) for k in support])
+    assert np.max(np.abs(observed - expected)) < tolerance
+
+@pytest.mark.parametrize("lambda_param", [3.0, POISSON_PTRS_THRESHOLD, 50.0, 1e4])
+def test_poisson_exact_size_and_moments(lambda_param, uniform_source):
+    samples, stats = DistributionTransformer.sample_poisson(lambda_param, SIZE, uniform_source(), return_stats=True)
+    assert samples.shape == (SIZE,) and samples.dtype == np.int64
+    assert samples.min() >= 0
+    assert abs(samples.mean() - lambda_param) < 5 * np.sqrt(lambda_param / SIZE)
+    assert abs(samples.var() / lambda_param - 1) < 0.03
+    assert 0 < stats["acceptance_rate"] <= 1
+
+def test_poisson_ptrs_distribution(uniform_source):
+    lambda_param = 30.0
+    samples = DistributionTransformer.sample_poisson(lambda_param, SIZE, uniform_source(7))
+    assert_pmf_close(samples, lambda k: -lambda_param + k * log(lambda_param) - lgamma(k + 1), np.arange(10, 55))
+
+def test_poisson_is_reproducible(uniform_source):
+    first = DistributionTransformer.sample_poisson(40.0, 1000, uniform_source(3))
+    second = DistributionTransformer.sample_poisson(40.0, 1000, uniform_source(3))
+    np.testing.assert_array_equal(first, second)
+
+@pytest.mark.parametrize("n, p", [(20, 0.3), (1000, 0.3), (1000, 0.9), (10**6, 0.01), (50, 0.0), (50, 1.0)])
+def test_binomial_exact_size_and_moments(n, p, uniform_source):
+    samples = DistributionTransformer.sample_binomial(n, p, SIZE, uniform_source())
+    assert samples.shape == (SIZE,) and samples.dtype == np.int64
+    assert samples.min() >= 0 and samples.max() <= n
+    variance = n * p * (1 - p)
+    assert abs(samples.mean() - n * p) <= 5 * np.sqrt(variance / SIZE)
+    if variance:
+        assert abs(samples.var() / variance - 1) < 0.03
+
+def test_binomial_btpe_distribution(uniform_source):
+    n, p = 200, 0.4
+    log_pmf = lambda k: lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1) + k * log(p) + (n - k) * log(1 - p)
+    samples = DistributionTransformer.sample_binomial(n, p, SIZE, uniform_source(7))
+    assert_pmf_close(samples, log_pmf, np.arange(55, 106))
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize("n, p", [(60, 0.5), (1000, 0.3), (10**6, 0.01)])
+def test_binomial_btpe_takes_no_invalid_logs(n, p, uniform_source):
+    samples = DistributionTransformer.sample_binomial(n, p, SIZE, uniform_source(11))
+    assert np.all((samples >= 0) & (samples <= n))
+
+@pytest.mark.parametrize("alpha, beta", [(0.3, 1.0), (1.0, 2.0), (2.5, 0.5), (40.0, 1.0)])
+def test_gamma_exact_size_and_moments(alpha, beta, uniform_source):
+    samples, stats = DistributionTransformer.sample_gamma(alpha, beta, SIZE, uniform_source(), return_stats=True)
+    assert samples.shape == (SIZE,) and samples.dtype == np.float64
+    assert np.all(samples > 0)
+    assert abs(samples.mean() / (alpha * beta) - 1) < 5 / np.sqrt(alpha * SIZE)
+    assert abs(samples.var() / (alpha * beta * beta) - 1) < 0.05
+    assert stats["acceptance_rate"] > 0.9  # Marsaglia-Tsang acepta más del 95 % de las propuestas
+
+@pytest.mark.parametrize("alpha, beta", [(0.5, 0.5), (2.0, 5.0), (30.0, 3.0)])
+def test_beta_exact_size_and_moments(alpha, beta, uniform_source):
+    samples = DistributionTransformer.sample_beta(alpha, beta, SIZE, uniform_source())
+    assert samples.shape == (SIZE,)
+    assert np.all((samples >= 0) & (samples <= 1))
+    mean = alpha / (alpha + beta)
+    variance = alpha * beta / ((alpha + beta) ** 2 * (alpha + beta + 1))
+    assert abs(samples.mean() - mean) < 5 * np.sqrt(variance / SIZE)
+    assert abs(samples.var() / variance - 1) < 0.03
+
+@pytest.mark.parametrize("size", [0, 1, 7, 4097])
+def test_gamma_and_beta_return_requested_count(size, uniform_source):
+    assert len(DistributionTransformer.sample_gamma(1.5, 1.0, size, uniform_source())) == size
+    assert len(DistributionTransformer.sample_beta(1.5, 2.0, size, uniform_source())) == size
+
+@pytest.mark.parametrize("alpha, per_value", [(2.5, 2), (0.4, 3)])
+def test_gamma_uses_both_normals_of_each_pair(alpha, per_value, uniform_source):
+    source = uniform_source()
+    drawn = []
+    counting = lambda n: drawn.append(n) or source(n)
+    _, stats = DistributionTransformer.sample_gamma(alpha, 1.0, SIZE, counting, return_stats=True)
+    assert sum(drawn) < 1.25 * per_value * SIZE  # Con cuatro uniformes por propuesta serían más de 4 * SIZE
+    assert stats["acceptance_rate"] > 0.9
+
+def test_gamma_rejects_invalid_parameters(uniform_source):
+    with pytest.raises(ValueError):
+        DistributionTransformer.sample_gamma(0, 1.0, 10, uniform_source())
+    with pytest.raises(ValueError):
+        DistributionTransformer.sample_beta(1.0, -1.0, 10, uniform_source())
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from model._custom_generators import create_generator, generate_block
+from model._sequence_cache import MAX_CHECKPOINTS, SequenceCache
+
+ALGORITHMS = ["mersenne", "congruencial", "congruencial_multiplicativo", "xorshift", "lfsr",
+              "productos_medios", "productos_cuadraticos"]
+
+def uncached(algorithm, seed, count):
+    return generate_block(create_generator(algorithm, seed), count)
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_cached_prefix_matches_generator(algorithm):
+    cache = SequenceCache()
+    np.testing.assert_array_equal(cache.take(algorithm, 1234, 100), uncached(algorithm, 1234, 100))
+    np.testing.assert_array_equal(cache.take(algorithm, 1234, 700), uncached(algorithm, 1234, 700))
+    np.testing.assert_array_equal(cache.take(algorithm, 1234, 50), uncached(algorithm, 1234, 50))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("count", [0, 30, 500, 1000])
+def test_returned_generator_continues_sequence(algorithm, count):
+    cache = SequenceCache()
+    cache.take(algorithm, 1234, 200)
+    cache.take(algorithm, 1234, 1000)
+    numbers, generator = cache.take(algorithm, 1234, count, return_generator=True)
+    expected = uncached(algorithm, 1234, count + 20)
+    np.testing.assert_array_equal(numbers, expected[:count])
+    np.testing.assert_array_equal(generate_block(generator, 20), expected[count:])
+    # El generador entregado es independiente: la caché sigue intacta
+    np.testing.assert_array_equal(cache.take(algorithm, 1234, 1000), uncached(algorithm, 1234, 1000))
+
+def test_checkpoints_are_bounded():
+    cache = SequenceCache()
+    for count in range(1, 40):
+        cache.take("mersenne", 1, count * 10)
+    entry = cache._entries[cache.key("mersenne", 1)]
+    assert len(entry.checkpoints) <= MAX_CHECKPOINTS
+    assert 0 in entry.checkpoints
+
+def test_eviction_keeps_most_recent_entries():
+    cache = SequenceCache(max_bytes=1000 * 8)
+    cache.take("mersenne", 1, 600)
+    cache.take("mersenne", 2, 600)
+    assert cache.key("mersenne", 1) not in cache
+    assert cache.key("mersenne", 2) in cache
+    assert cache.nbytes <= cache.max_bytes
+
+def test_parameters_are_part_of_the_key():
+    cache = SequenceCache()
+    default = cache.take("congruencial", 7, 10)
+    custom = cache.take("congruencial", 7, 10, {"a": 22695477, "c": 1, "m": 2**32})
+    assert not np.array_equal(default, custom)
+    assert len(cache) == 2
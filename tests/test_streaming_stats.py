@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from model._streaming_stats import RunningMoments, StreamingHistogram, StreamSummary, TDigest, summarize_array
+
+def direct_moments(values):
+    deviations = values - values.mean()
+    m2 = np.mean(deviations ** 2)
+    return values.mean(), m2, np.mean(deviations ** 3) / m2 ** 1.5, np.mean(deviations ** 4) / m2 ** 2 - 3
+
+def assert_matches(moments, values):
+    mean, variance, skewness, kurtosis = direct_moments(values)
+    assert moments.count == len(values)
+    assert moments.mean == pytest.approx(mean, rel=1e-12, abs=1e-12)
+    assert moments.variance() == pytest.approx(variance, rel=1e-10)
+    assert moments.variance(ddof=1) == pytest.approx(values.var(ddof=1), rel=1e-10)
+    assert moments.skewness() == pytest.approx(skewness, rel=1e-8, abs=1e-10)
+    assert moments.kurtosis() == pytest.approx(kurtosis, rel=1e-8, abs=1e-10)
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(1).gamma(2.0, 3.0, 10007) + 1e6  # Desplazados para exigir estabilidad numérica
+
+def test_from_values_matches_direct(values):
+    assert_matches(RunningMoments.from_values(values), values)
+
+@pytest.mark.parametrize("sizes", [[1, 10006], [5000, 5007], [3, 1000, 4, 9000]])
+def test_merge_matches_direct(values, sizes):
+    chunks = np.split(values, np.cumsum(sizes)[:-1])
+    merged = RunningMoments()
+    for chunk in chunks:
+        merged.merge(RunningMoments.from_values(chunk))
+    assert_matches(merged, values)
+
+def test_merge_is_order_independent(values):
+    chunks = np.array_split(values, 8)
+    tree = [RunningMoments.from_values(chunk) for chunk in chunks]
+    while len(tree) > 1:  # Combinación por parejas, como entre procesos
+        tree = [tree[i].merge(tree[i + 1]) for i in range(0, len(tree), 2)]
+    assert_matches(tree[0], values)
+
+def test_update_one_value_at_a_time():
+    values = np.array([2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0])
+    moments = RunningMoments()
+    for value in values:
+        moments.update([value])
+    assert moments.mean == pytest.approx(5.0)
+    assert moments.variance() == pytest.approx(4.0)
+    assert_matches(moments, values)
+
+def test_empty_moments():
+    moments = RunningMoments().merge(RunningMoments.from_values([]))
+    assert moments.count == 0
+    assert moments.variance() == 0.0
+    assert moments.standard_error() == float("inf")
+
+def test_histogram_matches_numpy_and_merges():
+    values = np.random.default_rng(2).normal(size=20000)
+    first, second = StreamingHistogram(-3, 3, 40), StreamingHistogram(-3, 3, 40)
+    first.update(values[:7000])
+    second.update(values[7000:])
+    merged = first.merge(second)
+    counts, edges = np.histogram(values, bins=40, range=(-3, 3))
+    np.testing.assert_array_equal(merged.counts, counts)
+    np.testing.assert_allclose(merged.edges, edges)
+    assert merged.underflow == np.count_nonzero(values < -3)
+    assert merged.overflow == np.count_nonzero(values > 3)
+    with pytest.raises(ValueError):
+        merged.merge(StreamingHistogram(-3, 3, 20))
+
+@pytest.mark.parametrize("q", [0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999])
+def test_tdigest_quantiles(q):
+    values = np.random.default_rng(3).exponential(size=200000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 13):
+        digest.merge(TDigest().update(chunk))
+    assert len(digest.weights) < 500  # Memoria acotada por la compresión, no por el número de valores
+    assert digest.count == len(values)
+    # Error en rango de cuantil, menor en las colas
+    assert abs(np.mean(values <= digest.quantile(q)) - q) < 0.01 * max(4 * q * (1 - q), 0.1)
+
+def test_summary_merge_matches_single_pass():
+    values = np.random.default_rng(4).uniform(size=30000)
+    left = StreamSummary(range=(0, 1)).update(values[:10000])
+    right = StreamSummary(range=(0, 1)).update(values[10000:])
+    merged = left.merge(right).summary()
+    single = StreamSummary(range=(0, 1)).update(values).summary()
+    assert merged["count"] == single["count"] == len(values)
+    assert merged["histogram"] == single["histogram"]
+    assert merged["mean"] == pytest.approx(single["mean"])
+    assert merged["variance"] == pytest.approx(single["variance"])
+
+def test_summarize_array():
+    values = np.arange(100001, dtype=np.float64)
+    summary = summarize_array(values, chunk_size=4096)
+    assert summary["count"] == len(values)
+    assert (summary["min"], summary["max"]) == (0.0, 100000.0)
+    assert summary["mean"] == pytest.approx(50000.0)
+    assert sum(summary["histogram"]["counts"]) == len(values)
+    assert summary["quantiles"][0.5] == pytest.approx(50000.0, rel=1e-3)
+    with pytest.raises(ValueError):
+        summarize_array([])
@@ -0,0 +1,67 @@
+from pathlib import Path
+import numpy as np
+import pytest
+from model.distribution_manager import SUMMARY_THRESHOLD, DistributionManager
+
+ONE_TO_ONE = [("exponential", {"lambda": 2.0}), ("poisson", {"lambda": 3.0}), ("binomial", {"n": 10, "p": 0.4})]
+
+@pytest.fixture(scope="module")
+def manager():
+    return DistributionManager()
+
+@pytest.mark.parametrize("distribution, params", ONE_TO_ONE)
+@pytest.mark.parametrize("count", [1, 2, 7, 64])
+def test_one_value_per_uniform(manager, distribution, params, count):
+    uniforms = np.linspace(0.01, 0.99, count)
+    result = manager.transform_numbers(uniforms, distribution, **params)
+    assert isinstance(result["original"], list) and isinstance(result["transformed"], list)
+    assert len(result["original"]) == len(result["transformed"]) == count
+
+@pytest.mark.parametrize("count", [2, 7, 64])
+def test_normal_uses_complete_pairs_only(manager, count):
+    result = manager.transform_numbers(np.linspace(0.01, 0.99, count), "normal")
+    assert len(result["transformed"]) == count - count % 2
+
+@pytest.mark.parametrize("distribution, params, per_value", [
+    ("gamma", {"alpha": 2.0, "beta": 1.5}, 2), ("gamma", {"alpha": 0.5, "beta": 1.0}, 3), ("beta", {"alpha": 2.0, "beta": 3.0}, 4),
+])
+def test_rejection_methods_use_only_supplied_uniforms(manager, distribution, params, per_value):
+    uniforms = np.random.default_rng(3).uniform(0.01, 0.99, 4000)
+    distribution_model = manager.create_distribution("mersenne", 7)
+    state = distribution_model.generator.mt.copy(), distribution_model.generator.index
+    first = distribution_model.transform_distribution(distribution, params, uniforms)
+    assert (distribution_model.generator.mt, distribution_model.generator.index) == state
+    assert first == distribution_model.transform_distribution(distribution, params, uniforms)
+    assert 0.9 * len(uniforms) / per_value < len(first) <= len(uniforms) / per_value
+
+def test_gamma_below_one_follows_gamma_law(manager):
+    uniforms = np.random.default_rng(4).uniform(size=600000)
+    samples = np.array(manager.transform_numbers(uniforms, "gamma", alpha=0.5, beta=2.0)["transformed"])
+    assert abs(samples.mean() / 1.0 - 1) < 0.01
+    assert abs(samples.var() / 2.0 - 1) < 0.03
+
+@pytest.mark.parametrize("distribution, count", [("normal", 1), ("gamma", 3), ("beta", 7)])
+def test_too_few_uniforms_rejected(manager, distribution, count):
+    with pytest.raises(ValueError):
+        manager.transform_numbers(np.full(count, 0.5), distribution)
+
+def test_input_types_give_same_result(manager):
+    expected = manager.transform_numbers([0.1, 0.5, 0.9], "exponential")["transformed"]
+    for source in ("0.1, 0.5 0.9", np.array([0.1, 0.5, 0.9]).tobytes(), np.array([0.1, 0.5, 0.9])):
+        assert manager.transform_numbers(source, "exponential")["transformed"] == expected
+
+def test_file_input(manager, tmp_path):
+    path = tmp_path / "uniforms.npy"
+    np.save(path, np.array([0.1, 0.5, 0.9]))
+    assert manager.transform_numbers(Path(path), "exponential")["original"] == [0.1, 0.5, 0.9]
+
+def test_values_outside_unit_interval_rejected(manager):
+    with pytest.raises(ValueError):
+        manager.transform_numbers("0.5, 1.5", "exponential")
+
+def test_summary_only_for_large_inputs(manager):
+    assert manager.transform_numbers(np.full(SUMMARY_THRESHOLD, 0.5), "exponential")["summary"] is None
+    uniforms = np.random.default_rng(5).uniform(0.01, 0.99, SUMMARY_THRESHOLD + 1)
+    summary = manager.transform_numbers(uniforms, "exponential")["summary"]
+    assert summary["original"]["count"] == summary["transformed"]["count"] == SUMMARY_THRESHOLD + 1
+    assert summary["original"]["mean"] == pytest.approx(uniforms.mean())
@@ -0,0 +1,43 @@
+from math import e
+import numpy as np
+import pytest
+from model._variance_reduction import VARIANCE_REDUCTION_METHODS, importance, reduce_variance, stratified
+
+@pytest.mark.parametrize("method", VARIANCE_REDUCTION_METHODS)
+def test_methods_estimate_integral(method, uniform_source):
+    result = reduce_variance(method, np.exp, 0.0, 1.0, 20000, uniform_source())
+    assert abs(result["result"] - (e - 1)) < 5 * result["error"] + 1e-12
+    assert result["variance_reduction_factor"] > 1
+
+@pytest.mark.parametrize("n_points, strata", [(1000, None), (1001, None), (1001, 7), (10, 100), (2, None)])
+def test_stratified_evaluates_exactly_n_points(n_points, strata, uniform_source):
+    calls = []
+    f = lambda x: calls.append(len(x)) or x * x
+    result = stratified(f, 0.0, 1.0, n_points, uniform_source(), strata)
+    assert result["n_points"] == n_points == sum(calls)
+    assert np.isfinite(result["error"])
+
+def test_stratified_single_point_has_unknown_error(uniform_source):
+    assert stratified(np.exp, 0.0, 1.0, 1, uniform_source())["error"] == float("inf")
+
+def test_importance_fits_exponential_to_integrand(uniform_source):
+    fitted = importance(np.exp, 0.0, 1.0, 20000, uniform_source())
+    uniform = importance(np.exp, 0.0, 1.0, 20000, uniform_source(), density="uniform")
+    assert fitted["error"] < uniform["error"] / 10  # Para exp(x) la exponencial ajustada es proporcional a f
+    assert fitted["result"] == pytest.approx(e - 1)
+
+def test_importance_falls_back_to_uniform_when_integrand_vanishes(uniform_source):
+    result = importance(lambda x: x, 0.0, 1.0, 20000, uniform_source())
+    assert abs(result["result"] - 0.5) < 5 * result["error"]
+
+def test_importance_beta_requires_positive_density_where_f_is_not_zero(uniform_source):
+    with pytest.raises(ValueError):
+        importance(np.exp, 0.0, 1.0, 1000, uniform_source(), density="beta", params={"alpha": 2.0, "beta": 1.0})
+    result = importance(lambda x: x, 0.0, 1.0, 20000, uniform_source(), density="beta", params={"alpha": 2.0, "beta": 1.0})
+    assert result["result"] == pytest.approx(0.5)  # g(x) = 2x es proporcional a f: varianza nula
+
+def test_unknown_method_and_density(uniform_source):
+    with pytest.raises(ValueError):
+        reduce_variance("quasi", np.exp, 0.0, 1.0, 10, uniform_source())
+    with pytest.raises(ValueError):
+        importance(np.exp, 0.0, 1.0, 10, uniform_source(), density="normal")
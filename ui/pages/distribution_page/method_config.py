@@ -60,6 +60,26 @@ METHOD_CONFIG = {
     }
 }
 
+# Secuencias de baja discrepancia: no son extracciones independientes, así que solo se ofrecen para integrar
+QUASI_RANDOM_CONFIG = {
+    "halton": {
+        "display_name": "Halton (cuasi-aleatorio)",
+        "fields": [
+            {"name": "count", "label": "🔢 Cantidad:", "type": "int", "default": 5,     "min": 1, "max": 1000},
+            {"name": "seed",  "label": "🌱 Semilla:",   "type": "int", "default": 12345, "min": 1, "max": 999999}
+        ]
+    },
+    "sobol": {
+        "display_name": "Sobol (cuasi-aleatorio)",
+        "fields": [
+            {"name": "count", "label": "🔢 Cantidad:", "type": "int", "default": 5,     "min": 1, "max": 1000},
+            {"name": "seed",  "label": "🌱 Semilla:",   "type": "int", "default": 12345, "min": 1, "max": 999999}
+        ]
+    }
+}
+
+MONTE_CARLO_METHOD_CONFIG = {**METHOD_CONFIG, **QUASI_RANDOM_CONFIG}
+
 MONTE_CARLO_CONFIG = {
     "fields": [
         {"name": "lower_limit", "label": "🔢 Límites: x =", "type": "float", "default": 0, "min": -1000, "max": 1000, "width": 60},
@@ -82,7 +102,8 @@ MARKOV_CONFIG = {
     "simulation_params": [
         {"name": "days", "label": "📅 Días a simular:", "type": "int", "default": 30, "min": 1, "max": 365, "width": 80},
         {"name": "dt", "label": "⏱️ Intervalo de tiempo (dt):", "type": "float", "default": 0.1, "min": 0.01, "max": 1.0, "width": 80},
-        {"name": "seed", "label": "🔑 Semilla:", "type": "int", "default": 42, "min": 0, "max": 999999, "width": 80}
+        {"name": "seed", "label": "🔑 Semilla:", "type": "int", "default": 42, "min": 0, "max": 999999, "width": 80},
+        {"name": "replicates", "label": "🔁 Réplicas:", "type": "int", "default": 1, "min": 1, "max": 1000, "width": 80}
     ]
 }
 
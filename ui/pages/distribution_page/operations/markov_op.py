@@ -55,7 +55,8 @@ class MarkovOperation(DistributionBaseOpWidget):
                 "days": self.days_spinbox.value(),
                 "dt": self.dt_spinbox.value(),
                 "algorithm": self.markov_method_combo.currentData(),
-                "seed": self.seed_spinbox.value()
+                "seed": self.seed_spinbox.value(),
+                "replicates": self.replicates_spinbox.value()
             }
 
             # Ejecutar simulación a través del controlador
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import QWidget
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QComboBox
 from ..distribution_base import DistributionBaseOpWidget
-from ..method_config import METHOD_CONFIG, MONTE_CARLO_CONFIG
+from ..method_config import MONTE_CARLO_METHOD_CONFIG, MONTE_CARLO_CONFIG
 from utils.formating.formatting import format_math_expression
 from utils.components.two_column import TwoColumnWidget
 
@@ -25,7 +25,7 @@ class MonteCarloOp(DistributionBaseOpWidget):
         
         mc_method_layout.addWidget(QLabel("🟠 Algoritmo aleatorio:"))
         self.mc_method_combo = QComboBox()
-        for key, config in METHOD_CONFIG.items():
+        for key, config in MONTE_CARLO_METHOD_CONFIG.items():
             self.mc_method_combo.addItem(config["display_name"], key)
         mc_method_layout.addWidget(self.mc_method_combo)
         mc_method_layout.addStretch()
@@ -152,7 +152,8 @@ class TransformOp(DistributionBaseOpWidget):
                 "generation_method": "manual",  # Ya que son números ingresados manualmente
                 "transform_method": distribution_type,
                 "transform_params": transform_params,
-                "original_numbers": transform_result.get("original", [])
+                "original_numbers": transform_result.get("original", []),
+                "summary": transform_result.get("summary")
             }
             
             # 6. Formatear el resultado usando el operation_type correcto
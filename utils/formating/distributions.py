@@ -1,3 +1,4 @@
+from html import escape
 from .base import create_section, clean_number
 from .polynomials import format_polynomial
 from ..patterns import COLORS, ICONS
@@ -5,8 +6,39 @@ from ..patterns import COLORS, ICONS
 from utils.core.font_weight_manager import FontWeightManager
 bold = FontWeightManager.get_weight("strong")
 
-def format_transform_distribution_result(original_data, transformed_data, method, transform_method, transform_params):
-    """Formatea el resultado de la transformación de distribuciones"""
+def format_stream_summary(summaries):
+    """Tabla con conteo, momentos, extremos y cuantiles de cada serie de {título: resumen}."""
+    first = next(iter(summaries.values()))
+    rows = [("Total", "count"), ("Media", "mean"), ("Desviación típica", "std"), ("Asimetría", "skewness"),
+            ("Curtosis (exceso)", "kurtosis"), ("Mínimo", "min")]
+    rows += [(f"Cuantil {clean_number(q)}", q) for q in first["quantiles"]]
+    rows.append(("Máximo", "max"))
+
+    cell = "padding: 8px; border-bottom: 1px solid #EEEEEE; text-align: center;"
+    table_html = (
+        "<div style='margin: 15px 0; padding: 15px; border-radius: 8px; "
+        "display: flex; justify-content: center; align-items: center;'>"
+        "<table style='width: 80%; border-collapse: collapse; text-align: center;'>"
+        "<thead><tr>"
+        f"<th style='padding: 12px; border-bottom: 2px solid #ff8103; color: #2196F3; font-weight: {bold};'>Estadístico</th>"
+    )
+    for title in summaries:
+        table_html += f"<th style='padding: 12px; border-bottom: 2px solid #ff8103; color: #9C27B0; font-weight: {bold};'>{escape(title)}</th>"
+    table_html += "</tr></thead><tbody>"
+    for label, key in rows:
+        table_html += f"<tr><td style='{cell}'>{label}</td>"
+        for summary in summaries.values():
+            value = summary["quantiles"][key] if not isinstance(key, str) else summary[key]
+            table_html += f"<td style='{cell}'>{clean_number(value)}</td>"
+        table_html += "</tr>"
+    return table_html + "</tbody></table></div>"
+
+def format_transform_distribution_result(original_data, transformed_data, method, transform_method, transform_params, summary=None):
+    """Formatea el resultado de la transformación de distribuciones.
+
+    summary ({"original": resumen, "transformed": resumen}, calculado en el modelo) se muestra como tabla
+    de estadísticos cuando los datos no caben en la tabla de valores.
+    """
     # Límite de datos a mostrar
     max_display = 900
     display_all = len(original_data) <= max_display
@@ -69,6 +101,18 @@ def format_transform_distribution_result(original_data, transformed_data, method
         "</div>"
     )
     
+    # Con muestras grandes, resumen estadístico en lugar de imprimir cada valor
+    if not display_all and summary:
+        summary_html = format_stream_summary({
+            "Uniforme [0,1]": summary["original"],
+            transform_display: summary["transformed"]
+        })
+        return (
+            create_section('Configuración:', operation_info, COLORS['secondary'], ICONS['operation']) +
+            create_section('Resumen estadístico:', summary_html, COLORS['primary'], ICONS['result']) +
+            create_section(f'Primeros {max_display} valores:', table_html, COLORS['primary'], ICONS['result'])
+        )
+
     # Crear las secciones con el diseño estándar de la aplicación
     return (
         create_section(
@@ -178,11 +222,21 @@ def format_monte_carlo_result(result):
     a = result.get("a", "N/A")
     b = result.get("b", "N/A")
     expression = result.get("expression", "N/A")
+    if "bounds" in result:
+        # Integral múltiple: un intervalo por variable y, opcionalmente, la región de integración
+        limits = ", ".join(
+            f"{variable} ∈ [{clean_number(lower)}, {clean_number(upper)}]"
+            for variable, (lower, upper) in zip(result.get("variables", []), result["bounds"])
+        )
+        if "region" in result:
+            limits += f"</li><li><b>Región:</b> {escape(result['region'])}"
+    else:
+        limits = f"[a = {clean_number(a)}, b = {clean_number(b)}]"
     # Crear secciones para los parámetros y resultados
     params_html = (
         f"<div style='margin-left: 2px;'>"
         f"<ul>"
-        f"<li><b>Límites:</b> [a = {clean_number(a)}, b = {clean_number(b)}]</li>"
+        f"<li><b>Límites:</b> {limits}</li>"
         f"<li><b>Número de puntos:</b> {clean_number(n_points)}</li>"
         f"<li><b>Expresión:</b> {format_polynomial(expression)}</li>"
         f"</ul>"
@@ -64,5 +64,6 @@ def format_math_expression(expr, result, operation_type="generic", method=None):
             result, 
             generation_method,
             transform_method, 
-            transform_params
+            transform_params,
+            expr.get("summary")
         )
\ No newline at end of file
@@ -2,7 +2,7 @@ from sympy.parsing.sympy_parser import standard_transformations,implicit_multipl
 from model.polynomial_model import Polynomial
 from utils.validators.expression_validators import exponents_validator, validate_characters, validate_parentheses,validate_symbols,validate_expression_syntax
 from utils.patterns import MATH_SYMBOLS, ODE_PATTERNS, SPECIAL_CHARS, ALLOWED_CHARS, ALLOWED_DIFFERENTIAL_CHARS
-from sympy import Function, sin, cos, tan, ln, log, sqrt, exp, Abs, E, pi, Rational, Derivative, Eq, lambdify, expand, Poly, Symbol
+from sympy import Function, sin, cos, tan, ln, log, sqrt, exp, Abs, E, pi, Rational, Derivative, Eq, lambdify, expand, Poly, Symbol, And, Lt, Le, Gt, Ge, Max, Min, atan2
 from numpy import isfinite
 import re
 import functools
@@ -33,6 +33,7 @@ class ExpressionParser:
         self.x = Symbol('x')
         self.y = Function('y')  # y(x) como función simbólica para 2D
         self.y_symbol = Symbol('y')  # y como variable independiente para 3D
+        self.z_symbol = Symbol('z')  # z como tercera variable de las integrales múltiples
 
         self.transformations = (standard_transformations +(implicit_multiplication_application, convert_xor, implicit_application))
 
@@ -61,6 +62,10 @@ class ExpressionParser:
         self.allowed_symbols_3d = self.common_symbols.copy() # Símbolos para expresiones 3D (y es una variable independiente)
         self.allowed_symbols_3d.update({"x": self.x, "y": self.y_symbol}) # y como variable independiente
 
+        self.allowed_symbols_nd = self.common_symbols.copy() # Símbolos para integrales múltiples (x, y, z independientes)
+        self.allowed_symbols_nd.update({"x": self.x, "y": self.y_symbol, "z": self.z_symbol, "max": Max, "min": Min, "atan2": atan2})
+        self.nd_variables = (self.x, self.y_symbol, self.z_symbol)
+
         # Nombres permitidos para la validación de símbolos
         self.allowed_names = set(self.common_symbols.keys()) | {"x", "y", "dx", "dy"}
 
@@ -79,7 +84,7 @@ class ExpressionParser:
                 
         return expr
 
-    def validate_expression(self, expr: str, max_length: int, allowed_chars: set, is_differential: bool = False, use_3d: bool = False):
+    def validate_expression(self, expr: str, max_length: int, allowed_chars: set, is_differential: bool = False, use_3d: bool = False, allowed_names: set = None):
         """Realiza todas las validaciones comunes para una expresión matemática."""
         if not expr.strip():
             raise ValueError("La expresión está vacía.")
@@ -103,7 +108,7 @@ class ExpressionParser:
         if not is_valid:
             raise ValueError(error_msg)
 
-        is_valid, error_msg = validate_symbols(expr, self.allowed_names, use_3d or is_differential, is_differential) # Validar símbolos
+        is_valid, error_msg = validate_symbols(expr, allowed_names or self.allowed_names, use_3d or is_differential, is_differential) # Validar símbolos
         if not is_valid:
             raise ValueError(error_msg)
 
@@ -122,6 +127,66 @@ class ExpressionParser:
 
         return expand(parsed)
 
+    def _validate_variables(self, parsed, dimension):
+        """Comprueba que la expresión solo use las primeras dimension variables (x, y, z)."""
+        allowed = set(self.nd_variables[:dimension])
+        extra = parsed.free_symbols - allowed
+        if extra:
+            names = ", ".join(sorted(str(symbol) for symbol in extra))
+            raise ValueError(f"Variables no permitidas para una integral de dimensión {dimension}: {names}")
+
+    @staticmethod
+    def _split_top_level(text: str, separator: str = ","):
+        """Divide text por separator solo fuera de paréntesis y corchetes (no dentro de max(x, y))."""
+        parts, depth, start = [], 0, 0
+        for i, char in enumerate(text):
+            if char in "([":
+                depth += 1
+            elif char in ")]":
+                depth -= 1
+            elif char == separator and depth == 0:
+                parts.append(text[start:i])
+                start = i + 1
+        parts.append(text[start:])
+        return parts
+
+    @expression_error_handler
+    def parse_multivariable_expression(self, raw_expr: str, dimension: int = 3, max_length: int = 250):
+        """Analiza una expresión en x, y, z (variables independientes) para integrales múltiples."""
+        if not 1 <= dimension <= len(self.nd_variables):
+            raise ValueError(f"La dimensión debe estar entre 1 y {len(self.nd_variables)}.")
+        # Las comas solo separan argumentos de funciones como max(x, y) o atan2(y, x)
+        self.validate_expression(raw_expr, max_length, self.allowed_chars | {","}, use_3d=True,
+                                 allowed_names=self.allowed_names | {"z", "max", "min", "atan2"})
+
+        clean_expr = self.sanitize_expression(raw_expr, use_3d=True)
+        parsed = parse_expr(clean_expr, transformations=self.transformations, local_dict=self.allowed_symbols_nd)
+        self._validate_variables(parsed, dimension)
+        return parsed
+
+    @expression_error_handler
+    def parse_region(self, raw_region: str, dimension: int = 3, max_length: int = 250):
+        """Analiza una región dada por desigualdades, p. ej. "x^2 + y^2 <= 1, z >= 0" o "0 < x < y".
+
+        Las condiciones separadas por comas se combinan con conjunción y las cadenas de comparaciones
+        se interpretan como en matemáticas.
+        """
+        if not raw_region.strip():
+            raise ValueError("La región está vacía.")
+        if len(raw_region) > max_length:
+            raise ValueError(f"La región es demasiado larga (máximo: {max_length} caracteres).")
+
+        relations = {"<=": Le, ">=": Ge, "<": Lt, ">": Gt}
+        conditions = []
+        for condition in self._split_top_level(raw_region.replace("≤", "<=").replace("≥", ">=")):
+            parts = re.split(r"(<=|>=|<|>)", condition)
+            if len(parts) < 3:
+                raise ValueError(f"La condición '{condition.strip()}' debe contener una desigualdad (<, <=, >, >=).")
+            sides = [self.parse_multivariable_expression(side, dimension, max_length) for side in parts[::2]]
+            for left, operator, right in zip(sides, parts[1::2], sides[1:]):
+                conditions.append(relations[operator](left, right))
+        return And(*conditions)
+
     @expression_error_handler
     def to_polynomial(self, sympy_expr):
         """Convierte una expresión sympy a un objeto Polynomial."""
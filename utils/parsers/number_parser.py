@@ -0,0 +1,74 @@
+import os
+import re
+import numpy as np
+
+NUMBER_FILE_EXTENSIONS = (".npy", ".csv")
+SEPARATOR_PATTERN = re.compile(r"\s*,\s*|\s+")  # Comas, espacios o saltos de línea
+
+def _first_invalid_token(tokens):
+    """Posición y texto del primer elemento que no es un número (solo se recorre cuando falla la conversión)."""
+    for i, token in enumerate(tokens):
+        try:
+            float(token)
+        except ValueError:
+            return i, token
+    return None
+
+def _tokens_to_array(tokens):
+    try:
+        return np.array(tokens, dtype=np.float64)
+    except ValueError:
+        invalid = _first_invalid_token(tokens)
+        if invalid is None:
+            raise
+        index, token = invalid
+        raise ValueError(f"Valor no numérico '{token}' en la posición {index}") from None
+
+def parse_number_text(text):
+    """Convierte texto con números separados por comas, espacios o saltos de línea en un array float64."""
+    text = text.strip()
+    if not text:
+        raise ValueError("No se proporcionaron números")
+    return _tokens_to_array(SEPARATOR_PATTERN.split(text))
+
+def _load_csv(path):
+    with open(path, encoding="utf-8") as csv_file:
+        text = csv_file.read().strip()
+    first_line, _, rest = text.partition("\n")
+    if _first_invalid_token(SEPARATOR_PATTERN.split(first_line.strip())) is not None and rest:
+        text = rest  # Una primera fila no numérica se trata como cabecera
+    return parse_number_text(text)
+
+def load_number_file(path):
+    """Lee números de un archivo .npy (mapeado en memoria si ya es float64) o .csv."""
+    path = os.fspath(path)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        values = np.load(path, mmap_mode="r")
+        return values.ravel() if values.dtype == np.float64 else values.astype(np.float64).ravel()
+    if extension == ".csv":
+        return _load_csv(path)
+    raise ValueError(f"Formato de archivo no soportado: {extension}. Debe ser uno de: {', '.join(NUMBER_FILE_EXTENSIONS)}")
+
+def parse_numbers(source):
+    """Convierte la entrada en un array float64 unidimensional sin pasar por listas de Python.
+
+    Acepta texto separado por comas, espacios o saltos de línea, buffers binarios de float64 (bytes,
+    bytearray, memoryview), listas o arrays y rutas a archivos .npy o .csv. Un archivo solo se lee cuando
+    la ruta es un objeto os.PathLike (por ejemplo pathlib.Path); las cadenas siempre se tratan como texto.
+    """
+    if isinstance(source, os.PathLike):
+        path = os.fspath(source)
+        if not os.path.isfile(path):
+            raise ValueError(f"No se encontró el archivo: {path}")
+        return load_number_file(path)
+    if isinstance(source, str):
+        return parse_number_text(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if len(memoryview(source).cast("B")) % np.dtype(np.float64).itemsize:
+            raise ValueError("El buffer debe contener valores float64 completos (múltiplo de 8 bytes)")
+        return np.frombuffer(source, dtype=np.float64)
+    try:
+        return np.asarray(source, dtype=np.float64).ravel()
+    except (TypeError, ValueError):
+        raise ValueError("Los números deben ser valores numéricos") from None
@@ -1,4 +1,5 @@
 import re
+import numpy as np
 
 def validate_positive_integer(value):
     """Valida que el valor sea un número entero positivo."""
@@ -10,6 +11,16 @@ def validate_range(value, min_value, max_value):
     if not (min_value <= value <= max_value):
         raise ValueError(f"El valor debe estar entre {min_value} y {max_value}.")
     
+def validate_unit_interval(values):
+    """Valida en una sola pasada vectorizada que todos los valores estén en [0, 1] (los NaN no lo están)."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        raise ValueError("No se proporcionaron números")
+    outside = ~((values >= 0) & (values <= 1))
+    if outside.any():
+        index = int(np.argmax(outside))
+        raise ValueError(f"Todos los números deben estar en el intervalo [0,1]: el valor {values[index]} en la posición {index} no lo está")
+
 def is_valid_number(value):
     """Verifica si el valor es un número válido (entero o decimal)."""
     try: